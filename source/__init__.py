@@ -16,6 +16,7 @@ from PyQt5.QtWidgets import QApplication, QSystemTrayIcon, QMenu, QAction, QSpla
 
 import res.qrc_resources
 import version
+import scanner
 from dialogs.main_window import MainWindow, TestMainWindow
 from dialogs.preferences import PreferencesWindow
 from dialogs.about import AboutWindow
@@ -29,6 +30,9 @@ logger = logging.getLogger(__name__)
 loggerFileHandler = logging.FileHandler(LOGS_PATH)
 loggerFileHandler.setFormatter(logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s'))
 logger.addHandler(loggerFileHandler)
+scannerLogger = logging.getLogger(scanner.__name__) # per search path scan reports
+scannerLogger.setLevel(logging.INFO)
+scannerLogger.addHandler(loggerFileHandler)
 
 
 # TODO: here for now, please remove once not needed!
@@ -0,0 +1,40 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QPixmap
+
+from utils import *
+
+# Icons of c4d versions shared by all tiles and the grid. There are only few icon files, so each one is loaded from disk once,
+# and pixmaps pre-scaled to the requested size and device pixel ratio are kept for both Ronald's and default icons,
+# which makes toggling appearance_ronalds-icons a lookup instead of reloading icons for every tile
+class C4DIconsCache:
+	def __init__(self) -> None:
+		self.iconPaths: dict[tuple[str, bool], str] = dict() 					# (major version, use Ronald's icons) -> icon path
+		self.pixmaps: dict[str, QPixmap] = dict() 								# icon path -> pixmap as loaded from disk
+		self.scaledPixmaps: dict[tuple[str, int, float], QPixmap] = dict() 	# (icon path, size, device pixel ratio) -> scaled pixmap
+
+	def GetIconPath(self, c4d: C4DInfo, useRonalds: bool) -> str:
+		key: tuple[str, bool] = (c4d.GetVersionMajor(), bool(useRonalds))
+		if key not in self.iconPaths:
+			self.iconPaths[key] = C4DIconsCache._findIconPath(*key)
+		return self.iconPaths[key]
+
+	def GetPixmap(self, c4d: C4DInfo, useRonalds: bool, size: int, devicePixelRatio: float = 1.) -> QPixmap:
+		iconPath: str = self.GetIconPath(c4d, useRonalds)
+		key: tuple[str, int, float] = (iconPath, size, devicePixelRatio)
+		if key not in self.scaledPixmaps:
+			if iconPath not in self.pixmaps:
+				self.pixmaps[iconPath] = QPixmap(iconPath)
+			physicalSize: int = round(size * devicePixelRatio)
+			pixmap: QPixmap = self.pixmaps[iconPath].scaled(physicalSize, physicalSize, Qt.KeepAspectRatio, Qt.SmoothTransformation)
+			pixmap.setDevicePixelRatio(devicePixelRatio)
+			self.scaledPixmaps[key] = pixmap
+		return self.scaledPixmaps[key]
+
+	@staticmethod
+	def _findIconPath(versionMajor: str, useRonalds: bool) -> str:
+		# Many thanks to Ronald for the icons: https://backstage.maxon.net/topic/3064/cinema-4d-icon-pack
+		c4dIconName: str = ('C4D ' + versionMajor + '.png') if useRonalds else '_C4D.png'
+		c4dIconNameFallback: str = 'C4D Color Purple.png' if useRonalds else '_C4D.png'
+		c4dIconPath: str = OsPathJoin(C4D_ICONS_FOLDER, c4dIconName)
+		c4dIconFallbackPath: str = OsPathJoin(C4D_ICONS_FOLDER, c4dIconNameFallback)
+		return c4dIconPath if os.path.isfile(c4dIconPath) else c4dIconFallbackPath
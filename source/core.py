@@ -0,0 +1,262 @@
+import os, re, json
+import datetime as dt
+
+# Part of utils that doesn't depend on Qt or Windows-only modules, so it can be used by the scanner and headless tools.
+# utils re-exports everything from here
+
+def NormalizePath(path: str) -> str:
+	return path.replace(os.altsep, os.sep) if os.altsep else path
+
+def OsPathJoin(path, *paths) -> str:
+	res: str = os.path.join(path, *paths)
+	return NormalizePath(res)
+
+# Checks if path is the root itself or lies somewhere inside of it
+def IsPathUnder(path: str, root: str) -> bool:
+	path, root = os.path.normcase(NormalizePath(path)), os.path.normcase(NormalizePath(root)).rstrip('\\/')
+	return path == root or path.startswith(root + os.sep)
+
+# Key for comparing paths: separators, case, redundant and trailing separators are normalized, filesystem isn't touched
+def GetPathKey(path: str) -> str:
+	return os.path.normcase(os.path.normpath(path))
+
+# Key of the real location: additionally resolves symlinks and junctions, hence touches the filesystem
+def CanonicalizePath(path: str) -> str:
+	try:
+		return GetPathKey(os.path.realpath(path))
+	except (OSError, ValueError):
+		return GetPathKey(path)
+
+# Prefix tree of paths by their components, finds the deepest stored path containing given one in O(path depth)
+class PathTrie:
+	_VALUE = '' # node key of the stored value, never clashes with path components as they aren't empty
+
+	def __init__(self, paths: list[str] | None = None) -> None:
+		self._root: dict = dict()
+		for path in paths if paths else list():
+			self.Add(path)
+
+	@staticmethod
+	def _splitPath(path: str) -> list[str]:
+		drive, rest = os.path.splitdrive(GetPathKey(path))
+		return [drive] + [c for c in rest.split(os.sep) if c]
+
+	# Stores value (path itself by default) for the path, the first one wins if the same path is added again
+	def Add(self, path: str, value=None):
+		node: dict = self._root
+		for component in PathTrie._splitPath(path):
+			node = node.setdefault(component, dict())
+		node.setdefault(PathTrie._VALUE, path if value is None else value)
+
+	# Returns value of the deepest stored path that is the path itself or its ancestor, None if there's none
+	def FindDeepest(self, path: str):
+		node: dict = self._root
+		ret = None
+		for component in PathTrie._splitPath(path):
+			node = node.get(component)
+			if node is None:
+				break
+			ret = node.get(PathTrie._VALUE, ret)
+		return ret
+
+	def Get(self, path: str):
+		node: dict | None = self._root
+		for component in PathTrie._splitPath(path):
+			node = node.get(component)
+			if node is None:
+				return None
+		return node.get(PathTrie._VALUE)
+
+	def __contains__(self, path: str) -> bool:
+		return self.Get(path) is not None
+
+PREFERENCES_FILENAME = 'preferences.json'
+
+def GetPrefsFolderPath() -> str:
+	path: str = OsPathJoin(GetAppDataPath(), 'c4d-version-manager')
+	os.makedirs(path, exist_ok=True)
+	return path
+
+def GetAppDataPath() -> str:
+	if appData := os.getenv('APPDATA'):
+		return appData
+	return os.getenv('XDG_CONFIG_HOME') or os.path.join(os.path.expanduser('~'), '.config') # not on Windows, e.g. headless scan on CI
+
+def GetPreferencesSavePath() -> str:
+	return OsPathJoin(GetPrefsFolderPath(), PREFERENCES_FILENAME)
+
+# Returns stored preferences as a plain dict: preference key -> value, empty if there are none
+def LoadPreferencesFile() -> dict:
+	prefsFilePath: str = GetPreferencesSavePath()
+	if not os.path.isfile(prefsFilePath):
+		return dict()
+	try:
+		with open(prefsFilePath, 'r') as fp:
+			data: dict = json.load(fp)
+		if isinstance(data.get('preferences'), dict):
+			return data['preferences']
+	except (OSError, ValueError) as e:
+		print(f'Failed to load preferences from {prefsFilePath}: {e}')
+	return dict()
+
+# Tries to cast given value to type, falls back to default if error
+def SafeCast(val, to_type, default=None):
+	try:
+		return to_type(val)
+	except (ValueError, TypeError):
+		return default
+
+# Human readable size, e.g. 1.4 GB
+def FormatSize(size: int) -> str:
+	for unit in ('B', 'KB', 'MB', 'GB'):
+		if size < 1024:
+			return f'{size:.0f} {unit}' if unit == 'B' else f'{size:.1f} {unit}'
+		size /= 1024
+	return f'{size:.1f} TB'
+
+_COMMIT_HASH_PATTERN = re.compile(r'#[a-zA-Z0-9]{12}')
+_CHANGELIST_PATTERN = re.compile(r'CL(\d{6})')
+
+# Structured info encoded in the name of the c4d folder, e.g. 'C4D 2024.0 branch ... #0123456789ab' installations,
+# 'branch_..._#0123456789ab' packages with commit hash or older '2023.000.branch.CL123456' packages with changelist
+class C4DFolderNameInfo:
+	def __init__(self, branch: str = '', commitHash: str = '', changelist: int | None = None, installation: bool = False, customer: bool = False, label: str = '') -> None:
+		self.branch: str = branch
+		self.commitHash: str = commitHash 		# 12 symbols without '#', empty for the old CL notation
+		self.changelist: int | None = changelist
+		self.installation: bool = installation 	# installed c4d, otherwise it's a package
+		self.customer: bool = customer 			# customer installation, its name isn't parsed any further
+		self.label: str = label 				# short name for tiles (branch + hash/CL), empty if the name isn't recognized
+
+	def ToJSON(self) -> dict:
+		return {
+			'branch': self.branch,
+			'commitHash': self.commitHash,
+			'changelist': self.changelist,
+			'installation': self.installation,
+			'customer': self.customer,
+			'label': self.label,
+		}
+
+	@staticmethod
+	def FromJSON(jsonStr: dict):
+		return C4DFolderNameInfo(jsonStr.get('branch', ''), jsonStr.get('commitHash', ''), jsonStr.get('changelist'),
+								 bool(jsonStr.get('installation', False)), bool(jsonStr.get('customer', False)), jsonStr.get('label', ''))
+
+def ParseC4DFolderName(folderName: str) -> C4DFolderNameInfo:
+	if folderName.lower().startswith('maxon'): # customer installation
+		return C4DFolderNameInfo(customer=True, label=folderName)
+	
+	installation: bool = folderName.startswith('C4D')
+	if match := _COMMIT_HASH_PATTERN.search(folderName): # it's a new notation with 12 symbol commit hash
+		commitHash: str = match.group()[1:]
+		if installation:
+			tokens: list[str] = folderName.split(' ')
+			if len(tokens) < 5: return C4DFolderNameInfo(commitHash=commitHash, installation=True)
+			return C4DFolderNameInfo(tokens[1], commitHash, installation=True, label=f'{tokens[1]} {tokens[4][:9]}') # branch + commit hash
+		# it's a package
+		tokens: list[str] = folderName.split('_')
+		if len(tokens) < 2: return C4DFolderNameInfo(commitHash=commitHash)
+		return C4DFolderNameInfo(tokens[0], commitHash, label=f'{tokens[0]} {match.group()[:9]}')
+	
+	# it's an old notation with CL
+	if installation:
+		tokens: list[str] = folderName.split(' ')
+		if len(tokens) < 4: return C4DFolderNameInfo(installation=True)
+		return C4DFolderNameInfo(tokens[1], changelist=SafeCast(tokens[-1], int), installation=True, label=f'{tokens[1]} CL{tokens[-1]}')
+	
+	# it's a package
+	if match := _CHANGELIST_PATTERN.search(folderName): # found CL###### token
+		tokens: list[str] = [x for x in folderName[:match.start()].split('.') if x]
+		if len(tokens) < 3: return C4DFolderNameInfo(changelist=int(match.group(1)))
+		versionTokensNum = 2 # old R notation, e.g. 26.001
+		if len(tokens[0]) == 4 and len(tokens) > 3: # it's 2023.0.0.branch naming scheme, not 2023.000.branch
+			versionTokensNum = 3
+		branch: str = '.'.join(tokens[versionTokensNum:])
+		return C4DFolderNameInfo(branch, changelist=int(match.group(1)), label=f'{branch} {match.group()}')
+	return C4DFolderNameInfo()
+
+# Information about cinema that can be extracted from filesystem
+class C4DInfo:
+	def __init__(self, dir: str, ver: list[str], build: str = '', dirPrefs: str | None = None, fingerprint: str = '', archived: bool = False,
+				 folderNameInfo: C4DFolderNameInfo | None = None, timestampCreated: float = 0., timestampModified: float = 0., timestampBuilt: float = 0.) -> None:
+		self.directory: str = dir
+		self.version: list[str] = ver
+		self.build: str = build
+		self.directoryPrefs: str = dirPrefs if dirPrefs else ''
+		self.fingerprint: str = fingerprint # same for identical copies of the package, see scanner.GetC4DFingerprint()
+		self.archived: bool = archived 		# directory is a .zip archive with the package, it has to be extracted to be run
+		self.folderNameInfo: C4DFolderNameInfo = folderNameInfo if folderNameInfo else ParseC4DFolderName(self.GetNameFolderRoot()) # parsed once, tiles only read it
+		self.timestampCreated: float = timestampCreated 	# st_ctime/st_mtime of the directory taken while scanning, 0 if unknown
+		self.timestampModified: float = timestampModified
+		self.timestampBuilt: float = timestampBuilt 		# mtime of the executable, kept by copying and extracting unlike ctime of the directory
+
+	def ToJSON(self) -> dict:
+		return {
+			'directory': self.directory,
+			'version': self.version,
+			'build': self.build,
+			'directoryPrefs': self.directoryPrefs,
+			'fingerprint': self.fingerprint,
+			'archived': self.archived,
+			'folderName': self.folderNameInfo.ToJSON(),
+			'timestampCreated': self.timestampCreated,
+			'timestampModified': self.timestampModified,
+			'timestampBuilt': self.timestampBuilt,
+		}
+
+	@staticmethod
+	def FromJSON(jsonStr: dict):
+		directory: str = jsonStr['directory'] if 'directory' in jsonStr else ''
+		version: list[str] = jsonStr['version'] if 'version' in jsonStr else []
+		build: str = jsonStr['build'] if 'build' in jsonStr else ''
+		directoryPrefs: str = jsonStr['directoryPrefs'] if 'directoryPrefs' in jsonStr else ''
+		fingerprint: str = jsonStr['fingerprint'] if 'fingerprint' in jsonStr else ''
+		archived: bool = bool(jsonStr['archived']) if 'archived' in jsonStr else False
+		folderNameInfo: C4DFolderNameInfo | None = C4DFolderNameInfo.FromJSON(jsonStr['folderName']) if isinstance(jsonStr.get('folderName'), dict) else None
+		timestampCreated: float = SafeCast(jsonStr.get('timestampCreated'), float, 0.)
+		timestampModified: float = SafeCast(jsonStr.get('timestampModified'), float, 0.)
+		timestampBuilt: float = SafeCast(jsonStr.get('timestampBuilt'), float, 0.)
+		return C4DInfo(directory, version, build, directoryPrefs, fingerprint, archived, folderNameInfo, timestampCreated, timestampModified, timestampBuilt)
+
+	def SetTimestamps(self, st: os.stat_result):
+		self.timestampCreated = st.st_ctime
+		self.timestampModified = st.st_mtime
+
+	# Creation time as captured by the scan, filesystem isn't touched
+	def GetDatetimeCreated(self) -> dt.datetime:
+		return dt.datetime.fromtimestamp(self.timestampCreated) if self.timestampCreated else dt.datetime.now()
+
+	def GetPathExecutable(self) -> str:
+		return OsPathJoin(self.directory, 'Cinema 4D.exe')
+
+	def GetPathConfigCinema(self) -> str:
+		return OsPathJoin(self.GetPathFolderResource(), 'config.cinema4d.txt')
+
+	def GetPathFolderRoot(self) -> str:
+		return self.directory
+
+	def GetNameFolderRoot(self) -> str:
+		return os.path.basename(self.GetPathFolderRoot())
+
+	def GetPathFolderResource(self) -> str:
+		return OsPathJoin(self.directory, 'resource')
+
+	def GetPathFolderPrefs(self) -> str:
+		return self.directoryPrefs
+
+	def GetPathFolderPlugins(self) -> str:
+		return OsPathJoin(self.directoryPrefs, 'plugins')
+
+	def GetVersionString(self, formatted: bool = True, full: bool = False) -> str:
+		major: str = self.version[0]
+		if len(major) == 4: # new convention
+			return '.'.join(self.version if full else self.version[:-1])
+		return self.GetVersionMajor(formatted) + '.' + ''.join(self.version[1:])
+
+	def GetVersionMajor(self, formatted: bool = True) -> str:
+		major: str = self.version[0]
+		return ('R' if len(major) != 4 and formatted else '') + major
+
+	def GetBuildString(self) -> str:
+		return self.build
@@ -54,8 +54,15 @@ class ShortcutsWindow(QDialog):
 					('Ctrl + 2', 'Ctrl + G, Ctrl + V'): 'Group by c4d version',
 					('Ctrl + 3', 'Ctrl + G, Ctrl + T'): 'Group by tags',
 					('Ctrl + 4', 'Ctrl + G, Ctrl + S'): 'Group by c4d status',
+					('Ctrl + 5', 'Ctrl + G, Ctrl + D'): 'Group by disk usage',
+					('Ctrl + 6', 'Ctrl + G, Ctrl + B'): 'Group by branch',
+					'Ctrl + R, Ctrl + R': 	'No sorting',
+					'Ctrl + R, Ctrl + C': 	'Sort by changelist',
+					'Ctrl + R, Ctrl + D': 	'Sort by build date',
+					'Ctrl + R, Ctrl + U': 	'Sort by disk usage',
 					# 'Alt + N': 				'Apply N-th custom grouping view',
 					'Empty Double LMB': 	'Apply default grouping view',
+					'Ctrl + Shift + D': 	'Collapse duplicate builds',
 				}
 			},
 			'C4D Tile Widget': {
@@ -1,11 +1,11 @@
-import sys, os, typing, datetime as dt
+import sys, os, typing, bisect, datetime as dt
 from subprocess import Popen, PIPE
 from functools import partial
 from typing import Callable
 
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtCore import (
-    QObject, Qt, QEvent, pyqtSignal, QProcess, QPoint, QRect
+    QObject, Qt, QEvent, pyqtSignal, QProcess, QPoint, QRect, QTimer
 )
 from PyQt5.QtGui import (
     QIcon, QKeySequence, QPixmap, QFont, QCursor, QMouseEvent, QDropEvent,
@@ -23,8 +23,15 @@ from dialogs.about import AboutWindow
 from dialogs.help import ShortcutsWindow, TrackBugsWindow, CheckForUpdates
 from dialogs.tags import TagsWindow, C4DTag
 from dialogs.filtersort import FilterSortWindow
+from dialogs.scan_report import ScanReportWindow
 from dialogs.main_window_tiles import *
+from dialogs.main_window_grid import C4DGridView
 from utils import *
+from scanner import *
+from watcher import SearchPathsWatcher
+from scan_thread import C4DScanThread
+from extract_thread import C4DExtractThread
+from disk_usage import C4DDiskUsageCalculator
 from gui_utils import *
 
 # TODO: here for now, please remove once not needed!
@@ -60,8 +67,24 @@ class TestMainWindow(QMainWindow):
 class MainWindow(QMainWindow, RestorableQWidget):
 	GROUPING_MARK_ASC_PREFIX: str = '▲ '
 	GROUPING_MARK_DESC_PREFIX: str = '▼ '
+	DEGRADED_SEARCH_PATH_SUFFIXES: dict[str, str] = { # abandon reason -> suffix of search path group name
+		C4DScanner.ABANDON_REASON_TIMEOUT: ' (not responding, last known packages)',
+		C4DScanner.ABANDON_REASON_CANCELLED: ' (scan cancelled, last known packages)',
+	}
+	SCAN_TILES_FLUSH_INTERVAL_MSEC: int = 250 # how often tiles streamed from a running scan are added to the widget
+	DISK_USAGE_LAUNCH_PAUSE_MSEC: int = 30000 	# disk usage calculation is paused for that long after c4d is launched
+	DISK_USAGE_REGROUP_MSEC: int = 1000 		# how often tiles are regrouped by disk usage while sizes are coming
+	DISK_USAGE_SAVE_MSEC: int = 10000 			# calculated sizes are saved in batches
+	STATUS_MERGING_GROUPS: dict[int, list[int]] = {10: [0], 11: [1, -1, -2]} # merged status group key -> c4d statuses in it
+	DISK_USAGE_GROUPS: list[tuple[int | None, str]] = [ # upper size limit -> group name, for grouping by disk usage
+		(1 << 30, 'Less than 1 GB'),
+		(5 << 30, '1 - 5 GB'),
+		(10 << 30, '5 - 10 GB'),
+		(None, 'More than 10 GB'),
+	]
 
 	hideToTraySignal = pyqtSignal()
+	diskUsageComputedSignal = pyqtSignal(str, object) # path, size (may not fit into 32 bit int)
 
 	"""Main Window."""
 	def __init__(self, parent=None):
@@ -79,12 +102,21 @@ class MainWindow(QMainWindow, RestorableQWidget):
 			'about': AboutWindow(self),
 			'help': ShortcutsWindow(self),
 			'trackbugs': TrackBugsWindow(self),
+			'scanreport': ScanReportWindow(self),
 		}
 
+		self.degradedSearchPaths: dict[str, str] = dict() # search path -> reason it wasn't scanned completely
+
 		self.c4dTabTiles: C4DTilesWidget = C4DTilesWidget(self)
 		self.c4dTabTiles.c4dStatusChanged.connect(self._onC4DStatusChanged)
+		self.c4dTabTiles.c4dExtractRequested.connect(self._extractArchive)
+		self.c4dTabTiles.c4dNoteChanged.connect(lambda c4d: self.c4dTabGrid.UpdateC4DItems(c4d.GetPathFolderRoot()))
 		self.c4dTabTiles.mouseDoubleClickedSignal.connect(self._onC4DTabTilesMouseDoubleClick)
 
+		# Same c4ds and groups as tiles, without a widget per c4d
+		self.c4dTabGrid: C4DGridView = C4DGridView(self.c4dTabTiles, self)
+		self.c4dTabGrid.mouseDoubleClickedSignal.connect(self._onC4DTabTilesMouseDoubleClick)
+
 		# self.c4dTabTableWidget: QTreeWidget = QTreeWidget(self)
 		# self.c4dTabTableWidget.setColumnCount(4)
 		# self.c4dTabTableWidget.setHeaderLabels(['Fav', 'Path', 'Version', 'Date'])
@@ -103,6 +135,7 @@ class MainWindow(QMainWindow, RestorableQWidget):
 
 		self.centralWidget = QTabWidget()
 		self.centralWidget.addTab(self.c4dTilesStackedContainer, "Tiles")
+		self.centralWidget.addTab(self.c4dTabGrid, "Grid")
 		# self.centralWidget.addTab(self.c4dTabTableWidget, "Table")
 		
 		self.setCentralWidget(self.centralWidget)
@@ -114,13 +147,40 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		self._createStatusBar()
 
 		self.dialogs['preferences'].preferenceChangedSignal.connect(self._onPreferenceChanged)
-		self.dialogs['tags'].tagEditedSignal.connect(lambda tag: self.c4dTabTiles._rebuildWidget())
+		self.dialogs['tags'].tagEditedSignal.connect(lambda tag: self.c4dTabTiles.UpdateTagWidgets(tag))
+		self.dialogs['tags'].tagEditedSignal.connect(lambda tag: self.c4dTabGrid.UpdateItemsUI())
 		self.dialogs['tags'].tagRemovedSignal.connect(lambda tag: self.c4dTabTiles._tagRemoveFromAll(tag))
+		self.dialogs['tags'].tagRemovedSignal.connect(lambda tag: self.c4dTabGrid.UpdateItemsUI())
 		self.dialogs['tags'].tagOrderChangedSignal.connect(lambda: self.updateTilesWidget())
 		self.dialogs['tags'].groupingByTagRequested.connect(self._groupByTagRequested)
 
-		self.rescan()
+		self.scanIndex: C4DScanIndex = C4DScanIndex()
+		self.scanIndex.Load()
+		self.prefsFolderIndex: C4DPrefsFolderIndex = C4DPrefsFolderIndex()
+		self.searchPathsWatcher: SearchPathsWatcher = SearchPathsWatcher(self.scanIndex, self)
+		self.searchPathsWatcher.subtreesChanged.connect(self._onSearchPathsSubtreesChanged)
+
+		self.scanThread: C4DScanThread | None = None
+		self.scanStartTime: dt.datetime = dt.datetime.now()
+		self.pendingRescan: bool = False 						# rescan was requested while scanning
+		self.pendingSubtrees: list[tuple[str, int]] = list() 	# watcher reported changes while scanning
+		self.scannedC4DEntries: list[C4DInfo] = list() 		# streamed from the running scan, not added to tiles yet
+		self.scannedC4DEntriesTimer: QTimer = QTimer(self)
+		self.scannedC4DEntriesTimer.setInterval(MainWindow.SCAN_TILES_FLUSH_INTERVAL_MSEC)
+		self.scannedC4DEntriesTimer.setSingleShot(True)
+		self.scannedC4DEntriesTimer.timeout.connect(self._flushScannedC4DEntries)
+		self.extractThreads: dict[str, C4DExtractThread] = dict() # archive path -> thread extracting it
+
+		self.diskUsage: C4DDiskUsageCalculator = C4DDiskUsageCalculator()
+		self.diskUsage.Load()
+		self.diskUsage.onSizeComputed = self.diskUsageComputedSignal.emit # called from its pool, delivered to the UI thread
+		self.diskUsageComputedSignal.connect(self._onDiskUsageComputed)
+		self.diskUsageLaunchTimer: QTimer = self._createSingleShotTimer(MainWindow.DISK_USAGE_LAUNCH_PAUSE_MSEC, self.diskUsage.Resume)
+		self.diskUsageRegroupTimer: QTimer = self._createSingleShotTimer(MainWindow.DISK_USAGE_REGROUP_MSEC, self._onDiskUsageRegroupTimeout)
+		self.diskUsageSaveTimer: QTimer = self._createSingleShotTimer(MainWindow.DISK_USAGE_SAVE_MSEC, self._saveDiskUsage)
+
 		self.c4dTabTiles.LoadCache()
+		self.rescan()
 
 		self.addDockWidget(Qt.LeftDockWidgetArea, self.dialogs['filtersort'])
 		self.dialogs['filtersort'].hide()
@@ -159,6 +219,7 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		self.actionRefresh.setShortcut(QKeySequence.Refresh)
 		self.actionRescan = QAction("Re&scan", self)
 		self.actionRescan.setShortcut("Ctrl+F5")
+		self.actionScanReport = QAction("Last scan re&port", self)
 
 		self.actionTags = QAction("&Tags", self)
 		self.actionTags.setShortcut("Ctrl+T")
@@ -169,6 +230,11 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		self.actionFoldAll = QAction("Toggle &fold all", self)
 		self.actionFoldAll.setShortcut("Ctrl+A")
 
+		self.actionCollapseDuplicates = QAction("Collapse &duplicates", self)
+		self.actionCollapseDuplicates.setShortcut("Ctrl+Shift+D")
+		self.actionCollapseDuplicates.setCheckable(True)
+
+		self._createSortActions() # grouping applies sorting, so it goes first
 		self._createGroupActions()
 		
 		self.actionSave.triggered.connect(self._storeData)
@@ -179,10 +245,12 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		self.actionShortcuts.triggered.connect(self.help)
 		self.actionReportBug.triggered.connect(lambda: self._showActivateDialog('trackbugs'))
 		self.actionRefresh.triggered.connect(lambda: self.updateTilesWidget())
-		self.actionRescan.triggered.connect(self.rescan)
+		self.actionRescan.triggered.connect(self._toggleRescan)
+		self.actionScanReport.triggered.connect(lambda: self._showActivateDialog('scanreport'))
 		self.actionTags.triggered.connect(self.toggleOpenTagsWindow)
 		self.actionFiltersort.triggered.connect(self.toggleOpenFilterSortWindow)
 		self.actionFoldAll.triggered.connect(self._toggleFoldAllC4DGroups)
+		self.actionCollapseDuplicates.toggled.connect(lambda: self.updateTilesWidget())
 		
 		# # Adding help tips
 		# newTip = "Create a new file"
@@ -196,6 +264,8 @@ class MainWindow(QMainWindow, RestorableQWidget):
 			'version': ('Group by &version', None, ['Ctrl+G,Ctrl+V', 'Ctrl+2']),
 			'tag': ('Group by &tag', None, ['Ctrl+G,Ctrl+T', 'Ctrl+3']),
 			'status': ('Group by &status', None, ['Ctrl+G,Ctrl+S', 'Ctrl+4']),
+			'size': ('Group by &disk usage', None, ['Ctrl+G,Ctrl+D', 'Ctrl+5']),
+			'branch': ('Group by &branch', None, ['Ctrl+G,Ctrl+B', 'Ctrl+6']),
 		}
 		# for tag in self.GetTags():
 		# 	actionsGroupingDict[f'tag:{tag.uuid}'] = (f'Group by tag \'{tag.name}\'', tag.color)
@@ -218,6 +288,25 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		# default
 		self._changeGrouping('paths', False)
 		# self._changeGrouping('none')
+
+	# Sorting of c4ds within groups, selected same way as grouping: triggering selected action again toggles the order
+	def _createSortActions(self):
+		actionsSortingDict = { # key -> (show_txt, Shortcut)
+			'none': ('No s&orting', ['Ctrl+R,Ctrl+R']),
+			'changelist': ('Sort by &changelist', ['Ctrl+R,Ctrl+C']),
+			'date': ('Sort by build d&ate', ['Ctrl+R,Ctrl+D']),
+			'size': ('Sort by disk &usage', ['Ctrl+R,Ctrl+U']),
+		}
+
+		self.actionsSorting: dict[str, QAction] = dict()
+		for key, (txt, shortcuts) in actionsSortingDict.items():
+			action: QAction = QAction(txt)
+			action.setShortcuts(shortcuts)
+			action.triggered.connect(partial(self._changeSorting, key, True))
+			self.actionsSorting[key] = action
+		
+		# default, tiles are updated once grouping is selected
+		MainWindow._selectAction(self.actionsSorting, 'none', False)
 		
 	def _createMenuBar(self):
 		menuBar = self.menuBar()
@@ -233,15 +322,20 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		editMenu = menuBar.addMenu("&Edit")
 		editMenu.addAction(self.actionRefresh)
 		editMenu.addAction(self.actionRescan)
+		editMenu.addAction(self.actionScanReport)
 		editMenu.addSeparator()
 		editMenu.addAction(self.actionTags)
 		editMenu.addAction(self.actionFiltersort)
 		
 		viewMenu = menuBar.addMenu("&View")
 		viewMenu.addAction(self.actionFoldAll)
+		viewMenu.addAction(self.actionCollapseDuplicates)
 		viewMenu.addSeparator()
 		for k, action in self.actionsGrouping.items():
 			viewMenu.addAction(action)
+		viewMenu.addSeparator()
+		for k, action in self.actionsSorting.items():
+			viewMenu.addAction(action)
 
 		helpMenu = menuBar.addMenu("&Help")
 		helpMenu.addAction(self.actionShortcuts)
@@ -257,12 +351,22 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		return ''
 	
 	def _changeGrouping(self, groupingKey: str, toggleSort: bool):
+		MainWindow._selectAction(self.actionsGrouping, groupingKey, toggleSort)
+		self.updateTilesWidget()
+	
+	def _changeSorting(self, sortingKey: str, toggleSort: bool):
+		MainWindow._selectAction(self.actionsSorting, sortingKey, toggleSort)
+		self.updateTilesWidget()
+	
+	# Marks the action of the key as selected in ascending order, or in the same (toggled) order if it's selected already
+	@staticmethod
+	def _selectAction(actions: dict[str, QAction], key: str, toggleSort: bool):
 		newPrefix: str = MainWindow.GROUPING_MARK_ASC_PREFIX
 		# Figure out new prefix and unselect all actions to 
-		for k, action in self.actionsGrouping.items():
+		for k, action in actions.items():
 			if curPrefix := MainWindow._isActionAlreadySelected(action):
 				action.setText(action.text()[len(curPrefix):])
-				if k == groupingKey:
+				if k == key:
 					if not toggleSort:
 						newPrefix = curPrefix
 						break
@@ -270,15 +374,20 @@ class MainWindow(QMainWindow, RestorableQWidget):
 						newPrefix = MainWindow.GROUPING_MARK_DESC_PREFIX
 				break
 		
-		for k, action in self.actionsGrouping.items():
-			if k != groupingKey: continue
+		for k, action in actions.items():
+			if k != key: continue
 			action.setText(f'{newPrefix}{action.text()}')
 			break
-
-		self.updateTilesWidget()
 	
 	def _getGrouping(self) -> tuple[str, bool]: # <groupingKey, isAscending>
-		for k, action in self.actionsGrouping.items():
+		return MainWindow._getSelectedAction(self.actionsGrouping)
+	
+	def _getSorting(self) -> tuple[str, bool]: # <sortingKey, isAscending>
+		return MainWindow._getSelectedAction(self.actionsSorting)
+	
+	@staticmethod
+	def _getSelectedAction(actions: dict[str, QAction]) -> tuple[str, bool]:
+		for k, action in actions.items():
 			if prefix := MainWindow._isActionAlreadySelected(action):
 				return k, prefix == MainWindow.GROUPING_MARK_ASC_PREFIX
 		return 'none', True
@@ -304,7 +413,8 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		pass
 
 	def _createStatusBar(self):
-		pass
+		self.scanStatusLabel: QLabel = QLabel(self)
+		self.statusBar().addPermanentWidget(self.scanStatusLabel)
 	
 	def _storeData(self):
 		# Tags
@@ -314,6 +424,7 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		
 		# C4Ds cache
 		self.c4dTabTiles.SaveCache()
+		self._saveDiskUsage()
 
 	def openPreferences(self):
 		self._showActivateDialog('preferences')
@@ -351,12 +462,19 @@ class MainWindow(QMainWindow, RestorableQWidget):
 	def _onPreferenceChanged(self, attr: str):
 		if attr == 'general_hide-on-close':
 			return
+		if attr == 'general_scan-workers' or attr == 'general_scan-workers-per-root' or attr == 'general_scan-root-timeout' \
+		  or attr == 'general_search-depth' or attr == 'search-paths_rules' or attr == 'general_fingerprint-corelibs':
+			return # applied on the next rescan
+		if attr == 'general_watch-search-paths':
+			return self._updateSearchPathsWatcher()
 		if   attr == 'appearance_ronalds-icons' \
 		  or attr == 'appearance_c4dtile-adjust-c4d-folder-name' \
 		  or attr == 'appearance_c4dtile-show-timestamp' \
 		  or attr == 'appearance_c4dtile-timestamp-format' \
 		  or attr == 'appearance_c4dtile-show-note' \
-		  or attr == 'appearance_c4dtile-show-note-first-line':
+		  or attr == 'appearance_c4dtile-show-note-first-line' \
+		  or attr == 'appearance_c4dtile-show-size':
+			self.c4dTabGrid.UpdateItemsUI()
 			return self.c4dTabTiles.UpdateTilesUI()
 		if attr == 'appearance_grouping-status-separately':
 			return self.updateTilesWidget()
@@ -370,7 +488,44 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		return None
 	
 	def _onC4DStatusChanged(self, info, status):
-		self.updateTilesWidget() # update tiles if c4d status was changed
+		if status > 0: # c4d is being launched, it shouldn't compete with disk usage calculation for the disk
+			if not self.diskUsageLaunchTimer.isActive():
+				self.diskUsage.Pause()
+			self.diskUsageLaunchTimer.start()
+		if self._getGrouping()[0] != 'status': # only the status flag of the c4d changes
+			self.c4dTabTiles.UpdateC4DStatusUI(info)
+			self.c4dTabGrid.UpdateC4DItems(info.GetPathFolderRoot())
+		elif not self._moveC4DToStatusGroup(info):
+			self.updateTilesWidget() # group has to be created or removed
+
+	# Moves c4d whose status has changed to its new status group, if both groups are there and the old one doesn't get empty
+	def _moveC4DToStatusGroup(self, c4d: C4DInfo) -> bool:
+		c4dEntries: list[C4DInfo] = self.c4dTabTiles.GetC4DEntries()
+		c4dGroups: list[C4DTileGroup] = self.c4dTabTiles.c4dGroups
+		c4dIdx: int | None = next((idx for idx, c4dEntry in enumerate(c4dEntries) if c4dEntry is c4d), None)
+		oldGrp: C4DTileGroup | None = next((grp for grp in c4dGroups if c4dIdx in grp.indices), None)
+		newGrp: C4DTileGroup | None = next((grp for grp in c4dGroups if grp.key == self._getC4DStatusGroupKey(c4d)), None)
+		if c4dIdx is None or oldGrp is None or newGrp is None or (oldGrp is not newGrp and len(oldGrp.indices) == 1):
+			return False
+		if oldGrp is not newGrp and self._getSorting()[0] != 'none': # position within the group depends on sorting
+			return False
+		if oldGrp is not newGrp:
+			oldGrp.indices.remove(c4dIdx)
+			bisect.insort(newGrp.indices, c4dIdx) # status groups keep c4ds in the order of c4dEntries
+			self.c4dTabTiles.MoveC4DTile(c4d, oldGrp, newGrp)
+			self.c4dTabGrid.SetEntries(c4dEntries, c4dGroups)
+		self.c4dTabTiles.UpdateC4DStatusUI(c4d)
+		return True
+
+	# Key of the status group the c4d belongs to, depends on whether touched c4ds are grouped together
+	def _getC4DStatusGroupKey(self, c4d: C4DInfo) -> int | None:
+		c4dCacheInfo: C4DCacheInfo = self.c4dTabTiles.GetCacheInfo(c4d.directory)
+		if not c4dCacheInfo:
+			return None
+		statusKey: int = c4dCacheInfo.processStatus if c4dCacheInfo.processStatus <= 0 else 1 # if status > 0, it's PID -> different for all c4d entries
+		if self.GetPreference('appearance_grouping-status-separately') == 0: # group touched
+			return next(newKey for newKey, mergingGroup in MainWindow.STATUS_MERGING_GROUPS.items() if statusKey in mergingGroup)
+		return statusKey
 	
 	def _onC4DTabTilesMouseDoubleClick(self, evt: QMouseEvent):
 		self._changeGrouping('paths', False)
@@ -396,39 +551,304 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		visibilities: dict[C4DTileGroup, bool] = self.c4dTabTiles.GetGroupsVisibility()
 		return self.c4dTabTiles.SetGroupsVisibility({grp: not val for grp in visibilities.keys()})
 
+	def _createScanner(self) -> C4DScanner:
+		return C4DScanner(maxDepth=self._getSearchDepth(),
+						  maxWorkers=self.GetPreference('general_scan-workers') or SCANNER_MAX_WORKERS,
+						  maxWorkersPerRoot=self.GetPreference('general_scan-workers-per-root') or SCANNER_MAX_WORKERS_PER_ROOT,
+						  index=self.scanIndex, prefsIndex=self.prefsFolderIndex, rules=self._getScanRules(),
+						  rootTimeout=self.GetPreference('general_scan-root-timeout') if self.GetPreference('general_scan-root-timeout') is not None else SCANNER_ROOT_TIMEOUT_SEC,
+						  hashCorelibs=bool(self.GetPreference('general_fingerprint-corelibs')))
+
+	def _getSearchDepth(self) -> int:
+		return self.GetPreference('general_search-depth') or SCANNER_MAX_DEPTH
+
+	# search path -> its scan rules, default ones for paths that weren't configured
+	def _getScanRules(self) -> dict[str, C4DScanRules]:
+		searchPaths: list[str] = self.GetPreference('search-paths_search-paths')
+		rulesPrefs: dict[str, dict] = self.GetPreference('search-paths_rules')
+		if searchPaths is None: searchPaths = list()
+		if rulesPrefs is None: rulesPrefs = dict()
+		return {sp: C4DScanRules.FromJSON(rulesPrefs[sp]) if sp in rulesPrefs else C4DScanRules() for sp in searchPaths}
+
+	def _saveScanIndex(self):
+		try:
+			self.scanIndex.Save()
+		except OSError as e:
+			print(f'Failed to save scan index: {e}')
+
+	def _createSingleShotTimer(self, intervalMsec: int, callback: Callable[[], None]) -> QTimer:
+		timer: QTimer = QTimer(self)
+		timer.setInterval(intervalMsec)
+		timer.setSingleShot(True)
+		timer.timeout.connect(callback)
+		return timer
+
+	def _saveDiskUsage(self):
+		try:
+			self.diskUsage.Save()
+		except OSError as e:
+			print(f'Failed to save disk usage cache: {e}')
+
+	# Sizes of found c4ds and their prefs folders, unchanged ones are answered from the cache
+	def _requestDiskUsage(self, c4dEntries: list[C4DInfo]):
+		self.diskUsage.Request([path for c4d in c4dEntries for path in (c4d.GetPathFolderRoot(), c4d.GetPathFolderPrefs())])
+
+	def _onDiskUsageComputed(self, path: str, size: int):
+		self.c4dTabTiles.UpdateDiskUsageUI(path)
+		self.c4dTabGrid.UpdateC4DItems(path)
+		if not self.diskUsageSaveTimer.isActive():
+			self.diskUsageSaveTimer.start()
+		if self._dependsOnDiskUsage() and not self.diskUsageRegroupTimer.isActive():
+			self.diskUsageRegroupTimer.start()
+
+	def _onDiskUsageRegroupTimeout(self):
+		if self._dependsOnDiskUsage():
+			self.updateTilesWidget()
+
+	# Grouping or sorting by size has to be redone as sizes arrive
+	def _dependsOnDiskUsage(self) -> bool:
+		return self._getGrouping()[0] == 'size' or self._getSorting()[0] == 'size'
+
+	def IsScanning(self) -> bool:
+		return self.scanThread is not None
+
+	# Rescan action cancels the running scan
+	def _toggleRescan(self):
+		if self.IsScanning():
+			return self.cancelScan()
+		self.rescan()
+
+	def cancelScan(self):
+		if not self.IsScanning():
+			return
+		self.pendingRescan = False
+		self.scanThread.Cancel()
+		self.scanStatusLabel.setText('Cancelling scan...')
+
+	# Scans search paths in background, tiles are added as packages are found
 	def rescan(self):
+		if self.IsScanning():
+			self.pendingRescan = True # restarted once the current scan is finished
+			return
+
 		searchPaths: list[str] = self.GetPreference('search-paths_search-paths')
 		if searchPaths is None: searchPaths = list()
 
-		c4dEntries: list[C4DInfo] = list()
-		for path in searchPaths:
-			if c4dsDict := FindCinemaPackagesInFolder(path):
-				c4dEntries += [v for v in c4dsDict.values()]
-			
-		self.updateTilesWidget(c4dEntries)
-		self.c4dTilesStackedContainer.setCurrentIndex(1 if c4dEntries else 0)
+		self.scannedC4DEntries.clear() # shown entries are kept during the scan, stale ones are removed once it's finished
+		self.c4dTilesStackedContainer.setCurrentIndex(1)
+		self._startScanThread(C4DScanThread(self._createScanner(), roots=searchPaths, parent=self))
+
+	def _startScanThread(self, scanThread: C4DScanThread):
+		if not scanThread.IsSubtreesScan():
+			scanThread.packagesFound.connect(self._onScanPackagesFound)
+		scanThread.progressChanged.connect(self._onScanProgressChanged)
+		scanThread.scanFinished.connect(self._onScanFinished)
+		self.scanThread = scanThread
+		self.scanStartTime = dt.datetime.now()
+		self.scanStatusLabel.setText('Scanning...')
+		self.actionRescan.setText('Cancel &scan')
+		self.diskUsage.Pause() # both read the disk, scan goes first
+		scanThread.start()
+
+	def _onScanPackagesFound(self, c4dEntries: list[C4DInfo]):
+		self.scannedC4DEntries += c4dEntries
+		if not self.c4dTabTiles.GetC4DEntries(): # show the first ones right away
+			return self._flushScannedC4DEntries()
+		if not self.scannedC4DEntriesTimer.isActive():
+			self.scannedC4DEntriesTimer.start()
+
+	# Found entries replace shown ones of the same directory, new ones are appended
+	def _flushScannedC4DEntries(self):
+		if not self.scannedC4DEntries:
+			return
+		c4dEntries: list[C4DInfo] = list(self.c4dTabTiles.GetC4DEntries())
+		c4dIndices: dict[str, int] = {c4d.directory: idx for idx, c4d in enumerate(c4dEntries)}
+		replaced: bool = False
+		for c4d in self._reuseShownC4DEntries(self.scannedC4DEntries):
+			if (idx := c4dIndices.get(c4d.directory)) is None:
+				c4dIndices[c4d.directory] = len(c4dEntries)
+				c4dEntries.append(c4d)
+			elif c4dEntries[idx] is not c4d:
+				c4dEntries[idx] = c4d
+				replaced = True
+		self.scannedC4DEntries = list()
+		if replaced:
+			self.updateTilesWidget(c4dEntries)
+		else:
+			self.appendTilesWidget(c4dEntries)
+
+	# Found entries that are the same as shown ones are swapped for them, so that their tiles aren't updated for nothing
+	def _reuseShownC4DEntries(self, c4dEntries: list[C4DInfo]) -> list[C4DInfo]:
+		shownEntries: dict[str, C4DInfo] = {c4d.directory: c4d for c4d in self.c4dTabTiles.GetC4DEntries()}
+		ret: list[C4DInfo] = list()
+		for c4d in c4dEntries:
+			shown: C4DInfo | None = shownEntries.get(c4d.directory)
+			ret.append(shown if shown is not None and shown.ToJSON() == c4d.ToJSON() else c4d)
+		return ret
+
+	def _onScanProgressChanged(self, progress: C4DScanProgress):
+		self.scanStatusLabel.setText(f'Scanning: {progress}')
+
+	def _onScanFinished(self, found: dict[str, C4DInfo]):
+		scanThread: C4DScanThread = self.scanThread
+		self.scanThread = None
+		scanThread.wait()
+		scanThread.deleteLater()
+		self.actionRescan.setText('Re&scan')
+		self.diskUsage.Resume()
+
+		elapsed: float = (dt.datetime.now() - self.scanStartTime).total_seconds()
+		stats: C4DScanStats = scanThread.scanner.stats
+		prunedCount: int = stats.prunedByRules + stats.prunedByEntries
+		degradedRoots: dict[str, str] = scanThread.scanner.degradedRoots
+		statusText: str = f'Scan finished in {elapsed:.1f}s: {len(found)} packages found'
+		if prunedCount: statusText += f', {prunedCount} folders pruned by scan rules'
+		if degradedRoots: statusText += f', {len(degradedRoots)} folder(s) not scanned completely'
+		self.scanStatusLabel.setText(statusText)
+		self.scanStatusLabel.setToolTip('\n'.join(f'{root}: {reason}' for root, reason in degradedRoots.items()))
+		if not scanThread.IsSubtreesScan(): # report of a few changed subtrees would replace the one of the whole scan
+			self.dialogs['scanreport'].SetReport(scanThread.scanner.report)
+		self._saveScanIndex()
+
+		if scanThread.IsSubtreesScan():
+			for root, reason in degradedRoots.items(): # search paths are marked as a whole, until the next full scan
+				if searchPath := FindSearchPathRules(root, scanThread.scanner.rules)[0]:
+					self.degradedSearchPaths[searchPath] = reason
+			self._applyRescannedSubtrees(scanThread.subtrees, found)
+			self._requestDiskUsage(list(found.values()))
+		else:
+			self.scannedC4DEntriesTimer.stop()
+			self.scannedC4DEntries.clear()
+			c4dEntries: list[C4DInfo] = self._reuseShownC4DEntries(list(found.values()))
+			degradedChanged: bool = self.degradedSearchPaths != degradedRoots
+			self.degradedSearchPaths = dict(degradedRoots)
+			# tiles came in the order packages were found (after the ones shown before the scan), update only if the final
+			# entries, their order (or group names) differ, this also removes entries that weren't found anymore
+			if degradedChanged or any(a is not b for a, b in zip(self.c4dTabTiles.GetC4DEntries(), c4dEntries)) or len(self.c4dTabTiles.GetC4DEntries()) != len(c4dEntries):
+				self.updateTilesWidget(c4dEntries)
+			self.c4dTabTiles.PruneCache()
+			self.c4dTilesStackedContainer.setCurrentIndex(1 if c4dEntries else 0)
+			self._updateSearchPathsWatcher()
+			self._requestDiskUsage(c4dEntries)
+
+		if self.pendingRescan:
+			self.pendingRescan = False
+			self.pendingSubtrees.clear() # covered by full rescan
+			self.rescan()
+		elif self.pendingSubtrees:
+			subtrees: list[tuple[str, int]] = self.pendingSubtrees
+			self.pendingSubtrees = list()
+			self._onSearchPathsSubtreesChanged(subtrees)
+
+	def _updateSearchPathsWatcher(self):
+		if not self.GetPreference('general_watch-search-paths'):
+			return self.searchPathsWatcher.Stop()
+		searchPaths: list[str] = self.GetPreference('search-paths_search-paths')
+		self.searchPathsWatcher.SetSearchPaths(searchPaths if searchPaths else list(), self._getSearchDepth(), self._getScanRules())
+
+	# Watcher reported changes in some parts of search paths -> rescan only them and replace their c4d entries
+	def _onSearchPathsSubtreesChanged(self, subtrees: list[tuple[str, int]]):
+		if self.IsScanning():
+			self.pendingSubtrees += subtrees
+			return
+		self._startScanThread(C4DScanThread(self._createScanner(), subtrees=subtrees, parent=self))
+
+	# Rescans a single folder within search paths, e.g. after something was put there by the app itself
+	def _rescanFolder(self, path: str):
+		searchPath: str | None = PathTrie(self.GetPreference('search-paths_search-paths') or list()).FindDeepest(path)
+		if searchPath is None:
+			return
+		relPath: str = os.path.relpath(path, searchPath)
+		self._onSearchPathsSubtreesChanged([(path, 0 if relPath == '.' else len(relPath.split(os.sep)))])
+
+	def _extractArchive(self, c4d: C4DInfo):
+		if not c4d.archived or c4d.directory in self.extractThreads:
+			return
+		extractThread: C4DExtractThread = C4DExtractThread(c4d, self)
+		extractThread.progressChanged.connect(partial(self._onExtractProgressChanged, c4d))
+		extractThread.extractFinished.connect(partial(self._onExtractFinished, c4d))
+		self.extractThreads[c4d.directory] = extractThread
+		self.statusBar().showMessage(f'Extracting {c4d.GetNameFolderRoot()} to {extractThread.targetPath}')
+		extractThread.start()
+
+	def _onExtractProgressChanged(self, c4d: C4DInfo, extracted: int, total: int):
+		self.statusBar().showMessage(f'Extracting {c4d.GetNameFolderRoot()}: {extracted * 100 // max(1, total)}%')
+
+	def _onExtractFinished(self, c4d: C4DInfo, error: str):
+		extractThread: C4DExtractThread = self.extractThreads.pop(c4d.directory)
+		extractThread.wait()
+		extractThread.deleteLater()
+		if error:
+			self.statusBar().clearMessage()
+			QMessageBox.warning(self, c4d.directory, f'Failed to extract archive to {extractThread.targetPath}:\n{error}', QMessageBox.Ok)
+			return
+		self.statusBar().showMessage(f'Extracted {c4d.GetNameFolderRoot()} to {extractThread.targetPath}', 10000)
+		self._rescanFolder(os.path.dirname(c4d.directory))
+
+	def _applyRescannedSubtrees(self, subtrees: list[tuple[str, int]], found: dict[str, C4DInfo]):
+		# packages of search paths nested in the subtrees weren't rescanned, they're kept as well
+		searchPathsTrie: PathTrie = PathTrie(self.GetPreference('search-paths_search-paths') or list())
+		def isRescanned(c4d: C4DInfo) -> bool:
+			return any(IsPathUnder(c4d.directory, path) and searchPathsTrie.FindDeepest(c4d.directory) == searchPathsTrie.FindDeepest(path) for path, _ in subtrees)
+		oldEntries: list[C4DInfo] = self.c4dTabTiles.GetC4DEntries()
+		keptEntries: list[C4DInfo] = [c4d for c4d in oldEntries if not isRescanned(c4d)]
+		removedDirs: set[str] = set(c4d.directory for c4d in oldEntries) - set(c4d.directory for c4d in keptEntries)
+		changedEntries: list[C4DInfo] = [c4d for c4d in oldEntries if c4d.directory in found and (c4d.build, c4d.version, c4d.fingerprint) != (found[c4d.directory].build, found[c4d.directory].version, found[c4d.directory].fingerprint)]
+		if removedDirs != set(found.keys()) or changedEntries:
+			c4dEntries: list[C4DInfo] = keptEntries + list(found.values())
+			self.updateTilesWidget(c4dEntries)
+			self.c4dTilesStackedContainer.setCurrentIndex(1 if c4dEntries else 0)
+
+		self.searchPathsWatcher.WatchSubtrees(subtrees)
 	
+	# Adds tiles for entries appended to the current ones, keeps groups visibility
+	def appendTilesWidget(self, c4dEntries: list[C4DInfo]):
+		currentVisibilities: dict[C4DTileGroup, bool] = self.c4dTabTiles.GetGroupsVisibility()
+		c4dGroups: list[C4DTileGroup] = self._groupC4DEntries(c4dEntries)
+		self.c4dTabTiles.appendTiles(c4dEntries, c4dGroups)
+		self.c4dTabTiles.SetGroupsVisibility(currentVisibilities)
+		self.c4dTabGrid.SetEntries(c4dEntries, c4dGroups)
+
 	def updateTilesWidget(self, newC4DEntries: list[C4DInfo] | None = None, visibilityCallback: Callable[[dict[C4DTileGroup, bool]], None] | None = None):
 		# TODO: Below looks so much like code repetition.. clean it up!
 		
 		c4dEntries: list[C4DInfo] = newC4DEntries if newC4DEntries is not None else self.c4dTabTiles.GetC4DEntries()
 		currentVisibilities: dict[C4DTileGroup, bool] = self.c4dTabTiles.GetGroupsVisibility()
 		currentGrouping: str = self.oldGroupingKey if hasattr(self, 'oldGroupingKey') and self.oldGroupingKey else ''
+		groupingKey, _ = self._getGrouping()
 		
 		# Group first
+		c4dGroups: list[C4DTileGroup] = self._groupC4DEntries(c4dEntries)
+
+		# Create tiles, they're only created while tiles tab is shown
+		self.c4dTabTiles.updateTiles(c4dEntries, c4dGroups)
+		self.c4dTabGrid.SetEntries(c4dEntries, c4dGroups)
+		
+		# Handle groups visibility
+		if visibilityCallback is not None: # explicitly set what should be visible
+			visibilityFlags: dict[C4DTileGroup, bool] = {grp: True for grp in c4dGroups}
+			visibilityCallback(visibilityFlags)
+			self.c4dTabTiles.SetGroupsVisibility(visibilityFlags)
+		elif currentGrouping == groupingKey: # grouping key hasn't changed -> keep current visibilities
+			self.c4dTabTiles.SetGroupsVisibility(currentVisibilities)
+			self.currentGrouping = ''
+		
+		self.oldGroupingKey = groupingKey
+
+	def _groupC4DEntries(self, c4dEntries: list[C4DInfo]) -> list[C4DTileGroup]:
 		c4dGroups: list[C4DTileGroup] = list()
 		groupingKey, isAscending = self._getGrouping()
 		if groupingKey == 'paths':
 			searchPaths: list[str] = self.GetPreference('search-paths_search-paths')
 			if searchPaths is None: searchPaths = list()
 			idxMap: dict[str, list[int]] = {sp: list() for sp in searchPaths} # path -> indices
+			searchPathsTrie: PathTrie = PathTrie(searchPaths)
 			for c4dIdx, c4dEntry in enumerate(c4dEntries):
-				for sp in searchPaths:
-					if c4dEntry.directory.startswith(sp):
-						idxMap[sp].append(c4dIdx)
+				if sp := searchPathsTrie.FindDeepest(c4dEntry.directory): # nested search paths own their packages
+					idxMap[sp].append(c4dIdx)
 			availablePaths: list[str] = [k for k in idxMap.keys() if idxMap[k]]
 			availablePaths.sort(reverse=not isAscending)
-			c4dGroups = [C4DTileGroup(idxMap[path], path, path) for path in availablePaths]
+			c4dGroups = [C4DTileGroup(idxMap[path], path + MainWindow.DEGRADED_SEARCH_PATH_SUFFIXES.get(self.degradedSearchPaths.get(path, ''), ''), path) for path in availablePaths]
 
 		elif groupingKey == 'version':
 			idxMap: dict[str, tuple[list[int], str]] = dict() # major_version -> <indices, non-formatted_version>
@@ -444,7 +864,7 @@ class MainWindow(QMainWindow, RestorableQWidget):
 			c4dTagBinding: dict[str, list[str]] = self.c4dTabTiles.GetTagBindings()
 			idxMap: dict[str, tuple[list[int], C4DTag | None]] = dict() # tag uuid -> <indices, tag | None>
 			for c4dIdx, c4dEntry in enumerate(c4dEntries):
-				tagUuids: list[str] = c4dTagBinding[c4dEntry.directory]
+				tagUuids: list[str] = c4dTagBinding.get(c4dEntry.directory, list()) # no binding yet for freshly found c4ds
 				if not len(tagUuids):
 					if '' not in idxMap: idxMap[''] = (list(), None)
 					idxMap[''][0].append(c4dIdx)
@@ -471,48 +891,103 @@ class MainWindow(QMainWindow, RestorableQWidget):
 				10: 'Untouched',
 				11: 'Touched',
 			}
-			mergingGroups: dict[int, list[int]] = {10: [0], 11: [1, -1, -2]} # newKey -> keys in idxMap that need to be merged
 			
-			idxMap: dict[int, list[int]] = dict() # PID Status -> indices
+			idxMap: dict[int, list[int]] = dict() # PID Status (or merged key) -> indices
 			for c4dIdx, c4dEntry in enumerate(c4dEntries):
-				c4dCacheInfo: C4DCacheInfo = self.c4dTabTiles.GetCacheInfo(c4dEntry.directory)
-				if not c4dCacheInfo:
+				statusKey: int | None = self._getC4DStatusGroupKey(c4dEntry)
+				if statusKey is None:
 					continue
-				statusKey: int = c4dCacheInfo.processStatus if c4dCacheInfo.processStatus <= 0 else 1 # if status > 0, it's PID -> different for all c4d entries
 				if statusKey not in idxMap: idxMap[statusKey] = list()
 				idxMap[statusKey].append(c4dIdx)
-
-			if self.GetPreference('appearance_grouping-status-separately') == 0: # group touched
-				mergedIdxMap: dict[int, list[int]] = dict()
-				for newKey, mergingGroup in mergingGroups.items():
-					mergingIndices: list[int] = list()
-					for mergingKey in mergingGroup:
-						if mergingKey not in idxMap:
-							continue
-						mergingIndices += idxMap[mergingKey]
-					mergedIdxMap[newKey] = mergingIndices
-				idxMap = mergedIdxMap
 			
 			idxMapKeys = [key for key in keyMapNames.keys() if key in idxMap and len(idxMap[key])]
 			availableStatusKeys: list[str] = [idxMapKeys[i] for i in sorted(list(range(len(idxMapKeys))), reverse=isAscending)]
 			c4dGroups = [C4DTileGroup(idxMap[statusKey], keyMapNames[statusKey], statusKey) for statusKey in availableStatusKeys]
 
-		# Sort
-		# c4dEntries.sort(key=lambda x: GetFolderTimestampCreated(x.GetPathFolderRoot()))
+		elif groupingKey == 'size':
+			unknownKey: int = len(MainWindow.DISK_USAGE_GROUPS) # sizes that weren't calculated yet
+			sizes: list[int | None] = [self.diskUsage.GetSize(c4dEntry.GetPathFolderRoot()) for c4dEntry in c4dEntries]
+			idxMap: dict[int, list[int]] = dict() # idx in DISK_USAGE_GROUPS -> indices
+			for c4dIdx, size in enumerate(sizes):
+				grpKey: int = unknownKey if size is None else next(i for i, (limit, _) in enumerate(MainWindow.DISK_USAGE_GROUPS) if limit is None or size < limit)
+				idxMap.setdefault(grpKey, list()).append(c4dIdx)
+			for indices in idxMap.values(): # tiles are sorted by size within groups as well
+				indices.sort(key=lambda idx: sizes[idx] or 0, reverse=not isAscending)
+			availableKeys: list[int] = sorted([k for k in idxMap.keys() if k != unknownKey], reverse=not isAscending)
+			c4dGroups = [C4DTileGroup(idxMap[grpKey], MainWindow.DISK_USAGE_GROUPS[grpKey][1], grpKey) for grpKey in availableKeys]
+			if unknownKey in idxMap:
+				c4dGroups.append(C4DTileGroup(idxMap[unknownKey], 'Size not calculated yet', unknownKey))
 
-		# Create tiles
-		self.c4dTabTiles.updateTiles(c4dEntries, c4dGroups)
-		
-		# Handle groups visibility
-		if visibilityCallback is not None: # explicitly set what should be visible
-			visibilityFlags: dict[C4DTileGroup, bool] = {grp: True for grp in c4dGroups}
-			visibilityCallback(visibilityFlags)
-			self.c4dTabTiles.SetGroupsVisibility(visibilityFlags)
-		elif currentGrouping == groupingKey: # grouping key hasn't changed -> keep current visibilities
-			self.c4dTabTiles.SetGroupsVisibility(currentVisibilities)
-			self.currentGrouping = ''
-		
-		self.oldGroupingKey = groupingKey
+		elif groupingKey == 'branch':
+			idxMap: dict[str, list[int]] = dict() # branch -> indices
+			for c4dIdx, c4dEntry in enumerate(c4dEntries):
+				idxMap.setdefault(c4dEntry.folderNameInfo.branch, list()).append(c4dIdx)
+			availableBranches: list[str] = sorted([k for k in idxMap.keys() if k], key=str.lower, reverse=not isAscending)
+			c4dGroups = [C4DTileGroup(idxMap[branch], branch, branch) for branch in availableBranches]
+			if '' in idxMap:
+				c4dGroups.append(C4DTileGroup(idxMap[''], 'Unknown branch', ''))
+
+		sortingKey, isSortAscending = self._getSorting()
+		if sortingKey != 'none':
+			if not c4dGroups: # no grouping
+				c4dGroups = [C4DTileGroup(list(range(len(c4dEntries))))]
+			sortKeys: list = self._getC4DSortKeys(c4dEntries, sortingKey)
+			for grp in c4dGroups:
+				grp.indices = MainWindow._sortIndices(grp.indices, sortKeys, not isSortAscending)
+
+		if self.actionCollapseDuplicates.isChecked():
+			c4dGroups = MainWindow._collapseDuplicates(c4dEntries, c4dGroups)
+		for grp in c4dGroups:
+			grp.kind = groupingKey
+		return c4dGroups
+
+	# Typed sort keys of c4ds, so that sorting compares plain ints/floats. None if c4d has no such key, e.g. builds with commit hash have no changelist
+	def _getC4DSortKeys(self, c4dEntries: list[C4DInfo], sortingKey: str) -> list:
+		if sortingKey == 'changelist':
+			return [c4dEntry.folderNameInfo.changelist for c4dEntry in c4dEntries]
+		if sortingKey == 'date':
+			return [c4dEntry.timestampBuilt or None for c4dEntry in c4dEntries]
+		if sortingKey == 'size': # package and its prefs, unknown until the package itself is calculated
+			return [self._getC4DDiskUsage(c4dEntry) for c4dEntry in c4dEntries]
+		return [None] * len(c4dEntries)
+
+	def _getC4DDiskUsage(self, c4dEntry: C4DInfo) -> int | None:
+		size: int | None = self.diskUsage.GetSize(c4dEntry.GetPathFolderRoot())
+		if size is None:
+			return None
+		return size + (self.diskUsage.GetSize(c4dEntry.GetPathFolderPrefs()) or 0)
+
+	# Sorts indices by keys[index], indices without key keep their order at the end
+	@staticmethod
+	def _sortIndices(indices: list[int], keys: list, reverse: bool) -> list[int]:
+		sortedIndices: list[int] = sorted([idx for idx in indices if keys[idx] is not None], key=keys.__getitem__, reverse=reverse)
+		return sortedIndices + [idx for idx in indices if keys[idx] is None]
+
+	# Keeps a single c4d of each fingerprint across all groups, its tile lists the other locations.
+	# Groups that had only hidden copies are dropped
+	@staticmethod
+	def _collapseDuplicates(c4dEntries: list[C4DInfo], c4dGroups: list[C4DTileGroup]) -> list[C4DTileGroup]:
+		if not c4dGroups: # no grouping
+			c4dGroups = [C4DTileGroup(list(range(len(c4dEntries))))]
+		hiddenIndices: set[int] = MainWindow._getHiddenDuplicates(c4dEntries)
+		for grp in c4dGroups:
+			grp.indices = [idx for idx in grp.indices if idx not in hiddenIndices]
+		return [grp for grp in c4dGroups if grp.indices] or c4dGroups[:1]
+
+	# Indices of copies that are hidden by collapsing: local copy is kept rather than one on a network share, otherwise the first found one
+	@staticmethod
+	def _getHiddenDuplicates(c4dEntries: list[C4DInfo]) -> set[int]:
+		byFingerprint: dict[str, list[int]] = dict()
+		for c4dIdx, c4dEntry in enumerate(c4dEntries):
+			if c4dEntry.fingerprint:
+				byFingerprint.setdefault(c4dEntry.fingerprint, list()).append(c4dIdx)
+		hiddenIndices: set[int] = set()
+		for indices in byFingerprint.values():
+			if len(indices) < 2:
+				continue
+			keptIdx: int = next((idx for idx in indices if not WinUtils.IsNetworkPath(c4dEntries[idx].directory)), indices[0])
+			hiddenIndices.update(idx for idx in indices if idx != keptIdx)
+		return hiddenIndices
 	
 	def GetTags(self) -> list[C4DTag]:
 		if dlgTags := self._getDialog('tags'):
@@ -558,4 +1033,12 @@ class MainWindow(QMainWindow, RestorableQWidget):
 		for v in self.dialogs.values():
 			if v is not None:
 				v.close()
+		if self.scanThread is not None:
+			self.scanThread.Cancel()
+			self.scanThread.wait()
+		for extractThread in self.extractThreads.values():
+			extractThread.Cancel()
+			extractThread.wait()
+		self.diskUsage.Stop()
+		self._saveDiskUsage()
 		evt.accept()
\ No newline at end of file
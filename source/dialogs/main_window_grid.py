@@ -0,0 +1,284 @@
+from PyQt5.QtCore import Qt, QAbstractListModel, QModelIndex, QSize, QRect, QPoint, pyqtSignal
+from PyQt5.QtGui import QPixmap, QFont, QFontMetrics, QPainter, QColor, QPen, QMouseEvent
+from PyQt5.QtWidgets import (
+	QWidget, QListView, QStyledItemDelegate, QStyleOptionViewItem, QStyle, QAbstractItemView
+)
+
+from dialogs.main_window_tiles import C4DTile, C4DTilesWidget
+from dialogs.tags import C4DTag
+from utils import *
+from gui_utils import *
+
+C4DInfoRole: int = Qt.UserRole + 1 		# C4DInfo of the item, None for group headers
+C4DGroupRole: int = Qt.UserRole + 2 	# C4DTileGroup of the group header, None for c4d items
+
+# Flat list of group headers, each followed by c4d entries of the group, entries of folded groups are left out.
+# It holds no widgets, so it stays cheap for thousands of c4ds. Cache infos, tags, sizes etc. are taken from the tiles widget
+class C4DGridModel(QAbstractListModel):
+	def __init__(self, tilesWidget: C4DTilesWidget, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self.tilesWidget: C4DTilesWidget = tilesWidget
+
+		self.c4dEntries: list[C4DInfo] = list()
+		self.c4dGroups: list[C4DTileGroup] = list()
+		self.foldedGroups: set = set() 						# (kind, key) of folded groups, kept across updates
+		self.rows: list[C4DInfo | C4DTileGroup] = list()
+
+	def SetEntries(self, c4dEntries: list[C4DInfo], c4dGroups: list[C4DTileGroup]):
+		self.beginResetModel()
+		self.c4dEntries = c4dEntries
+		self.c4dGroups = c4dGroups if c4dGroups else [C4DTileGroup()]
+		self.rows = self._buildRows()
+		self.endResetModel()
+
+	def _getGroupEntries(self, grp: C4DTileGroup) -> list[C4DInfo]:
+		return [self.c4dEntries[idx] for idx in grp.indices] if len(grp.indices) else list(self.c4dEntries)
+
+	def _buildRows(self) -> list[C4DInfo | C4DTileGroup]:
+		rows: list[C4DInfo | C4DTileGroup] = list()
+		for grp in self.c4dGroups:
+			if grp.name: # no header without grouping
+				rows.append(grp)
+				if (grp.kind, grp.key) in self.foldedGroups:
+					continue
+			rows += self._getGroupEntries(grp)
+		return rows
+
+	def IsGroupFolded(self, grp: C4DTileGroup) -> bool:
+		return (grp.kind, grp.key) in self.foldedGroups
+
+	def GetGroupSize(self, grp: C4DTileGroup) -> int:
+		return len(grp.indices) if len(grp.indices) else len(self.c4dEntries)
+
+	# Only rows of the group are inserted/removed, the rest of the view keeps its layout
+	def ToggleGroupFolded(self, row: int):
+		grp: C4DTileGroup = self.rows[row]
+		entries: list[C4DInfo] = self._getGroupEntries(grp)
+		if (grp.kind, grp.key) in self.foldedGroups:
+			self.foldedGroups.discard((grp.kind, grp.key))
+			if entries:
+				self.beginInsertRows(QModelIndex(), row + 1, row + len(entries))
+				self.rows[row + 1:row + 1] = entries
+				self.endInsertRows()
+		else:
+			self.foldedGroups.add((grp.kind, grp.key))
+			if entries:
+				self.beginRemoveRows(QModelIndex(), row + 1, row + len(entries))
+				del self.rows[row + 1:row + 1 + len(entries)]
+				self.endRemoveRows()
+		self.dataChanged.emit(self.index(row), self.index(row)) # fold mark of the header
+
+	# Repaints items of c4ds having the folder as root or prefs folder
+	def UpdateC4DItems(self, path: str):
+		for row, item in enumerate(self.rows):
+			if isinstance(item, C4DInfo) and (path == item.GetPathFolderRoot() or path == item.GetPathFolderPrefs()):
+				self.dataChanged.emit(self.index(row), self.index(row))
+
+	def rowCount(self, parent: QModelIndex = QModelIndex()) -> int:
+		return 0 if parent.isValid() else len(self.rows)
+
+	def flags(self, index: QModelIndex) -> Qt.ItemFlags:
+		if not index.isValid():
+			return Qt.NoItemFlags
+		if isinstance(self.rows[index.row()], C4DTileGroup):
+			return Qt.ItemIsEnabled
+		return Qt.ItemIsEnabled | Qt.ItemIsSelectable
+
+	def data(self, index: QModelIndex, role: int = Qt.DisplayRole):
+		if not index.isValid() or index.row() >= len(self.rows):
+			return None
+		item: C4DInfo | C4DTileGroup = self.rows[index.row()]
+		if isinstance(item, C4DTileGroup):
+			if role == Qt.DisplayRole: return item.name
+			if role == C4DGroupRole: return item
+			return None
+		if role == Qt.DisplayRole: return item.GetVersionString()
+		if role == Qt.ToolTipRole: return self.tilesWidget.CreateTooltipString(item) # built only when hovered
+		if role == C4DInfoRole: return item
+		return None
+
+# Paints c4d items as tiles (status flag, version, icon, folder name, size, tags, note) and group headers as full-width rows
+class C4DGridDelegate(QStyledItemDelegate):
+	TILE_SIZE: QSize = QSize(150, 176)
+	HEADER_HEIGHT: int = 28
+	ICON_SIZE: int = 64
+	PADDING: int = 4
+	MAX_TAGS: int = 3
+
+	def __init__(self, tilesWidget: C4DTilesWidget, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self.tilesWidget: C4DTilesWidget = tilesWidget
+
+		self.fontVersion: QFont = QFont(APPLICATION_FONT_FAMILY, 12)
+		self.fontFolder: QFont = QFont(APPLICATION_FONT_FAMILY, 10)
+		self.fontSmall: QFont = QFont(APPLICATION_FONT_FAMILY, 8)
+		self.fontHeader: QFont = QFont(APPLICATION_FONT_FAMILY, 10)
+		self.fontHeader.setBold(True)
+
+	def sizeHint(self, option: QStyleOptionViewItem, index: QModelIndex) -> QSize:
+		if index.data(C4DGroupRole) is not None: # spans the whole row, so that the next items start on a new line
+			view: QListView | None = option.widget
+			width: int = view.viewport().width() - 2 * view.spacing() - 1 if view else C4DGridDelegate.TILE_SIZE.width()
+			return QSize(max(width, 1), C4DGridDelegate.HEADER_HEIGHT)
+		return QSize(C4DGridDelegate.TILE_SIZE)
+
+	# Icon area within the item rect, clicking it runs c4d same way as on tiles
+	def GetIconRect(self, itemRect: QRect) -> QRect:
+		top: int = itemRect.top() + C4DGridDelegate.PADDING + QFontMetrics(self.fontVersion).height()
+		return QRect(itemRect.center().x() - C4DGridDelegate.ICON_SIZE // 2, top, C4DGridDelegate.ICON_SIZE, C4DGridDelegate.ICON_SIZE)
+
+	def _getIcon(self, c4d: C4DInfo, devicePixelRatio: float) -> QPixmap:
+		return self.tilesWidget.c4dIcons.GetPixmap(c4d, self.tilesWidget.GetPreference('appearance_ronalds-icons'), C4DGridDelegate.ICON_SIZE, devicePixelRatio)
+
+	def paint(self, painter: QPainter, option: QStyleOptionViewItem, index: QModelIndex):
+		painter.save()
+		if (grp := index.data(C4DGroupRole)) is not None:
+			self._paintHeader(painter, option, grp, index.model())
+		elif (c4d := index.data(C4DInfoRole)) is not None:
+			self._paintTile(painter, option, c4d)
+		painter.restore()
+
+	def _paintHeader(self, painter: QPainter, option: QStyleOptionViewItem, grp: C4DTileGroup, model: C4DGridModel):
+		rect: QRect = option.rect.adjusted(0, 2, 0, -2)
+		painter.fillRect(rect, option.palette.alternateBase())
+		painter.setPen(QPen(option.palette.text().color()))
+		painter.setFont(self.fontHeader)
+		foldMark: str = '▶' if model.IsGroupFolded(grp) else '▼'
+		painter.drawText(rect.adjusted(8, 0, -8, 0), Qt.AlignLeft | Qt.AlignVCenter, f'{foldMark} {grp.name} ({model.GetGroupSize(grp)})')
+
+	def _paintTile(self, painter: QPainter, option: QStyleOptionViewItem, c4d: C4DInfo):
+		rect: QRect = option.rect.adjusted(2, 2, -2, -2)
+		if option.state & QStyle.State_Selected:
+			painter.fillRect(rect, option.palette.highlight().color().lighter(170))
+		elif option.state & QStyle.State_MouseOver:
+			painter.fillRect(rect, option.palette.midlight())
+		painter.setPen(QPen(option.palette.mid().color()))
+		painter.drawRect(rect)
+
+		ci: C4DCacheInfo | None = self.tilesWidget.GetCacheInfo(c4d.directory)
+		processStatus: int = ci.processStatus if ci else 0
+		painter.fillRect(QRect(rect.topLeft() + QPoint(1, 1), QSize(12, 12)), QColor(C4DTile.STATUS_COLORS[min(processStatus, 1)]))
+
+		painter.setPen(QPen(option.palette.text().color()))
+		textWidth: int = rect.width() - 2 * C4DGridDelegate.PADDING
+		y: int = rect.top() + C4DGridDelegate.PADDING
+		def drawTextLine(font: QFont, text: str):
+			nonlocal y
+			metrics: QFontMetrics = QFontMetrics(font)
+			painter.setFont(font)
+			painter.drawText(QRect(rect.left() + C4DGridDelegate.PADDING, y, textWidth, metrics.height()), Qt.AlignHCenter | Qt.AlignTop, metrics.elidedText(text, Qt.ElideMiddle, textWidth))
+			y += metrics.height()
+
+		drawTextLine(self.fontVersion, c4d.GetVersionString() + (' (zip)' if c4d.archived else ''))
+		iconRect: QRect = self.GetIconRect(rect)
+		painter.drawPixmap(iconRect, self._getIcon(c4d, painter.device().devicePixelRatioF()))
+		y = iconRect.bottom() + C4DGridDelegate.PADDING
+		drawTextLine(self.fontFolder, C4DTile.GetFolderLabelText(c4d, self.tilesWidget.GetPreference('appearance_c4dtile-adjust-c4d-folder-name')))
+
+		details: list[str] = list()
+		size, sizePrefs = self.tilesWidget.GetDiskUsage(c4d)
+		if size is not None and self.tilesWidget.GetPreference('appearance_c4dtile-show-size'):
+			details.append(FormatSize(size) + (f' (+{FormatSize(sizePrefs)} prefs)' if sizePrefs else ''))
+		duplicates: list[C4DInfo] = self.tilesWidget.GetDuplicates(c4d)
+		if duplicates:
+			details.append(f'+{len(duplicates)} identical')
+		if details:
+			drawTextLine(self.fontSmall, ', '.join(details))
+		if duplicates: # elided to the tile width, full list is in the tooltip
+			drawTextLine(self.fontSmall, ', '.join(C4DTile.GetDuplicatesLocations(duplicates)))
+
+		if ci and ci.tagUuids:
+			y = self._paintTags(painter, QRect(rect.left() + C4DGridDelegate.PADDING, y + 2, textWidth, 0), ci.tagUuids) + 2
+
+		if ci and ci.note and self.tilesWidget.GetPreference('appearance_c4dtile-show-note'):
+			painter.setPen(QPen(option.palette.text().color()))
+			drawTextLine(self.fontSmall, ci.note.splitlines()[0])
+
+	# Tags as colored bubbles in a single line, returns bottom of the line
+	def _paintTags(self, painter: QPainter, lineRect: QRect, tagUuids: list[str]) -> int:
+		tags: list[C4DTag] = [tag for uuid in tagUuids[:C4DGridDelegate.MAX_TAGS] if (tag := self.tilesWidget.GetTag(uuid))]
+		if not tags:
+			return lineRect.top()
+		metrics: QFontMetrics = QFontMetrics(self.fontSmall)
+		painter.setFont(self.fontSmall)
+		maxBubbleWidth: int = lineRect.width() // len(tags) - 2
+		bubbles: list[tuple[C4DTag, str, int]] = list() # tag, elided name, bubble width
+		for tag in tags:
+			name: str = metrics.elidedText(tag.name, Qt.ElideRight, maxBubbleWidth - 6)
+			bubbles.append((tag, name, min(metrics.horizontalAdvance(name) + 6, maxBubbleWidth)))
+		x: int = lineRect.center().x() - (sum(w for _, _, w in bubbles) + 2 * (len(bubbles) - 1)) // 2
+		height: int = metrics.height() + 2
+		for tag, name, width in bubbles:
+			bubbleRect: QRect = QRect(x, lineRect.top(), width, height)
+			color: QColor = tag.color if tag.color else QColor('#dddddd')
+			painter.setPen(Qt.NoPen)
+			painter.setBrush(color)
+			painter.drawRoundedRect(bubbleRect, 4, 4)
+			painter.setPen(QPen(Qt.black if color.lightness() > 128 else Qt.white))
+			painter.drawText(bubbleRect, Qt.AlignCenter, name)
+			x += width + 2
+		return lineRect.top() + height
+
+# Alternative to the tiles widget for large amounts of c4ds: items are painted by the delegate and only the visible ones are,
+# so that memory and update time don't grow with the number of widgets. Mouse clicks on the icon work the same way as on tiles
+class C4DGridView(QListView):
+	mouseDoubleClickedSignal = pyqtSignal(QMouseEvent)
+
+	def __init__(self, tilesWidget: C4DTilesWidget, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self.tilesWidget: C4DTilesWidget = tilesWidget
+
+		self.gridModel: C4DGridModel = C4DGridModel(tilesWidget, self)
+		self.gridDelegate: C4DGridDelegate = C4DGridDelegate(tilesWidget, self)
+		self.setModel(self.gridModel)
+		self.setItemDelegate(self.gridDelegate)
+
+		self.setViewMode(QListView.IconMode)
+		self.setFlow(QListView.LeftToRight)
+		self.setWrapping(True)
+		self.setResizeMode(QListView.Adjust)
+		self.setMovement(QListView.Static)
+		self.setLayoutMode(QListView.Batched) # items are laid out in batches, the view stays responsive meanwhile
+		self.setBatchSize(200)
+		self.setUniformItemSizes(False) # group headers span the whole row
+		self.setSpacing(2)
+		self.setSelectionMode(QAbstractItemView.SingleSelection)
+		self.setVerticalScrollMode(QAbstractItemView.ScrollPerPixel)
+		self.setMouseTracking(True) # hover highlighting
+
+		self.setContextMenuPolicy(Qt.CustomContextMenu)
+		self.customContextMenuRequested.connect(self._contextMenuRequested)
+
+	def SetEntries(self, c4dEntries: list[C4DInfo], c4dGroups: list[C4DTileGroup]):
+		self.gridModel.SetEntries(c4dEntries, c4dGroups)
+
+	def UpdateC4DItems(self, path: str):
+		self.gridModel.UpdateC4DItems(path)
+
+	# Preferences or tags changed, everything visible is repainted
+	def UpdateItemsUI(self):
+		self.viewport().update()
+
+	def _getC4D(self, pos: QPoint) -> C4DInfo | None:
+		index: QModelIndex = self.indexAt(pos)
+		return index.data(C4DInfoRole) if index.isValid() else None
+
+	def mousePressEvent(self, evt: QMouseEvent):
+		index: QModelIndex = self.indexAt(evt.pos())
+		if index.isValid() and index.data(C4DGroupRole) is not None:
+			if evt.button() == Qt.LeftButton:
+				self.gridModel.ToggleGroupFolded(index.row())
+			return evt.accept()
+		super().mousePressEvent(evt)
+		if index.isValid() and self.gridDelegate.GetIconRect(self.visualRect(index).adjusted(2, 2, -2, -2)).contains(evt.pos()):
+			if action := self.tilesWidget.GetC4DClickAction(index.data(C4DInfoRole), evt.button(), evt.modifiers()):
+				action()
+
+	def mouseDoubleClickEvent(self, evt: QMouseEvent):
+		if not self.indexAt(evt.pos()).isValid():
+			return self.mouseDoubleClickedSignal.emit(evt)
+		super().mouseDoubleClickEvent(evt)
+
+	def _contextMenuRequested(self, pos: QPoint):
+		if c4d := self._getC4D(pos):
+			self.tilesWidget.ShowC4DContextMenu(c4d, self)
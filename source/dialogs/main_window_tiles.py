@@ -1,6 +1,7 @@
 import sys, os, typing, datetime as dt, json, re
 from subprocess import Popen, PIPE
 from functools import partial
+from typing import Callable
 
 from PyQt5 import QtCore, QtGui
 from PyQt5.QtCore import QObject, Qt, QEvent, pyqtSignal, QProcess, QRect, QPoint, QPropertyAnimation
@@ -28,6 +29,7 @@ from PyQt5.QtWidgets import (
 	QPlainTextEdit,
 	QShortcut,
 	QMessageBox,
+	QToolTip,
 )
 
 # import qrc_resources
@@ -37,6 +39,8 @@ from dialogs.tags import TagsWindow, C4DTag, TagBubbleWidget
 from version import *
 from utils import *
 from gui_utils import *
+from disk_usage import C4DDiskUsageCalculator
+from c4d_icons import C4DIconsCache
 
 
 # # TODO: here for now, please remove once not needed!
@@ -91,6 +95,14 @@ class NoteEditorDialog(QDialog):
 
 class C4DTile(QFrame):
 	RAWFOLDERNAME_MAXLEN: int = 64
+	DUPLICATES_MAX_SHOWN: int = 2 			# locations of identical copies listed on the tile, the rest are in the tooltip
+	DUPLICATE_LOCATION_MAXLEN: int = 32
+	STATUS_COLORS: dict[int, str] = { # c4d process status -> color of the status flag
+		0: '#cccccc', # not yet started, gray
+		-2: '#ff0000', # started, but was killed, red
+		-1: '#0077ff', # was running, but not there anymore -> blue
+		1: '#00ff00', # started, running, green
+	}
 	# https://forum.qt.io/topic/90403/show-tooltip-immediatly/6
 	class C4DTileProxyStyle(QProxyStyle):
 		def styleHint(self, hint: QStyle.StyleHint, option: QStyleOption | None = None, widget: QWidget | None = None, returnData: QStyleHintReturn | None = None) -> int:
@@ -98,24 +110,12 @@ class C4DTile(QFrame):
 				return 0
 			return super().styleHint(hint, option, widget, returnData)
 
-	c4dStatusChanged = pyqtSignal(int)
 	def __init__(self, c4d: C4DInfo, parent: QWidget | None = None) -> None:
 		self.parentTilesWidget = parent # TODO: this is bad design!!
 		super().__init__(parent)
 
 		self.c4d: C4DInfo = c4d
 
-		# TODO: separate this in a class to not mess around with the scope here
-		self.c4dProcess: QProcess = QProcess()
-		# self.c4dProcess.setStandardErrorFile(QProcess.nullDevice())
-		# self.c4dProcess.setStandardInputFile(QProcess.nullDevice())
-		# self.c4dProcess.setStandardOutputFile(QProcess.nullDevice())
-		self.c4dProcessArgs = []
-		self.c4dProcessRestartTime: QTimer = QTimer()
-		self.c4dProcessRestartTime.setInterval(500)
-		self.c4dProcessRestartTime.setSingleShot(True)
-		self.c4dProcessRestartTime.timeout.connect(lambda: self._runC4D(self.c4dProcessArgs))
-
 		self.setFrameStyle(QFrame.StyledPanel | QFrame.Plain)
 		self.setLineWidth(1)
 		# self.setFixedSize(100, 100)
@@ -124,7 +124,6 @@ class C4DTile(QFrame):
 		self.setStyle(C4DTile.C4DTileProxyStyle())
 
 		self._setupUI()
-		self._addActions()
 		
 		self.picLabel.mousePressEvent = self._mouseClicked
 
@@ -133,7 +132,8 @@ class C4DTile(QFrame):
 
 	def _setupUI(self):
 		self.picLabel: QLabel = QLabel()
-		self.picLabel.setScaledContents(True)
+		self.picLabel.setAlignment(Qt.AlignCenter)
+		self.iconCacheKey: int = 0 # pixmaps are shared, same key means the same icon is already shown
 		self.picLabel.setCursor(QCursor(Qt.PointingHandCursor))
 
 		def createQLabel(fontSize: int, text: str | None = None) -> QLabel:
@@ -147,6 +147,8 @@ class C4DTile(QFrame):
 		self.versLabel: QLabel = createQLabel(12)
 		self.folderLabel = createQLabel(10)
 		self.timestampLabel = createQLabel(10)
+		self.sizeLabel = createQLabel(9)
+		self.duplicatesLabel = createQLabel(9)
 		self.noteLabel = createQLabel(10)
 
 		self.tagsWidget: QWidget = self._createTagsSectionWidget()
@@ -156,6 +158,8 @@ class C4DTile(QFrame):
 		layout.addWidget(self.picLabel, alignment=Qt.AlignCenter)
 		layout.addWidget(self.folderLabel, alignment=Qt.AlignCenter)
 		layout.addWidget(self.timestampLabel, alignment=Qt.AlignCenter)
+		layout.addWidget(self.sizeLabel, alignment=Qt.AlignCenter)
+		layout.addWidget(self.duplicatesLabel, alignment=Qt.AlignCenter)
 		layout.addWidget(self.tagsWidget, alignment=Qt.AlignCenter)
 		layout.addWidget(self.noteLabel, alignment=Qt.AlignCenter)
 
@@ -165,61 +169,39 @@ class C4DTile(QFrame):
 		self.picLabel.setFixedSize(picSize, picSize)
 
 		self.c4dProcessStatusLabel: QLabel = QLabel(self)
+		self.statusColor: str = ''
 		self.c4dProcessStatusLabel.setFixedSize(16, 16)
 		self.c4dProcessStatusLabel.setGeometry(QRect(QPoint(1, 1), self.c4dProcessStatusLabel.size()))
 		
 		self.updateUI()
 	
+	# Icon pre-scaled to the label, shared with other tiles
 	def LoadC4DIcon(self) -> QPixmap:
-		# Many thanks to Ronald for the icons: https://backstage.maxon.net/topic/3064/cinema-4d-icon-pack
-		useRondalds: bool = self.GetPreference('appearance_ronalds-icons')
-		c4dIconName: str = ('C4D ' + self.c4d.GetVersionMajor() + '.png') if useRondalds else '_C4D.png'
-		c4dIconNameFallback: str = 'C4D Color Purple.png' if useRondalds else '_C4D.png'
-		c4dIconPath: str = OsPathJoin(C4D_ICONS_FOLDER, c4dIconName)
-		c4dIconFallbackPath: str = OsPathJoin(C4D_ICONS_FOLDER, c4dIconNameFallback)
-		return QPixmap(c4dIconPath if os.path.isfile(c4dIconPath) else c4dIconFallbackPath)
+		return self.parentTilesWidget.c4dIcons.GetPixmap(self.c4d, self.GetPreference('appearance_ronalds-icons'), self.picLabel.width(), self.devicePixelRatioF())
 	
 	def GetPreference(self, attr: str):
 		return self.parentTilesWidget.GetPreference(attr)
 	
-	def _getAdjustedC4DFolderName(self):
-		folderName: str = self.c4d.GetNameFolderRoot()
-		
-		if folderName.lower().startswith('maxon'): # customer installation
-			return folderName
-		
-		commitHashPattern = re.compile('#[a-zA-Z0-9]{12}')
-		if match := commitHashPattern.search(folderName): # it's a new notation with 12 symbol commit hash
-			if folderName.startswith('C4D'): # it's installation
-				tokens: list[str] = folderName.split(' ')
-				if len(tokens) < 5: return folderName[:C4DTile.RAWFOLDERNAME_MAXLEN]
-				return f'{tokens[1]} {tokens[4][:9]}' # branch + commit hash
-			# it's a package
-			tokens: list[str] = folderName.split('_')
-			if len(tokens) < 2: return folderName[:C4DTile.RAWFOLDERNAME_MAXLEN]
-			return f'{tokens[0]} {match.group()[:9]}'
-		
-		# it's an old notation with CL
-		if folderName.startswith('C4D'): # it's installation
-			tokens: list[str] = folderName.split(' ')
-			if len(tokens) < 4: return folderName[:C4DTile.RAWFOLDERNAME_MAXLEN]
-			return f'{tokens[1]} CL{tokens[-1]}'
-		
-		# it's a package
-		changeListPattern = re.compile('CL\d{6}')
-		if match := changeListPattern.search(folderName): # found CL###### token
-			pos, _ = match.span()
-			tokens: list[str] = [x for x in folderName[:pos].split('.') if x]
-			if len(tokens) < 3: return folderName[:C4DTile.RAWFOLDERNAME_MAXLEN]
-			versionTokensNum = 2 # old R notation, e.g. 26.001
-			if len(tokens[0]) == 4: # it's 202X notation
-				if len(tokens) == 3: # it's 2023.000.branch naming scheme
-					versionTokensNum = 2
-				else: # it's 2023.0.0.branch naming scheme
-					versionTokensNum = 3
-			tokens = [''.join(tokens[:versionTokensNum]), '.'.join(tokens[versionTokensNum:])]
-			return f'{tokens[1]} {match.group()}'
-		return folderName[:C4DTile.RAWFOLDERNAME_MAXLEN]
+	# Short name of c4d folder, e.g. branch and commit hash / changelist
+	@staticmethod
+	def GetAdjustedC4DFolderName(c4d: C4DInfo) -> str:
+		return c4d.folderNameInfo.label or c4d.GetNameFolderRoot()[:C4DTile.RAWFOLDERNAME_MAXLEN]
+
+	# Short locations of identical copies (their parent folders), the rest is only counted
+	@staticmethod
+	def GetDuplicatesLocations(duplicates: list[C4DInfo]) -> list[str]:
+		def shorten(location: str) -> str:
+			maxLen: int = C4DTile.DUPLICATE_LOCATION_MAXLEN
+			return location if len(location) <= maxLen else location[:maxLen // 2 - 1] + '...' + location[-(maxLen - maxLen // 2 - 2):]
+		locations: list[str] = [shorten(os.path.dirname(dup.GetPathFolderRoot())) for dup in duplicates[:C4DTile.DUPLICATES_MAX_SHOWN]]
+		if len(duplicates) > C4DTile.DUPLICATES_MAX_SHOWN:
+			locations.append(f'and {len(duplicates) - C4DTile.DUPLICATES_MAX_SHOWN} more')
+		return locations
+
+	# Text of the folder label, adjusted or raw c4d folder name
+	@staticmethod
+	def GetFolderLabelText(c4d: C4DInfo, adjust: bool) -> str:
+		return C4DTile.GetAdjustedC4DFolderName(c4d) if adjust else c4d.GetNameFolderRoot()[:C4DTile.RAWFOLDERNAME_MAXLEN]
 
 	def _createTagsSectionWidget(self):
 		tagsLayout: QHBoxLayout = QHBoxLayout() # TODO: make it work with FlowLayout? # self.tagsLayout: FlowLayout = FlowLayout()
@@ -241,59 +223,13 @@ class C4DTile(QFrame):
 		return tagsWidget
 	
 	def _mouseClicked(self, evt: QMouseEvent):
-		action: QAction | None = self._getActionForMouseClick(evt.button(), evt.modifiers())
-		if action: action.trigger()
-
-	def _getActionForMouseClick(self, button: Qt.MouseButton, modifiers: Qt.KeyboardModifiers):
-		if button == Qt.LeftButton:
-			if modifiers & Qt.KeyboardModifier.ControlModifier:
-				if modifiers & Qt.KeyboardModifier.ShiftModifier: 			# Ctrl+Shift+LClick
-					return self.actionRestartC4D
-				else: 														# Ctrl+LClick
-					return self.actionRunC4DConsole
-			elif modifiers & Qt.KeyboardModifier.ShiftModifier: 			# Shift+LClick
-				return self.actionKillC4D
-			else: 															# LClick
-				return self.actionRunC4D
-		if button == Qt.MiddleButton:
-			if modifiers & Qt.KeyboardModifier.ControlModifier: 			# Ctrl+MClick
-				return self.actionOpenFolder
-			elif modifiers & Qt.KeyboardModifier.ShiftModifier: 			# Shift+MClick
-				return self.actionOpenFolderPrefs
-			else: 															# MClick
-				return self.actionActivateC4D
-		return None
-
-	def _runC4D(self, args: list[str] = []):
-		# https://forum.qt.io/topic/129701/qprocess-startdetached-but-the-child-process-closes-when-the-parent-exits/6
-		if self.GetC4DProcessPIDStatus() > 0 and WinUtils.IsPIDExisting(self.GetC4DProcessPIDStatus()):
-			QMessageBox.warning(self, self.c4d.directory, 'This Cinema 4D instance is already running..', QMessageBox.Ok)
-			return
-		
-		self.c4dProcess.setProgram(self.c4d.GetPathExecutable())
-		self.c4dProcess.setArguments(args)
-		self.c4dProcessArgs = args
-
-		_, processPID = self.c4dProcess.startDetached()
-		self.SetC4DProcessPIDStatus(processPID)
-	
-	def _killC4D(self, silent: bool = False):
-		if self.GetC4DProcessPIDStatus() > 0 and WinUtils.IsPIDExisting(self.GetC4DProcessPIDStatus()):
-			WinUtils.KillProcessByPID(self.GetC4DProcessPIDStatus())
-			self.SetC4DProcessPIDStatus(-2, silent)
-
-	def _restartC4D(self):
-		self._killC4D(True) # silent here, to not emit signal twice (getting 'RuntimeError: wrapped C/C++ object of type C4DTile has been deleted' o/w)
-		self.c4dProcessRestartTime.start()
+		if action := self.parentTilesWidget.GetC4DClickAction(self.c4d, evt.button(), evt.modifiers()):
+			action()
 
-	# pidStatus: 0 - not yet started this session, -1 - started but was closed, -2 - started but was killed
-	# silent: if True doesn't emit c4dStatusChanged signal
-	def SetC4DProcessPIDStatus(self, pidStatus: int, silent: bool = False):
-		if c4dCacheInfo := self.GetCacheInfo():
-			oldPIDStatus: int = c4dCacheInfo.processStatus
-			c4dCacheInfo.processStatus = pidStatus
-			if not silent and pidStatus != oldPIDStatus:
-				self.c4dStatusChanged.emit(pidStatus)
+	# Same c4d was found again (e.g. by a rescan), tile is kept and shows the new info
+	def SetC4D(self, c4d: C4DInfo):
+		self.c4d = c4d
+		self.updateUI()
 
 	def GetC4DProcessPIDStatus(self) -> int:
 		if c4dCacheInfo := self.GetCacheInfo():
@@ -301,36 +237,42 @@ class C4DTile(QFrame):
 		return 0
 
 	def UpdateC4DStatusColor(self):
-		statusColorMap: dict[int, str] = {
-			0: '#cccccc', # not yet started, gray
-			-2: '#ff0000', # started, but was killed, red
-			-1: '#0077ff', # was running, but not there anymore -> blue
-			1: '#00ff00', # started, running, green
-		}
-		c4dPIDStatus: int = self.GetC4DProcessPIDStatus()
-		return self.c4dProcessStatusLabel.setStyleSheet(f'background-color: {statusColorMap[min(c4dPIDStatus, 1)]};')
+		statusColor: str = C4DTile.STATUS_COLORS[min(self.GetC4DProcessPIDStatus(), 1)]
+		if statusColor == self.statusColor: # restyling isn't for free, it's called for every reused tile
+			return
+		self.statusColor = statusColor
+		self.c4dProcessStatusLabel.setStyleSheet(f'background-color: {statusColor};')
 	
 	def UpdateC4DIconImageSource(self):
-		self.picLabel.setPixmap(self.LoadC4DIcon())
+		pixmap: QPixmap = self.LoadC4DIcon()
+		if pixmap.cacheKey() == self.iconCacheKey:
+			return
+		self.iconCacheKey = pixmap.cacheKey()
+		self.picLabel.setPixmap(pixmap)
 
 	def updateUI(self):
 		self.UpdateC4DIconImageSource()
 
-		self.versLabel.setText(self.c4d.GetVersionString())
+		self.versLabel.setText(self.c4d.GetVersionString() + (' (zip)' if self.c4d.archived else ''))
 
 		# Adjust C4D Foldername
-		if self.GetPreference('appearance_c4dtile-adjust-c4d-folder-name'):
-			self.folderLabel.setText(self._getAdjustedC4DFolderName())
-		else:
-			self.folderLabel.setText(self.c4d.GetNameFolderRoot()[:C4DTile.RAWFOLDERNAME_MAXLEN])
+		self.folderLabel.setText(C4DTile.GetFolderLabelText(self.c4d, self.GetPreference('appearance_c4dtile-adjust-c4d-folder-name')))
 		
 		# Timestamp
 		self.timestampLabel.setVisible(self.GetPreference('appearance_c4dtile-show-timestamp'))
 		try: # user format can be invalid or intermediately invalid
-			self.timestampLabel.setText(GetFolderTimestampCreated(self.c4d.GetPathFolderRoot()).strftime(self.GetPreference('appearance_c4dtile-timestamp-format')))
+			self.timestampLabel.setText(self.c4d.GetDatetimeCreated().strftime(self.GetPreference('appearance_c4dtile-timestamp-format')))
 		except:
 			pass
 
+		# Disk usage, shows up once calculated in background
+		self._updateSizeLabel()
+
+		# Identical copies of this build in other places
+		duplicates: list[C4DInfo] = self.GetDuplicates()
+		self.duplicatesLabel.setVisible(bool(duplicates))
+		self.duplicatesLabel.setText('\n'.join([f'+{len(duplicates)} identical cop{"y" if len(duplicates) == 1 else "ies"}:'] + C4DTile.GetDuplicatesLocations(duplicates)))
+
 		# TODO: tags widget isn't handled for now
 
 		# Note line
@@ -340,91 +282,31 @@ class C4DTile(QFrame):
 				noteText = ci.note.splitlines()[0]
 			self.noteLabel.setVisible(self.GetPreference('appearance_c4dtile-show-note') and bool(noteText))
 			self.noteLabel.setText(noteText)
-		
-		self.setToolTip(self._createTooltipMenuString())
 
 		self.UpdateC4DStatusColor()
 	
-	def _activateC4D(self):
-		hwnds = WinUtils.getHWNDsForPID(self.GetC4DProcessPIDStatus())
-		c4dMainWindowRE = re.compile(f'^Cinema 4D {self.c4d.GetVersionString()} *')
-		mainWindowHWNDs = [hwnd for hwnd in hwnds if c4dMainWindowRE.match(WinUtils.getWindowTitleByHandle(hwnd))]
-		if len(mainWindowHWNDs) != 1:
-			return
-		hwnd: int = mainWindowHWNDs[0]
-		if WinUtils.isWindowMinimized(hwnd):
-			WinUtils.maximizeWindow(hwnd)
-		WinUtils.setWindowForeground(hwnd)
-
-	def _setNote(self, text: str):
-		ci: C4DCacheInfo = self.GetCacheInfo()
-		if ci is None: return
-		ci.note = text
-		self.updateUI()
+	def _updateSizeLabel(self):
+		size, sizePrefs = self.GetDiskUsage()
+		self.sizeLabel.setVisible(bool(self.GetPreference('appearance_c4dtile-show-size')) and size is not None)
+		if size is not None:
+			self.sizeLabel.setText(FormatSize(size) + (f' (+{FormatSize(sizePrefs)} prefs)' if sizePrefs else ''))
 
-	def _openNoteEditor(self):
-		ci: C4DCacheInfo = self.GetCacheInfo()
-		dlg: NoteEditorDialog = NoteEditorDialog(f'Edit note for {self.c4d.GetNameFolderRoot()}', ci.note if ci else '', self)
-		dlg.setMinimumSize(400, 200)
-		if dlg.exec_() == QDialog.Accepted:
-			self._setNote(dlg.GetNoteText())
+	# Only size related parts are updated, as sizes keep coming from background
+	def UpdateDiskUsageUI(self):
+		self._updateSizeLabel()
 
 	def _createTooltipMenuString(self):
-		ci: C4DCacheInfo = self.GetCacheInfo()
-		c4dNote: str = ci.note if ci else ''
-		tDt: dt.datetime = GetFolderTimestampCreated(self.c4d.GetPathFolderRoot())
-		dtFormat: str = self.GetPreference('appearance_c4dtile-timestamp-format')
-		try:
-			dt.datetime.now().strftime(dtFormat)
-		except:
-			dtFormat = '%d-%m-%Y %H:%M'
-		return f'{self.c4d.GetPathFolderRoot()}'\
-			 + f'\nBuild: {self.c4d.build}'\
-			 + f'\nCreated {tDt.strftime(dtFormat)}'\
-			+ (f'\nNote: {c4dNote}' if c4dNote else '')
-	
-	def _addActions(self):
-		self.actionRunC4D = QAction('Run C4D')
-		self.actionRunC4D.triggered.connect(lambda: self._runC4D())
-
-		self.actionRunC4DConsole = QAction('Run C4D w/console')
-		self.actionRunC4DConsole.triggered.connect(lambda: self._runC4D(['g_console=true']))
+		return self.parentTilesWidget.CreateTooltipString(self.c4d) if self.parentTilesWidget else self.c4d.GetPathFolderRoot()
 
-		self.actionActivateC4D = QAction('Activate C4D') # https://stackoverflow.com/questions/2090464/python-window-activation
-		self.actionActivateC4D.triggered.connect(self._activateC4D)
-
-		self.actionKillC4D = QAction('Kill C4D')
-		self.actionKillC4D.triggered.connect(self._killC4D)
-
-		self.actionRestartC4D = QAction('Restart C4D')
-		self.actionRestartC4D.triggered.connect(self._restartC4D)
-		
-		self.actionOpenFolder = QAction('Open folder')
-		self.actionOpenFolder.triggered.connect(lambda: OpenFolderInDefaultExplorer(self.c4d.GetPathFolderRoot()))
-		
-		self.actionOpenFolderPrefs = QAction('Open folder prefs')
-		self.actionOpenFolderPrefs.triggered.connect(lambda: OpenFolderInDefaultExplorer(self.c4d.GetPathFolderPrefs()))
-		self.actionOpenFolderPrefs.setEnabled(bool(self.c4d.GetPathFolderPrefs()))
-			
-		self.actionEditNote = QAction('Edit note')
-		self.actionEditNote.triggered.connect(self._openNoteEditor)
+	# Tooltip is only built when it's about to be shown, it's never needed for most of the tiles
+	def event(self, evt: QEvent) -> bool:
+		if evt.type() == QEvent.ToolTip:
+			QToolTip.showText(evt.globalPos(), self._createTooltipMenuString(), self)
+			return True
+		return super().event(evt)
 
 	def _contextMenuRequested(self):
-		menu = QtWidgets.QMenu()
-
-		menu.addAction(self.actionRunC4D)
-		menu.addAction(self.actionRunC4DConsole)
-		menu.addSeparator()
-		menu.addAction(self.actionActivateC4D)
-		menu.addAction(self.actionRestartC4D)
-		menu.addAction(self.actionKillC4D)
-		menu.addSeparator()
-		menu.addAction(self.actionOpenFolder)
-		menu.addAction(self.actionOpenFolderPrefs)
-		menu.addSeparator()
-		menu.addAction(self.actionEditNote)
-
-		menu.exec_(QtGui.QCursor.pos())
+		self.parentTilesWidget.ShowC4DContextMenu(self.c4d, self)
 
 	# def _emitStatusBarSignal(self, modifiers: Qt.KeyboardModifiers | None = None):
 	# 	# if not self.picLabel.underMouse(): return
@@ -480,6 +362,14 @@ class C4DTile(QFrame):
 	def GetCacheInfo(self) -> C4DCacheInfo | None:
 		return self.parentTilesWidget.GetCacheInfo(self.c4d.directory) if self.parentTilesWidget else None
 
+	# Other found c4ds with the same content fingerprint
+	def GetDuplicates(self) -> list[C4DInfo]:
+		return self.parentTilesWidget.GetDuplicates(self.c4d) if self.parentTilesWidget else list()
+
+	# <size of c4d folder, size of prefs folder>, None if not calculated yet
+	def GetDiskUsage(self) -> tuple[int | None, int | None]:
+		return self.parentTilesWidget.GetDiskUsage(self.c4d) if self.parentTilesWidget else (None, None)
+
 	def _rebuildTagsWidget(self):
 		tagsWidgetNew = self._createTagsSectionWidget()
 		self.layout().replaceWidget(self.tagsWidget, tagsWidgetNew)
@@ -508,8 +398,11 @@ class C4DTile(QFrame):
 
 class C4DTilesWidget(QScrollArea):
 	CACHE_FILENAME = 'cache.json'
+	C4D_RESTART_DELAY_MSEC: int = 500
 	
 	c4dStatusChanged = pyqtSignal(C4DInfo, int)
+	c4dExtractRequested = pyqtSignal(C4DInfo)
+	c4dNoteChanged = pyqtSignal(C4DInfo)
 	mouseDoubleClickedSignal = pyqtSignal(QMouseEvent)
 
 	def __init__(self, parent: QWidget | None = None) -> None:
@@ -519,8 +412,17 @@ class C4DTilesWidget(QScrollArea):
 		self.c4dEntries: list[C4DInfo] = list() 				# 
 		self.c4dGroups: list[C4DTileGroup] = [C4DTileGroup()] 	# for visual purposes
 		self.c4dCacheInfo: dict[str, C4DCacheInfo] = dict() 	# mapping from c4d_directory to a C4DInfoCache
+		self.c4dDuplicates: dict[str, list[C4DInfo]] = dict() 	# fingerprint -> c4ds having it, only for fingerprints shared by several c4ds
+		self.c4dTiles: dict[str, list[C4DTile]] = dict() 		# c4d directory -> its tiles currently shown
+		self.c4dIcons: C4DIconsCache = C4DIconsCache() 			# icons shared by tiles and the grid
+		self.c4dActions: dict[str, QAction] = dict() 			# context menu actions shared by tiles and the grid, created on first use
+		self.c4dActionsMenu: QMenu | None = None
+		self.c4dActionsTarget: C4DInfo | None = None 			# c4d the context menu is shown for
+		self.c4dActionsParent: QWidget | None = None 			# tile or grid the context menu is shown on
+		self.rebuildPending: bool = False 						# tiles weren't created while the widget was hidden
 
 		self.groupLikeWidgets: list[QWidget] = list()
+		self.groupLikeWidgetsKeys: list[tuple] = list() 		# group widget keys, same order as groupLikeWidgets
 
 		self.setWidgetResizable(True)
 
@@ -551,6 +453,196 @@ class C4DTilesWidget(QScrollArea):
 	def GetCacheInfo(self, c4dDir: str) -> C4DCacheInfo | None:
 		return self.c4dCacheInfo[c4dDir] if c4dDir in self.c4dCacheInfo else None
 	
+	def GetDuplicates(self, c4d: C4DInfo) -> list[C4DInfo]:
+		return [dup for dup in self.c4dDuplicates.get(c4d.fingerprint, list()) if dup is not c4d] if c4d.fingerprint else list()
+
+	# Returns True if duplicates of any c4d have changed
+	def _updateDuplicates(self) -> bool:
+		byFingerprint: dict[str, list[C4DInfo]] = dict()
+		for c4d in self.c4dEntries:
+			if c4d.fingerprint:
+				byFingerprint.setdefault(c4d.fingerprint, list()).append(c4d)
+		duplicates: dict[str, list[C4DInfo]] = {fp: c4ds for fp, c4ds in byFingerprint.items() if len(c4ds) > 1}
+		changed: bool = duplicates.keys() != self.c4dDuplicates.keys() or any(len(c4ds) != len(self.c4dDuplicates[fp]) for fp, c4ds in duplicates.items())
+		self.c4dDuplicates = duplicates
+		return changed
+
+	def GetDiskUsage(self, c4d: C4DInfo) -> tuple[int | None, int | None]:
+		diskUsage: C4DDiskUsageCalculator = self.mainWindow.diskUsage
+		return diskUsage.GetSize(c4d.GetPathFolderRoot()), diskUsage.GetSize(c4d.GetPathFolderPrefs()) if c4d.GetPathFolderPrefs() else None
+
+	def UpdateC4DStatusUI(self, c4d: C4DInfo):
+		for tile in self.c4dTiles.get(c4d.directory, list()):
+			tile.UpdateC4DStatusColor()
+
+	# Moves the tile of the c4d between groups without touching other tiles, indices of the groups have to be updated already
+	def MoveC4DTile(self, c4d: C4DInfo, fromGrp: C4DTileGroup, toGrp: C4DTileGroup):
+		if len(self.groupLikeWidgets) != len(self.c4dGroups): # tiles aren't shown
+			return
+		fromWidget: QWidget = self.groupLikeWidgets[next(idx for idx, grp in enumerate(self.c4dGroups) if grp is fromGrp)]
+		toWidget: QWidget = self.groupLikeWidgets[next(idx for idx, grp in enumerate(self.c4dGroups) if grp is toGrp)]
+		tile: C4DTile | None = next((tile for tile in C4DTilesWidget._getGroupTiles(fromWidget) if tile.c4d is c4d), None)
+		if tile is None:
+			return self._updateWidget()
+		toTiles: list[C4DTile] = C4DTilesWidget._getGroupTiles(toWidget)
+		toTiles.insert([self.c4dEntries[idx] for idx in toGrp.indices].index(c4d), tile)
+		C4DTilesWidget._setGroupTiles(toWidget, toTiles)
+
+	# Updates tiles of the c4d, e.g. after it was changed in grid view
+	def UpdateC4DTilesUI(self, c4d: C4DInfo):
+		for tile in self.c4dTiles.get(c4d.directory, list()):
+			tile.updateUI()
+
+	# Size of the folder was calculated, updates tiles of c4ds it belongs to
+	def UpdateDiskUsageUI(self, path: str):
+		for tiles in self.c4dTiles.values():
+			for tile in tiles:
+				if path == tile.c4d.GetPathFolderRoot() or path == tile.c4d.GetPathFolderPrefs():
+					tile.UpdateDiskUsageUI()
+
+	def _getOrCreateCacheInfo(self, c4d: C4DInfo) -> C4DCacheInfo:
+		if c4d.directory not in self.c4dCacheInfo:
+			self.c4dCacheInfo[c4d.directory] = C4DCacheInfo()
+		return self.c4dCacheInfo[c4d.directory]
+
+	def RunC4D(self, c4d: C4DInfo, args: list[str] = []):
+		c4dCacheInfo: C4DCacheInfo = self._getOrCreateCacheInfo(c4d)
+		# https://forum.qt.io/topic/129701/qprocess-startdetached-but-the-child-process-closes-when-the-parent-exits/6
+		if c4dCacheInfo.processStatus > 0 and WinUtils.IsPIDExisting(c4dCacheInfo.processStatus):
+			QMessageBox.warning(self, c4d.directory, 'This Cinema 4D instance is already running..', QMessageBox.Ok)
+			return
+
+		c4dProcess: QProcess = QProcess()
+		c4dProcess.setProgram(c4d.GetPathExecutable())
+		c4dProcess.setArguments(args)
+		c4dCacheInfo.processArgs = args
+
+		_, processPID = c4dProcess.startDetached()
+		self._setC4DProcessStatus(c4d, processPID)
+
+	def KillC4D(self, c4d: C4DInfo, silent: bool = False):
+		c4dCacheInfo: C4DCacheInfo = self._getOrCreateCacheInfo(c4d)
+		if c4dCacheInfo.processStatus > 0 and WinUtils.IsPIDExisting(c4dCacheInfo.processStatus):
+			WinUtils.KillProcessByPID(c4dCacheInfo.processStatus)
+			self._setC4DProcessStatus(c4d, -2, silent)
+
+	def ActivateC4D(self, c4d: C4DInfo):
+		hwnds = WinUtils.getHWNDsForPID(self._getOrCreateCacheInfo(c4d).processStatus)
+		c4dMainWindowRE = re.compile(f'^Cinema 4D {c4d.GetVersionString()} *')
+		mainWindowHWNDs = [hwnd for hwnd in hwnds if c4dMainWindowRE.match(WinUtils.getWindowTitleByHandle(hwnd))]
+		if len(mainWindowHWNDs) != 1:
+			return
+		hwnd: int = mainWindowHWNDs[0]
+		if WinUtils.isWindowMinimized(hwnd):
+			WinUtils.maximizeWindow(hwnd)
+		WinUtils.setWindowForeground(hwnd)
+
+	# Runs c4d again with the arguments it was run with last time
+	def RestartC4D(self, c4d: C4DInfo):
+		self.KillC4D(c4d, True) # silent here, to not emit signal twice
+		QTimer.singleShot(C4DTilesWidget.C4D_RESTART_DELAY_MSEC, partial(self.RunC4D, c4d, self._getOrCreateCacheInfo(c4d).processArgs))
+
+	# Action for clicking c4d icon on tile or grid item, None if the click does nothing
+	def GetC4DClickAction(self, c4d: C4DInfo, button: Qt.MouseButton, modifiers: Qt.KeyboardModifiers) -> Callable[[], None] | None:
+		if button == Qt.LeftButton:
+			if c4d.archived: # has to be extracted first
+				return partial(self.c4dExtractRequested.emit, c4d) if not modifiers else None
+			if modifiers & Qt.KeyboardModifier.ControlModifier:
+				if modifiers & Qt.KeyboardModifier.ShiftModifier: 			# Ctrl+Shift+LClick
+					return partial(self.RestartC4D, c4d)
+				return partial(self.RunC4D, c4d, ['g_console=true']) 		# Ctrl+LClick
+			if modifiers & Qt.KeyboardModifier.ShiftModifier: 				# Shift+LClick
+				return partial(self.KillC4D, c4d)
+			return partial(self.RunC4D, c4d) 								# LClick
+		if button == Qt.MiddleButton:
+			if modifiers & Qt.KeyboardModifier.ControlModifier: 			# Ctrl+MClick
+				return partial(C4DTilesWidget.OpenC4DFolder, c4d)
+			if modifiers & Qt.KeyboardModifier.ShiftModifier: 				# Shift+MClick
+				return partial(OpenFolderInDefaultExplorer, c4d.GetPathFolderPrefs()) if c4d.GetPathFolderPrefs() else None
+			return partial(self.ActivateC4D, c4d) if not c4d.archived else None # MClick
+		return None
+
+	@staticmethod
+	def OpenC4DFolder(c4d: C4DInfo):
+		if c4d.archived:
+			return ShowFileInDefaultExplorer(c4d.GetPathFolderRoot())
+		OpenFolderInDefaultExplorer(c4d.GetPathFolderRoot())
+
+	def EditC4DNote(self, c4d: C4DInfo, parent: QWidget | None = None):
+		ci: C4DCacheInfo = self._getOrCreateCacheInfo(c4d)
+		dlg: NoteEditorDialog = NoteEditorDialog(f'Edit note for {c4d.GetNameFolderRoot()}', ci.note, parent if parent else self)
+		dlg.setMinimumSize(400, 200)
+		if dlg.exec_() == QDialog.Accepted:
+			ci.note = dlg.GetNoteText()
+			self.UpdateC4DTilesUI(c4d)
+			self.c4dNoteChanged.emit(c4d)
+
+	# One set of actions serves context menus of all c4ds, they act on c4dActionsTarget
+	def _getC4DActionsMenu(self) -> QMenu:
+		if self.c4dActionsMenu is not None:
+			return self.c4dActionsMenu
+		self.c4dActionsMenu = QMenu(self)
+		def addAction(key: str, text: str, callback: Callable[[C4DInfo], None]):
+			action: QAction = self.c4dActionsMenu.addAction(text)
+			action.triggered.connect(lambda: callback(self.c4dActionsTarget) if self.c4dActionsTarget else None)
+			self.c4dActions[key] = action
+
+		addAction('extract', 'Extract archive', self.c4dExtractRequested.emit)
+		self.c4dActionsMenu.addSeparator() # leading separator is collapsed if there's nothing to extract
+		addAction('run', 'Run C4D', self.RunC4D)
+		addAction('run-console', 'Run C4D w/console', lambda c4d: self.RunC4D(c4d, ['g_console=true']))
+		self.c4dActionsMenu.addSeparator()
+		addAction('activate', 'Activate C4D', self.ActivateC4D) # https://stackoverflow.com/questions/2090464/python-window-activation
+		addAction('restart', 'Restart C4D', self.RestartC4D)
+		addAction('kill', 'Kill C4D', self.KillC4D)
+		self.c4dActionsMenu.addSeparator()
+		addAction('open-folder', 'Open folder', C4DTilesWidget.OpenC4DFolder)
+		addAction('open-folder-prefs', 'Open folder prefs', lambda c4d: OpenFolderInDefaultExplorer(c4d.GetPathFolderPrefs()))
+		self.c4dActionsMenu.addSeparator()
+		addAction('edit-note', 'Edit note', lambda c4d: self.EditC4DNote(c4d, self.c4dActionsParent))
+		return self.c4dActionsMenu
+
+	def ShowC4DContextMenu(self, c4d: C4DInfo, parent: QWidget | None = None):
+		menu: QMenu = self._getC4DActionsMenu()
+		self.c4dActions['extract'].setVisible(c4d.archived)
+		for key in ('run', 'run-console', 'activate', 'restart', 'kill'):
+			self.c4dActions[key].setEnabled(not c4d.archived) # has to be extracted first
+		self.c4dActions['open-folder'].setText('Show archive' if c4d.archived else 'Open folder')
+		self.c4dActions['open-folder-prefs'].setEnabled(bool(c4d.GetPathFolderPrefs()))
+
+		self.c4dActionsTarget, self.c4dActionsParent = c4d, parent
+		menu.exec_(QCursor.pos())
+		self.c4dActionsTarget, self.c4dActionsParent = None, None
+
+	# pidStatus: 0 - not yet started this session, -1 - started but was closed, -2 - started but was killed
+	# silent: if True doesn't emit c4dStatusChanged signal
+	def _setC4DProcessStatus(self, c4d: C4DInfo, pidStatus: int, silent: bool = False):
+		c4dCacheInfo: C4DCacheInfo = self._getOrCreateCacheInfo(c4d)
+		oldPIDStatus: int = c4dCacheInfo.processStatus
+		c4dCacheInfo.processStatus = pidStatus
+		if not silent and pidStatus != oldPIDStatus:
+			self.c4dStatusChanged.emit(c4d, pidStatus)
+
+	# Tooltip of c4d tile or grid item
+	def CreateTooltipString(self, c4d: C4DInfo) -> str:
+		ci: C4DCacheInfo = self.GetCacheInfo(c4d.directory)
+		c4dNote: str = ci.note if ci else ''
+		tDt: dt.datetime = c4d.GetDatetimeCreated()
+		dtFormat: str = self.GetPreference('appearance_c4dtile-timestamp-format')
+		try:
+			dt.datetime.now().strftime(dtFormat)
+		except:
+			dtFormat = '%d-%m-%Y %H:%M'
+		duplicates: list[C4DInfo] = self.GetDuplicates(c4d)
+		size, sizePrefs = self.GetDiskUsage(c4d)
+		return f'{c4d.GetPathFolderRoot()}'\
+			 + f'\nBuild: {c4d.build}'\
+			 + f'\nCreated {tDt.strftime(dtFormat)}'\
+			+ (f'\nSize: {FormatSize(size)}' if size is not None else '')\
+			+ (f'\nPrefs size: {FormatSize(sizePrefs)}' if sizePrefs is not None else '')\
+			+ (f'\nNote: {c4dNote}' if c4dNote else '')\
+			+ (f'\nIdentical copies:\n' + '\n'.join(dup.GetPathFolderRoot() for dup in duplicates) if duplicates else '')
+
 	def GetTagBindings(self) -> dict[str, list[str]]:
 		return {c4d: ci.tagUuids for c4d, ci in self.c4dCacheInfo.items()}
 	
@@ -593,59 +685,186 @@ class C4DTilesWidget(QScrollArea):
 	
 	def updateTiles(self, c4ds: list[C4DInfo], grouping: list[C4DTileGroup] | None = None):
 		self.c4dEntries = c4ds
+		duplicatesChanged: bool = self._updateDuplicates()
 		if grouping is not None:
 			self.c4dGroups = grouping
 		if not len(self.c4dGroups):
 			self.c4dGroups = [C4DTileGroup()]
-		self._rebuildWidget()
-
-	def _rebuildWidget(self):
-		if self.widget(): self.widget().deleteLater()
-
-		groupsLayout: QVBoxLayout = QVBoxLayout()
-		centralWidget: QWidget = QWidget(self)
-		centralWidget.setLayout(groupsLayout)
-		centralWidget.setMinimumWidth(100)
-		self.setWidget(centralWidget)
-
-		self.groupLikeWidgets.clear()
-		# Populate
-		for grp in self.c4dGroups:
-			innerGroupLayout: FlowLayout = FlowLayout()
-			indices = grp.indices
-			if not len(indices): indices = [i for i in range(len(self.c4dEntries))]
-			for idx in indices:
-				c4dinfo: C4DInfo = self.c4dEntries[idx]
-				if c4dinfo.directory not in self.c4dCacheInfo:
-					self.c4dCacheInfo[c4dinfo.directory] = C4DCacheInfo()
-				tileWidget: C4DTile = C4DTile(c4dinfo, self)
-				tileWidget.c4dStatusChanged.connect(partial(lambda info, status: self.c4dStatusChanged.emit(info, status), c4dinfo)) # inform main window if c4dtile reported c4d status change
-				innerGroupLayout.addWidget(tileWidget)
-
-			grouplikeWidget: QWidget
-			
-			# 			main widget 							either group or dummy container 				container for hiding content 			c4d tile
-			# (QWidget)centralWidget{QVBoxLayout} => (QWidget | QGroupBox)grouplikeLayout{QHBoxLayout} => (QWidget)innerGroupWidget{FlowLayout} => (C4DTile)tileWidget
-			innerGroupWidget: QWidget = QWidget()
-			innerGroupWidget.setLayout(innerGroupLayout)
-
-			createGroup: bool = len(grp.name)
-			if createGroup:
-				grouplikeWidget = QGroupBox(grp.name)
-				grouplikeWidget.setCheckable(True) # https://stackoverflow.com/questions/55977559/changing-qgroupbox-checkbox-visual-to-an-expander
-				grouplikeWidget.clicked.connect(partial(C4DTilesWidget.SetWidgetVisible, innerGroupWidget))
+		self._updateWidget()
+		if duplicatesChanged: # reused tiles show how many copies they have
+			self.UpdateTilesUI()
+
+	# Same as updateTiles(), but for the case when c4ds only got new entries appended (e.g. streamed from a running scan).
+	# If groups stay the same and existing tiles keep their places, only tiles for new entries are created,
+	# otherwise tiles are reconciled by updateTiles()
+	def appendTiles(self, c4ds: list[C4DInfo], grouping: list[C4DTileGroup] | None = None):
+		newGroups: list[C4DTileGroup] = grouping if grouping else [C4DTileGroup()]
+		if not self._canAppendTiles(c4ds, newGroups):
+			return self.updateTiles(c4ds, grouping)
+
+		oldCount: int = len(self.c4dEntries)
+		self.c4dEntries = c4ds
+		if self._updateDuplicates(): # existing tiles show how many copies they have
+			self.UpdateTilesUI()
+		for grpIdx, (oldGrp, newGrp) in enumerate(zip(self.c4dGroups, newGroups)):
+			oldIndices: list[int] = oldGrp.indices if len(oldGrp.indices) else list(range(oldCount))
+			newIndices: list[int] = newGrp.indices if len(newGrp.indices) else list(range(len(c4ds)))
+			innerGroupLayout: QLayout = self.groupLikeWidgets[grpIdx].layout().itemAt(0).widget().layout()
+			for idx in newIndices[len(oldIndices):]:
+				tile: C4DTile = self._createTile(c4ds[idx])
+				self.c4dTiles.setdefault(c4ds[idx].directory, list()).append(tile)
+				innerGroupLayout.addWidget(tile)
+		self.c4dGroups = newGroups
+
+	def _canAppendTiles(self, c4ds: list[C4DInfo], newGroups: list[C4DTileGroup]) -> bool:
+		if len(self.groupLikeWidgets) != len(self.c4dGroups) or len(self.c4dGroups) != len(newGroups):
+			return False
+		oldCount: int = len(self.c4dEntries)
+		if len(c4ds) < oldCount or any(a is not b for a, b in zip(self.c4dEntries, c4ds)):
+			return False
+		for oldGrp, newGrp in zip(self.c4dGroups, newGroups):
+			if oldGrp.kind != newGrp.kind or oldGrp.key != newGrp.key or oldGrp.name != newGrp.name:
+				return False
+			oldIndices: list[int] = oldGrp.indices if len(oldGrp.indices) else list(range(oldCount))
+			newIndices: list[int] = newGrp.indices if len(newGrp.indices) else list(range(len(c4ds)))
+			if newIndices[:len(oldIndices)] != oldIndices:
+				return False
+		return True
+
+	def _createTile(self, c4dinfo: C4DInfo) -> C4DTile:
+		self._getOrCreateCacheInfo(c4dinfo)
+		tileWidget: C4DTile = C4DTile(c4dinfo, self)
+		return tileWidget
+
+	# Brings widgets in line with c4dEntries and c4dGroups. Group widgets are matched by group key and tiles by c4d directory,
+	# so only tiles and groups that aren't shown yet are created, tiles of c4ds that aren't shown anymore are destroyed and
+	# the rest is only moved if their order or group has changed
+	def _updateWidget(self):
+		self.rebuildPending = not self.isVisible()
+		if self.rebuildPending: # grid view is shown instead (or the window is hidden), tiles are created once shown
+			if self.widget(): self.takeWidget().deleteLater()
+			self.groupLikeWidgets.clear()
+			self.groupLikeWidgetsKeys.clear()
+			self.c4dTiles.clear()
+			return
+
+		if not self.widget():
+			groupsLayout: QVBoxLayout = QVBoxLayout()
+			groupsLayout.addStretch()
+			centralWidget: QWidget = QWidget(self)
+			centralWidget.setLayout(groupsLayout)
+			centralWidget.setMinimumWidth(100)
+			self.setWidget(centralWidget)
+
+		# Groups
+		oldGroupWidgets: dict[tuple, QWidget] = dict(zip(self.groupLikeWidgetsKeys, self.groupLikeWidgets))
+		newKeys: list[tuple] = [C4DTilesWidget._getGroupWidgetKey(grp) for grp in self.c4dGroups]
+		groupWidgets: list[QWidget] = list()
+		oldGroupTiles: list[dict[str, C4DTile]] = list() # tiles of reused group widgets, same order as groupWidgets
+		for grp, key in zip(self.c4dGroups, newKeys):
+			if (grouplikeWidget := oldGroupWidgets.pop(key, None)) is not None:
+				if isinstance(grouplikeWidget, QGroupBox) and grouplikeWidget.title() != grp.name:
+					grouplikeWidget.setTitle(grp.name)
+				oldGroupTiles.append({tile.c4d.directory: tile for tile in C4DTilesWidget._getGroupTiles(grouplikeWidget)})
 			else:
-				grouplikeWidget = QWidget()
+				grouplikeWidget = self._createGroupLikeWidget(grp)
+				oldGroupTiles.append(dict())
+			groupWidgets.append(grouplikeWidget)
+
+		# Tiles that aren't needed in their group anymore can be moved to another one
+		groupEntries: list[list[C4DInfo]] = [[self.c4dEntries[idx] for idx in grp.indices] if len(grp.indices) else list(self.c4dEntries) for grp in self.c4dGroups]
+		spareTiles: dict[str, list[C4DTile]] = dict() # c4d directory -> tiles
+		for tiles, c4ds in zip(oldGroupTiles, groupEntries):
+			shownDirs: set[str] = set(c4d.directory for c4d in c4ds)
+			for c4dDir in [c4dDir for c4dDir in tiles.keys() if c4dDir not in shownDirs]:
+				spareTiles.setdefault(c4dDir, list()).append(tiles.pop(c4dDir))
+		for grouplikeWidget in oldGroupWidgets.values():
+			for tile in C4DTilesWidget._getGroupTiles(grouplikeWidget):
+				spareTiles.setdefault(tile.c4d.directory, list()).append(tile)
+
+		self.c4dTiles.clear()
+		for grouplikeWidget, tiles, c4ds in zip(groupWidgets, oldGroupTiles, groupEntries):
+			orderedTiles: list[C4DTile] = list()
+			for c4d in c4ds:
+				tile: C4DTile | None = tiles.pop(c4d.directory, None)
+				if tile is None and spareTiles.get(c4d.directory):
+					tile = spareTiles[c4d.directory].pop()
+				if tile is None:
+					tile = self._createTile(c4d)
+				elif tile.c4d is not c4d: # found again by a scan
+					tile.SetC4D(c4d)
+				else:
+					tile.UpdateC4DStatusColor()
+				orderedTiles.append(tile)
+				self.c4dTiles.setdefault(c4d.directory, list()).append(tile)
+			C4DTilesWidget._setGroupTiles(grouplikeWidget, orderedTiles)
+
+		for tiles in spareTiles.values():
+			for tile in tiles:
+				tile.hide()
+				tile.deleteLater()
+		for grouplikeWidget in oldGroupWidgets.values():
+			grouplikeWidget.hide()
+			grouplikeWidget.deleteLater()
+
+		# Group widgets order
+		groupsLayout: QVBoxLayout = self.widget().layout()
+		if len(groupWidgets) != len(self.groupLikeWidgets) or any(a is not b for a, b in zip(groupWidgets, self.groupLikeWidgets)):
+			for grouplikeWidget in self.groupLikeWidgets:
+				groupsLayout.removeWidget(grouplikeWidget)
+			for idx, grouplikeWidget in enumerate(groupWidgets):
+				groupsLayout.insertWidget(idx, grouplikeWidget) # before the stretch
+		self.groupLikeWidgets = groupWidgets
+		self.groupLikeWidgetsKeys = newKeys
+
+	# Group widgets are reused for groups with the same key, named and unnamed groups have different widgets
+	@staticmethod
+	def _getGroupWidgetKey(grp: C4DTileGroup) -> tuple:
+		return (grp.kind, grp.key, bool(grp.name))
+
+	def _createGroupLikeWidget(self, grp: C4DTileGroup) -> QWidget:
+		grouplikeWidget: QWidget
+
+		# 			main widget 							either group or dummy container 				container for hiding content 			c4d tile
+		# (QWidget)centralWidget{QVBoxLayout} => (QWidget | QGroupBox)grouplikeLayout{QHBoxLayout} => (QWidget)innerGroupWidget{FlowLayout} => (C4DTile)tileWidget
+		innerGroupWidget: QWidget = QWidget()
+		innerGroupWidget.setLayout(FlowLayout())
+
+		createGroup: bool = len(grp.name)
+		if createGroup:
+			grouplikeWidget = QGroupBox(grp.name)
+			grouplikeWidget.setCheckable(True) # https://stackoverflow.com/questions/55977559/changing-qgroupbox-checkbox-visual-to-an-expander
+			grouplikeWidget.clicked.connect(partial(C4DTilesWidget.SetWidgetVisible, innerGroupWidget))
+		else:
+			grouplikeWidget = QWidget()
 
-			grouplikeLayout: QHBoxLayout = QHBoxLayout()
-			grouplikeWidget.setLayout(grouplikeLayout)
-			grouplikeLayout.addWidget(innerGroupWidget)
+		grouplikeLayout: QHBoxLayout = QHBoxLayout()
+		grouplikeWidget.setLayout(grouplikeLayout)
+		grouplikeLayout.addWidget(innerGroupWidget)
 
-			grouplikeWidget.setFont(QFont(APPLICATION_FONT_FAMILY, 10))
-			groupsLayout.addWidget(grouplikeWidget)
-			self.groupLikeWidgets.append(grouplikeWidget)
-		
-		groupsLayout.addStretch()
+		grouplikeWidget.setFont(QFont(APPLICATION_FONT_FAMILY, 10))
+		return grouplikeWidget
+
+	@staticmethod
+	def _getGroupTiles(grouplikeWidget: QWidget) -> list[C4DTile]:
+		innerGroupLayout: QLayout = grouplikeWidget.layout().itemAt(0).widget().layout()
+		return [innerGroupLayout.itemAt(idx).widget() for idx in range(innerGroupLayout.count())]
+
+	# Layout is only touched if the order differs, tiles from other groups are moved in
+	@staticmethod
+	def _setGroupTiles(grouplikeWidget: QWidget, tiles: list[C4DTile]):
+		innerGroupWidget: QWidget = grouplikeWidget.layout().itemAt(0).widget()
+		innerGroupLayout: QLayout = innerGroupWidget.layout()
+		currentTiles: list[C4DTile] = C4DTilesWidget._getGroupTiles(grouplikeWidget)
+		if len(currentTiles) == len(tiles) and all(a is b for a, b in zip(currentTiles, tiles)):
+			return
+		while innerGroupLayout.count():
+			innerGroupLayout.takeAt(0)
+		for tile in tiles:
+			if (parentWidget := tile.parentWidget()) is not innerGroupWidget and parentWidget and parentWidget.layout():
+				parentWidget.layout().removeWidget(tile)
+			innerGroupLayout.addWidget(tile)
+		innerGroupLayout.invalidate()
 	
 	# on timer tick check if there're any running c4d instance closed, inform mainwindow about that through c4dStatusChanged signal
 	def _onC4DProcessStatusTimerTimeout(self):
@@ -659,13 +878,28 @@ class C4DTilesWidget(QScrollArea):
 			self.c4dStatusChanged.emit(c4dInfo, c4dCacheInfo.processStatus) # TODO: not threadsafe when running on timer callback!!!
 	
 	def _tagRemoveFromAll(self, tag: C4DTag):
+		affectedDirs: list[str] = [c4dDir for c4dDir, c4dCacheInfo in self.c4dCacheInfo.items() if tag.uuid in c4dCacheInfo.tagUuids]
 		for c4dCacheInfo in self.c4dCacheInfo.values():
 			if tag.uuid in c4dCacheInfo.tagUuids:
 				c4dCacheInfo.tagUuids.remove(tag.uuid)
-		self._rebuildWidget()
+		self._rebuildTagsWidgets(affectedDirs)
+
+	# Tag was renamed or recolored, only tiles having it are updated
+	def UpdateTagWidgets(self, tag: C4DTag):
+		self._rebuildTagsWidgets([c4dDir for c4dDir, c4dCacheInfo in self.c4dCacheInfo.items() if tag.uuid in c4dCacheInfo.tagUuids])
+
+	def _rebuildTagsWidgets(self, c4dDirs: list[str]):
+		for c4dDir in c4dDirs:
+			for tile in self.c4dTiles.get(c4dDir, list()):
+				tile._rebuildTagsWidget()
 
 	def mouseDoubleClickEvent(self, evt: QMouseEvent):
 		self.mouseDoubleClickedSignal.emit(evt)
+
+	def showEvent(self, evt: QShowEvent):
+		if self.rebuildPending:
+			self._updateWidget()
+		return super().showEvent(evt)
 	
 	def SaveCache(self):
 		saveFilePath: str = self.GetCacheSavePath()
@@ -679,7 +913,9 @@ class C4DTilesWidget(QScrollArea):
 		for c4dinfo in self.c4dEntries:
 			if c4dinfo.directory not in self.c4dCacheInfo:
 				self.c4dCacheInfo[c4dinfo.directory] = C4DCacheInfo()
-			cache[c4dinfo.directory] = self.c4dCacheInfo[c4dinfo.directory].ToJSON()
+		# entries that weren't found (yet) are kept until PruneCache() is called after a full scan
+		for c4dDir, c4dCacheInfo in self.c4dCacheInfo.items():
+			cache[c4dDir] = c4dCacheInfo.ToJSON()
 
 		with open(saveFilePath, 'w') as fp:
 			json.dump(storeDict, fp)
@@ -690,7 +926,7 @@ class C4DTilesWidget(QScrollArea):
 		if not os.path.isfile(loadFilePath):
 			return
 
-		knownC4DPaths: list[str] = [c4dinfo.directory for c4dinfo in self.c4dEntries]
+		# c4d entries are streamed in by the scan later on, so everything is loaded and unknown ones are dropped by PruneCache()
 		with open(loadFilePath, 'r') as fp:
 			data: dict = json.load(fp)
 			if 'version' in data:
@@ -698,11 +934,15 @@ class C4DTilesWidget(QScrollArea):
 			if 'cache' in data:
 				cache: dict[str, dict] = data['cache']
 				for c4d, c4dDict in cache.items():
-					if c4d not in knownC4DPaths:
-						print(f'Cache contains entry that is not found anymore! C4D Path: {c4d}')
-						continue
 					self.c4dCacheInfo[c4d]: C4DCacheInfo = C4DCacheInfo.FromJSON(c4dDict) if 'tagUuids' in c4dDict else C4DCacheInfo()
-		self._rebuildWidget()
+		self._updateWidget()
+
+	# Drops cached info of c4ds that are not found anymore, should be called once a full scan is finished
+	def PruneCache(self):
+		knownC4DPaths: set[str] = set(c4dinfo.directory for c4dinfo in self.c4dEntries)
+		for c4d in [c4d for c4d in self.c4dCacheInfo.keys() if c4d not in knownC4DPaths]:
+			print(f'Cache contains entry that is not found anymore! C4D Path: {c4d}')
+			del self.c4dCacheInfo[c4d]
 
 	
 	@staticmethod
@@ -11,11 +11,12 @@ from PyQt5.QtGui import (
 from PyQt5.QtWidgets import (
 	QLabel, QMainWindow, QDialog, QHBoxLayout, QListWidget, QWidget, QVBoxLayout, QPushButton,
 	QListWidgetItem, QStackedWidget, QFileDialog, QLayout, QAbstractItemView, QFormLayout,
-	QCheckBox, QSlider, QSizePolicy, QGroupBox, QShortcut, QMessageBox, QComboBox, QLineEdit
+	QCheckBox, QSlider, QSizePolicy, QGroupBox, QShortcut, QMessageBox, QComboBox, QLineEdit, QSpinBox
 )
 
 from version import *
 from utils import *
+from scanner import SCANNER_MAX_DEPTH, SCANNER_MAX_WORKERS, SCANNER_MAX_WORKERS_PER_ROOT, SCANNER_ROOT_TIMEOUT_SEC, C4DScanRules
 
 class StorablePreference:
 	def __init__(self, getter, setter, default = None) -> None:
@@ -33,7 +34,7 @@ class StorablePreference:
 		return self.Set(self.default)
 
 class PreferencesWindow(QMainWindow):
-	PREFERENCES_FILENAME = 'preferences.json'
+	PREFERENCES_FILENAME = PREFERENCES_FILENAME
 
 	preferenceChangedSignal = pyqtSignal(str) # key of changed preference
 
@@ -116,6 +117,7 @@ class PreferencesWindow(QMainWindow):
 	def _connectPreferenceSimple(self, attr: str, obj, default = None, onChangeSignal: pyqtSignal | None = None) -> bool:
 		if isinstance(obj, QCheckBox): return self._connectPreference(attr, obj.isChecked, obj.setChecked, default, obj.stateChanged)
 		if isinstance(obj, QSlider): return self._connectPreference(attr, obj.value, obj.setValue, default, obj.valueChanged)
+		if isinstance(obj, QSpinBox): return self._connectPreference(attr, obj.value, obj.setValue, default, obj.valueChanged)
 		if isinstance(obj, QComboBox): return self._connectPreference(attr, obj.currentIndex, obj.setCurrentIndex, default, obj.currentIndexChanged)
 		if isinstance(obj, QLineEdit): return self._connectPreference(attr, obj.text, obj.setText, default, obj.textChanged)
 		return False
@@ -176,19 +178,6 @@ class PreferencesWindow(QMainWindow):
 	def _createPrefGeneral(self):
 		SECTION_PREFIX = 'general_'
 
-		# # TODO: disabled until filter / sort / search isn't implemented
-		# # Search depth slider
-		# searchPathsDepthSlider: QSlider = QSlider(Qt.Horizontal)
-		# searchPathsDepthSlider.setMinimum(1)
-		# searchPathsDepthSlider.setMaximum(5)
-		# searchPathsDepthSlider.setSingleStep(1)
-		# # searchPathsDepthSlider.setValue(2)
-		# searchPathsDepthSlider.setTickPosition(QSlider.TicksBelow)
-		# searchPathsDepthSlider.setTickInterval(1)
-		# searchPathsDepthSlider.setDisabled(True)
-		# self._connectPreferenceSimple(f'{SECTION_PREFIX}search-depth', searchPathsDepthSlider, 2)
-		# layout.addRow(QLabel('Search depth'), searchPathsDepthSlider)
-		
 		# System
 		cbRunOnStartup: QPushButton = QPushButton('&Set up run on startup', self)
 		cbRunOnStartup.clicked.connect(self._setRunOnStartup)
@@ -202,6 +191,53 @@ class PreferencesWindow(QMainWindow):
 		grpbSystem: QGroupBox = QGroupBox('System', self)
 		grpbSystem.setLayout(systemLayout)
 
+		# Scanning
+		# Search depth slider
+		searchPathsDepthSlider: QSlider = QSlider(Qt.Horizontal)
+		searchPathsDepthSlider.setMinimum(1)
+		searchPathsDepthSlider.setMaximum(5)
+		searchPathsDepthSlider.setSingleStep(1)
+		searchPathsDepthSlider.setTickPosition(QSlider.TicksBelow)
+		searchPathsDepthSlider.setTickInterval(1)
+		searchPathsDepthSlider.setToolTip('How many folder levels below search paths are scanned for c4d packages')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}search-depth', searchPathsDepthSlider, SCANNER_MAX_DEPTH)
+
+		sbScanWorkers: QSpinBox = QSpinBox(self)
+		sbScanWorkers.setRange(1, 64)
+		sbScanWorkers.setToolTip('Maximum number of directories scanned at once')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}scan-workers', sbScanWorkers, SCANNER_MAX_WORKERS)
+		sbScanWorkersPerRoot: QSpinBox = QSpinBox(self)
+		sbScanWorkersPerRoot.setRange(1, 64)
+		sbScanWorkersPerRoot.setToolTip('Maximum number of directories scanned at once within a single search path')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}scan-workers-per-root', sbScanWorkersPerRoot, SCANNER_MAX_WORKERS_PER_ROOT)
+
+		sbScanRootTimeout: QSpinBox = QSpinBox(self)
+		sbScanRootTimeout.setRange(0, 3600)
+		sbScanRootTimeout.setSuffix(' s')
+		sbScanRootTimeout.setSpecialValueText('No timeout')
+		sbScanRootTimeout.setToolTip('Search path that isn\'t scanned within that time (e.g. offline network drive) is given up on and its last known c4d packages are shown')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}scan-root-timeout', sbScanRootTimeout, SCANNER_ROOT_TIMEOUT_SEC)
+
+		cbWatchSearchPaths: QCheckBox = QCheckBox('&Watch search paths for changes', self)
+		cbWatchSearchPaths.setToolTip('Picks up added and removed c4d packages without rescanning (network paths are polled)')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}watch-search-paths', cbWatchSearchPaths, True)
+
+		cbFingerprintCorelibs: QCheckBox = QCheckBox('&Compare corelibs content to detect duplicates', self)
+		cbFingerprintCorelibs.setToolTip('Copies of the same build are detected by build, version and executable size and date.\n'\
+								   + 'This also reads the beginning of the largest corelibs, which is slower, especially on network paths')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}fingerprint-corelibs', cbFingerprintCorelibs, False)
+
+		scanningLayout: QFormLayout = QFormLayout()
+		scanningLayout.addRow(cbWatchSearchPaths)
+		scanningLayout.addRow(cbFingerprintCorelibs)
+		scanningLayout.addRow('Search depth', searchPathsDepthSlider)
+		scanningLayout.addRow('Scan threads', sbScanWorkers)
+		scanningLayout.addRow('Scan threads per search path', sbScanWorkersPerRoot)
+		scanningLayout.addRow('Search path timeout', sbScanRootTimeout)
+
+		grpbScanning: QGroupBox = QGroupBox('Scanning', self)
+		grpbScanning.setLayout(scanningLayout)
+
 		# # Keyboard
 		# keyboardLayout: QFormLayout = QFormLayout()
 		# leGlobalShortcut: QLineEdit = QLineEdit()
@@ -214,6 +250,7 @@ class PreferencesWindow(QMainWindow):
 		# Main General preferences
 		prefEntriesLayout: QVBoxLayout = QVBoxLayout()
 		prefEntriesLayout.addWidget(grpbSystem)
+		prefEntriesLayout.addWidget(grpbScanning)
 		prefEntriesLayout.addStretch()
 
 		prefEntriesWidget = QWidget()
@@ -272,6 +309,10 @@ class PreferencesWindow(QMainWindow):
 		cbShowNoteOnTileFirstLineOnly: QCheckBox = QCheckBox('Show note: only show first line')
 		self._connectPreferenceSimple(f'{SECTION_PREFIX}c4dtile-show-note-first-line', cbShowNoteOnTileFirstLineOnly, True)
 		PreferencesWindow._connectWidgetsIsEnabledToCheckbox(cbShoNoteOnTile, [cbShowNoteOnTileFirstLineOnly])
+
+		cbShowSize: QCheckBox = QCheckBox('Show disk usage')
+		cbShowSize.setToolTip('Sizes of c4d folders and their preferences folders are calculated in background')
+		self._connectPreferenceSimple(f'{SECTION_PREFIX}c4dtile-show-size', cbShowSize, True)
 		
 		# cbUnusedFolderGroup: QCheckBox = QCheckBox('Unused folded group')
 		# self._connectPreferenceSimple(f'{SECTION_PREFIX}unused-folded-group', cbUnusedFolderGroup)
@@ -283,6 +324,7 @@ class PreferencesWindow(QMainWindow):
 		# grpTilesLayout.addRow(cbUnusedFolderGroup)
 		grpTilesLayout.addRow(cbShoNoteOnTile)
 		grpTilesLayout.addRow(cbShowNoteOnTileFirstLineOnly)
+		grpTilesLayout.addRow(cbShowSize)
 		
 		comboC4DStatusGrouping: QComboBox = QComboBox(self)
 		comboC4DStatusGrouping.addItems(['Touched / Untouched', 'Separate statuses'])
@@ -330,6 +372,16 @@ class PreferencesWindow(QMainWindow):
 				self._addSearchPath(v)
 		self._connectPreference(f'{SECTION_PREFIX}search-paths', prefConnectPathListGetter, prefConnectPathListSetter, [])
 
+		# Scan rules per search path: search path -> C4DScanRules.ToJSON(), paths without entry use default rules
+		self.searchPathsRules: dict[str, dict] = dict()
+		def prefConnectRulesGetter():
+			paths: list[str] = prefConnectPathListGetter()
+			return {p: r for p, r in self.searchPathsRules.items() if p in paths}
+		def prefConnectRulesSetter(val: dict):
+			self.searchPathsRules = dict(val) if isinstance(val, dict) else dict()
+			loadCurrentPathRules()
+		self._connectPreference(f'{SECTION_PREFIX}rules', prefConnectRulesGetter, prefConnectRulesSetter, {})
+
 		self.pathsList.setDragDropMode(QAbstractItemView.InternalMove)
 
 		def _addSearchPath(path: str):
@@ -359,9 +411,64 @@ class PreferencesWindow(QMainWindow):
 			'add': QPushButton('Add path'),
 			'remove': QPushButton('Remove'),
 		}
+		# Rules of the selected search path
+		leIncludePatterns: QLineEdit = QLineEdit(self)
+		leIncludePatterns.setPlaceholderText('Everything')
+		leIncludePatterns.setToolTip('Semicolon separated folder name patterns, e.g. "R2*; S2*". If set, only matching folders below the search path are scanned.\n'\
+							   'Patterns with a slash are matched against the path relative to the search path, e.g. "builds/*"')
+		leExcludePatterns: QLineEdit = QLineEdit(self)
+		leExcludePatterns.setPlaceholderText('Nothing')
+		leExcludePatterns.setToolTip('Semicolon separated folder name patterns that are never scanned, e.g. ".git; node_modules"')
+		sbMaxEntries: QSpinBox = QSpinBox(self)
+		sbMaxEntries.setRange(0, 1000000)
+		sbMaxEntries.setSingleStep(1000)
+		sbMaxEntries.setSpecialValueText('No limit')
+		sbMaxEntries.setToolTip('Folders with more entries than that are not scanned deeper')
+
+		def patternsToText(patterns: list[str]) -> str:
+			return '; '.join(patterns)
+		def textToPatterns(text: str) -> list[str]:
+			return [p.strip() for p in text.split(';') if p.strip()]
+
+		def loadCurrentPathRules():
+			item: QListWidgetItem | None = self.pathsList.currentItem()
+			rules: C4DScanRules = C4DScanRules.FromJSON(self.searchPathsRules.get(item.text(), dict())) if item else C4DScanRules()
+			for w in (leIncludePatterns, leExcludePatterns, sbMaxEntries):
+				w.blockSignals(True)
+			leIncludePatterns.setText(patternsToText(rules.include))
+			leExcludePatterns.setText(patternsToText(rules.exclude))
+			sbMaxEntries.setValue(rules.maxEntries)
+			for w in (leIncludePatterns, leExcludePatterns, sbMaxEntries):
+				w.blockSignals(False)
+			grpbRules.setEnabled(item is not None)
+
+		def storeCurrentPathRules():
+			item: QListWidgetItem | None = self.pathsList.currentItem()
+			if item is None:
+				return
+			rules: C4DScanRules = C4DScanRules(textToPatterns(leIncludePatterns.text()), textToPatterns(leExcludePatterns.text()), sbMaxEntries.value())
+			if self.searchPathsRules.get(item.text()) == rules.ToJSON():
+				return
+			self.searchPathsRules[item.text()] = rules.ToJSON()
+			self.preferenceChangedSignal.emit(f'{SECTION_PREFIX}rules')
+
+		leIncludePatterns.editingFinished.connect(storeCurrentPathRules)
+		leExcludePatterns.editingFinished.connect(storeCurrentPathRules)
+		sbMaxEntries.valueChanged.connect(lambda val: storeCurrentPathRules())
+
+		rulesLayout: QFormLayout = QFormLayout()
+		rulesLayout.addRow('Include', leIncludePatterns)
+		rulesLayout.addRow('Exclude', leExcludePatterns)
+		rulesLayout.addRow('Max folder entries', sbMaxEntries)
+
+		grpbRules: QGroupBox = QGroupBox('Scan rules of selected path', self)
+		grpbRules.setLayout(rulesLayout)
+
 		def updateButtonsEnabled():
 			buttons['remove'].setEnabled(self.pathsList.currentRow() >= 0)
 		updateButtonsEnabled()
+		self.pathsList.currentItemChanged.connect(lambda cur, prev: loadCurrentPathRules())
+		loadCurrentPathRules()
 
 		def _deleteSelectedRow():
 			if self.pathsList.currentRow() < 0:
@@ -394,6 +501,7 @@ class PreferencesWindow(QMainWindow):
 		layout = QVBoxLayout()
 		layout.addWidget(self.pathsList)
 		layout.addWidget(buttonsGroupWidget)
+		layout.addWidget(grpbRules)
 
 		prefEntriesWidget = QWidget()
 		prefEntriesWidget.setLayout(layout)
@@ -420,5 +528,4 @@ class PreferencesWindow(QMainWindow):
 
 	@staticmethod
 	def GetPreferencesSavePath():
-		prefsFolderPath: str = GetPrefsFolderPath()
-		return OsPathJoin(prefsFolderPath, PreferencesWindow.PREFERENCES_FILENAME)
+		return GetPreferencesSavePath()
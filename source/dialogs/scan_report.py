@@ -0,0 +1,74 @@
+from PyQt5.QtCore import Qt
+from PyQt5.QtGui import QFont
+from PyQt5.QtWidgets import (
+	QApplication, QLabel, QDialog, QVBoxLayout, QHBoxLayout, QWidget, QTreeWidget, QTreeWidgetItem, QPushButton
+)
+
+from utils import *
+from scanner import C4DScanReport, C4DScanRootReport
+
+# Shows per search path instrumentation of the last finished scan: time, work done, errors and the slowest folders
+class ScanReportWindow(QDialog):
+	COLUMNS = ['Search path', 'Time', 'Folders listed', 'Candidates probed', 'Packages', 'Errors', 'Pruned']
+
+	def __init__(self, parent: QWidget | None = None) -> None:
+		super().__init__(parent)
+		self.setWindowTitle('Last scan report')
+		self.resize(900, 400)
+
+		self.report: C4DScanReport | None = None
+
+		self.summaryLabel: QLabel = QLabel('No scan has finished yet', self)
+		self.summaryLabel.setFont(QFont(APPLICATION_FONT_FAMILY, 10))
+
+		self.rootsTree: QTreeWidget = QTreeWidget(self)
+		self.rootsTree.setColumnCount(len(ScanReportWindow.COLUMNS))
+		self.rootsTree.setHeaderLabels(ScanReportWindow.COLUMNS)
+		self.rootsTree.setColumnWidth(0, 360)
+		self.rootsTree.setToolTip('Expand search path to see its slowest folders and errors')
+
+		copyButton: QPushButton = QPushButton('Copy to clipboard', self)
+		copyButton.clicked.connect(self._copyToClipboard)
+		closeButton: QPushButton = QPushButton('Close', self)
+		closeButton.clicked.connect(self.close)
+
+		buttonsLayout: QHBoxLayout = QHBoxLayout()
+		buttonsLayout.addStretch()
+		buttonsLayout.addWidget(copyButton)
+		buttonsLayout.addWidget(closeButton)
+
+		layout: QVBoxLayout = QVBoxLayout(self)
+		layout.addWidget(self.summaryLabel)
+		layout.addWidget(self.rootsTree)
+		layout.addLayout(buttonsLayout)
+
+	def SetReport(self, report: C4DScanReport | None):
+		self.report = report
+		self.rootsTree.clear()
+		if report is None:
+			self.summaryLabel.setText('No scan has finished yet')
+			return
+		self.summaryLabel.setText(str(report).splitlines()[0])
+		for rootReport in report.roots:
+			self.rootsTree.addTopLevelItem(self._createRootItem(rootReport))
+
+	def _createRootItem(self, rootReport: C4DScanRootReport) -> QTreeWidgetItem:
+		timeStr: str = f'{rootReport.wallTime:.2f}s' + (f' ({rootReport.abandonReason})' if rootReport.abandonReason else '')
+		item: QTreeWidgetItem = QTreeWidgetItem([rootReport.root, timeStr, str(rootReport.stats.dirsListed), str(rootReport.stats.candidatesProbed),
+												 str(rootReport.packagesFound), str(rootReport.stats.GetErrorsCount()), str(rootReport.prunedCount)])
+		item.setToolTip(0, rootReport.root)
+		for col in range(1, len(ScanReportWindow.COLUMNS)):
+			item.setTextAlignment(col, Qt.AlignRight | Qt.AlignVCenter)
+		for seconds, path in rootReport.slowestDirs:
+			child: QTreeWidgetItem = QTreeWidgetItem(item, [path, f'{seconds:.3f}s'])
+			child.setToolTip(0, path)
+			child.setTextAlignment(1, Qt.AlignRight | Qt.AlignVCenter)
+		for error in rootReport.stats.errors:
+			child: QTreeWidgetItem = QTreeWidgetItem(item, [error])
+			child.setToolTip(0, error)
+			child.setForeground(0, Qt.red)
+		return item
+
+	def _copyToClipboard(self):
+		if self.report is not None:
+			QApplication.clipboard().setText(str(self.report))
@@ -0,0 +1,175 @@
+import os, json, time, threading
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from version import *
+from core import *
+
+DISK_USAGE_MAX_WORKERS = 2 		# few threads, disk usage is nice to have and shouldn't slow down anything else
+DISK_USAGE_CACHE_TTL_SEC = 24 * 60 * 60 	# cached sizes are recalculated at least once a day, catches changes deep inside of folders
+THREAD_PRIORITY_LOWEST = -2
+
+# Background work shouldn't compete with C4D or the UI, lowers priority of the calling thread where it's possible
+def _lowerThreadPriority():
+	try:
+		import ctypes
+		kernel32 = ctypes.windll.kernel32
+		kernel32.SetThreadPriority(kernel32.GetCurrentThread(), THREAD_PRIORITY_LOWEST)
+	except (ImportError, AttributeError, OSError):
+		pass
+
+# Calculates sizes of c4d packages and their preferences folders on a low-priority thread pool, one task per folder.
+# Results are cached by path, mtime of the folder and mtimes of its subfolders (mtime only changes when direct entries of
+# a folder change, so e.g. new plugins or corelibs are caught by subfolders). Changes deeper down are caught once cached
+# size expires, so requesting sizes of unchanged folders costs a single listing. Calculation can be paused, e.g. while
+# scanning, tasks wait between directories until it's resumed. onSizeComputed(path, size) is called from the pool threads
+class C4DDiskUsageCalculator:
+	CACHE_FILENAME = 'disk_usage.json'
+
+	def __init__(self, maxWorkers: int = DISK_USAGE_MAX_WORKERS) -> None:
+		self._lock: threading.Lock = threading.Lock()
+		self.sizes: dict[str, dict] = dict() # path -> {'mtime': mtime of the folder, 'subdirs': {name: mtime}, 'time': when calculated, 'size': size in bytes}
+		self.onSizeComputed: Callable[[str, int], None] | None = None
+
+		self._pending: set[str] = set() 	# paths requested and not computed yet
+		self._pauseCount: int = 0 			# pauses can overlap, e.g. scan and c4d launch
+		self._resumed: threading.Event = threading.Event()
+		self._resumed.set()
+		self._stopped: bool = False
+		self._executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=max(1, maxWorkers), thread_name_prefix='C4DDiskUsage', initializer=_lowerThreadPriority)
+
+	# Last known size of the folder (or file), None if it wasn't computed yet
+	def GetSize(self, path: str) -> int | None:
+		with self._lock:
+			record: dict | None = self.sizes.get(path)
+		return record['size'] if record else None
+
+	# Schedules size calculation of folders (or files) that aren't being calculated already
+	def Request(self, paths: list[str]):
+		with self._lock:
+			if self._stopped:
+				return
+			newPaths: list[str] = [p for p in dict.fromkeys(paths) if p and p not in self._pending]
+			self._pending.update(newPaths)
+		for path in newPaths:
+			self._executor.submit(self._compute, path)
+
+	def Pause(self):
+		with self._lock:
+			self._pauseCount += 1
+			self._resumed.clear()
+
+	def Resume(self):
+		with self._lock:
+			self._pauseCount = max(0, self._pauseCount - 1)
+			if not self._pauseCount:
+				self._resumed.set()
+
+	def IsPaused(self) -> bool:
+		return not self._resumed.is_set()
+
+	# Running tasks stop at the next directory, pending ones are dropped
+	def Stop(self):
+		with self._lock:
+			self._stopped = True
+			self._resumed.set()
+		self._executor.shutdown(wait=False, cancel_futures=True)
+
+	def _waitResumed(self) -> bool:
+		self._resumed.wait()
+		return not self._stopped
+
+	# Runs on the pool
+	def _compute(self, path: str):
+		try:
+			if not self._waitResumed():
+				return
+			try:
+				st: os.stat_result = os.stat(path)
+			except OSError:
+				return
+			isDir: bool = os.path.isdir(path)
+			subdirsMtimes: dict[str, int] = C4DDiskUsageCalculator._getSubdirsMtimes(path) if isDir else dict()
+			with self._lock:
+				record: dict | None = self.sizes.get(path)
+			if record and record['mtime'] == st.st_mtime_ns and record.get('subdirs') == subdirsMtimes \
+			   and time.time() - record.get('time', 0) < DISK_USAGE_CACHE_TTL_SEC:
+				return
+			computedTime: float = time.time()
+			size: int | None = self._getFolderSize(path) if isDir else st.st_size
+			if size is None: # stopped
+				return
+			with self._lock:
+				self.sizes[path] = {'mtime': st.st_mtime_ns, 'subdirs': subdirsMtimes, 'time': computedTime, 'size': size}
+			if self.onSizeComputed is not None:
+				self.onSizeComputed(path, size)
+		except Exception as e:
+			print(f'Failed calculating size of {path}: {e}')
+		finally:
+			with self._lock:
+				self._pending.discard(path)
+
+	# Runs on the pool: subfolder name -> its mtime, links aren't followed
+	@staticmethod
+	def _getSubdirsMtimes(path: str) -> dict[str, int]:
+		ret: dict[str, int] = dict()
+		try:
+			with os.scandir(path) as it:
+				for entry in it:
+					try:
+						if entry.is_dir(follow_symlinks=False):
+							ret[entry.name] = entry.stat(follow_symlinks=False).st_mtime_ns # answered by the listing on Windows
+					except OSError:
+						pass
+		except OSError:
+			pass
+		return ret
+
+	# Runs on the pool: sums sizes of all files below the folder, links aren't followed. None if stopped meanwhile
+	def _getFolderSize(self, path: str) -> int | None:
+		size: int = 0
+		pending: list[str] = [path]
+		while pending:
+			if not self._waitResumed():
+				return None
+			try:
+				with os.scandir(pending.pop()) as it:
+					for entry in it:
+						try:
+							if entry.is_dir(follow_symlinks=False):
+								pending.append(entry.path)
+							elif entry.is_file(follow_symlinks=False):
+								size += entry.stat(follow_symlinks=False).st_size # answered by the listing on Windows
+						except OSError:
+							pass
+			except OSError:
+				pass
+		return size
+
+	def Load(self) -> bool:
+		loadFilePath: str = C4DDiskUsageCalculator.GetCacheSavePath()
+		if not os.path.isfile(loadFilePath):
+			return False
+		try:
+			with open(loadFilePath, 'r') as fp:
+				data: dict = json.load(fp)
+			if 'sizes' in data and isinstance(data['sizes'], dict):
+				with self._lock:
+					self.sizes = data['sizes']
+			return True
+		except Exception as e:
+			print(f'Failed to load disk usage cache from {loadFilePath}: {e}')
+		return False
+
+	def Save(self):
+		storeDict: dict = dict()
+		storeDict['version'] = C4DL_VERSION
+		with self._lock:
+			storeDict['sizes'] = dict(self.sizes)
+		with open(C4DDiskUsageCalculator.GetCacheSavePath(), 'w') as fp:
+			json.dump(storeDict, fp)
+
+	@staticmethod
+	def GetCacheSavePath():
+		prefsFolderPath: str = GetPrefsFolderPath()
+		return OsPathJoin(prefsFolderPath, C4DDiskUsageCalculator.CACHE_FILENAME)
@@ -0,0 +1,43 @@
+import os
+
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from utils import *
+from scanner import *
+
+# Extracts an archived c4d package off the UI thread, next to the archive into a folder named after it
+class C4DExtractThread(QThread):
+	progressChanged = pyqtSignal(int, int) 	# extracted members, total members
+	extractFinished = pyqtSignal(str) 		# error message, empty on success
+
+	def __init__(self, c4d: C4DInfo, parent: QObject | None = None) -> None:
+		super().__init__(parent)
+
+		self.c4d: C4DInfo = c4d
+		self.targetPath: str = C4DExtractThread.GetTargetPath(c4d.directory)
+		self.cancelToken: C4DScanCancelToken = C4DScanCancelToken()
+
+	# Folder next to the archive named after it, numbered if such folder already exists
+	@staticmethod
+	def GetTargetPath(archivePath: str) -> str:
+		basePath: str = os.path.splitext(archivePath)[0]
+		targetPath: str = basePath
+		idx: int = 1
+		while os.path.exists(targetPath):
+			targetPath = f'{basePath} ({idx})'
+			idx += 1
+		return targetPath
+
+	def Cancel(self):
+		self.cancelToken.Cancel()
+
+	def run(self):
+		self.setPriority(QThread.LowPriority)
+		lastPercent: int = -1
+		def onProgress(extracted: int, total: int): # packages have thousands of members, progress is only reported by percents
+			nonlocal lastPercent
+			if (percent := extracted * 100 // total) != lastPercent:
+				lastPercent = percent
+				self.progressChanged.emit(extracted, total)
+		error: str = ExtractC4DArchive(self.c4d.directory, self.targetPath, onProgress, self.cancelToken)
+		self.extractFinished.emit(error)
@@ -0,0 +1,82 @@
+# Headless scan for scripts and CI: prints one JSON object per found c4d package to stdout (NDJSON).
+# Only depends on core and scanner, so neither Qt nor win32 modules are imported and startup stays fast.
+#
+# Usage: python scan_cli.py [PATH ...] [--depth N] [--workers N] [--timeout SEC]
+# Without paths, search paths saved in the app preferences are scanned with their scan rules.
+# Exit codes: 0 - ok, 1 - nothing to scan, 2 - some search paths weren't scanned completely,
+# 130 - interrupted, 141 - output was closed early (e.g. piped into head), the scan is cancelled then.
+import os, sys, json, argparse
+
+from core import *
+from scanner import *
+
+def _parseArgs(argv: list[str]) -> argparse.Namespace:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Scans folders for Cinema 4D packages and prints them as NDJSON: directory, version, build, directoryPrefs, fingerprint, archived.')
+	parser.add_argument('paths', nargs='*', help='folders to scan, saved search paths are used if none given')
+	parser.add_argument('--depth', type=int, default=None, help=f'folder levels below search paths to scan (saved setting or {SCANNER_MAX_DEPTH})')
+	parser.add_argument('--workers', type=int, default=None, help=f'scan threads (saved setting or {SCANNER_MAX_WORKERS})')
+	parser.add_argument('--timeout', type=float, default=None, help=f'seconds after which a search path is given up on, 0 - no timeout (saved setting or {SCANNER_ROOT_TIMEOUT_SEC})')
+	return parser.parse_args(argv)
+
+EXIT_CODE_BROKEN_PIPE: int = 141 # 128 + SIGPIPE, what shells report for a writer killed by a closed pipe
+
+def _printC4DEntries(c4dEntries: list[C4DInfo]):
+	for c4dInfo in c4dEntries:
+		sys.stdout.write(json.dumps(c4dInfo.ToJSON()) + '\n')
+	sys.stdout.flush()
+
+# Reader of the output is gone: the rest of the output is dropped, including what's still buffered,
+# otherwise flushing stdout at exit fails once more
+def _silenceStdout():
+	devnull: int = os.open(os.devnull, os.O_WRONLY)
+	os.dup2(devnull, sys.stdout.fileno())
+	os.close(devnull)
+
+def main(argv: list[str]) -> int:
+	args: argparse.Namespace = _parseArgs(argv)
+	prefs: dict = LoadPreferencesFile()
+
+	rulesPrefs: dict = prefs.get('search-paths_rules') or dict()
+	searchPaths: list[str] = [NormalizePath(p) for p in args.paths] if args.paths else (prefs.get('search-paths_search-paths') or list())
+	if not searchPaths:
+		print('No search paths given and none saved in preferences', file=sys.stderr)
+		return 1
+
+	def getSetting(value, prefKey: str, default):
+		if value is not None:
+			return value
+		return prefs[prefKey] if prefs.get(prefKey) is not None else default
+
+	scanner: C4DScanner = C4DScanner(maxDepth=getSetting(args.depth, 'general_search-depth', SCANNER_MAX_DEPTH),
+									 maxWorkers=getSetting(args.workers, 'general_scan-workers', SCANNER_MAX_WORKERS),
+									 maxWorkersPerRoot=prefs.get('general_scan-workers-per-root') or SCANNER_MAX_WORKERS_PER_ROOT,
+									 rules={sp: C4DScanRules.FromJSON(rulesPrefs[sp]) if sp in rulesPrefs else C4DScanRules() for sp in searchPaths},
+									 rootTimeout=getSetting(args.timeout, 'general_scan-root-timeout', SCANNER_ROOT_TIMEOUT_SEC),
+									 hashCorelibs=bool(prefs.get('general_fingerprint-corelibs')))
+	outputClosed: bool = False
+	def onPackagesFound(c4dEntries: list[C4DInfo]):
+		nonlocal outputClosed
+		if outputClosed:
+			return
+		try:
+			_printC4DEntries(c4dEntries)
+		except BrokenPipeError:
+			outputClosed = True
+			_silenceStdout()
+			scanner.Cancel()
+
+	scanner.onPackagesFound = onPackagesFound # stream packages as they are found
+	try:
+		scanner.Scan(searchPaths)
+	except KeyboardInterrupt:
+		scanner.Cancel()
+		return 130
+	if outputClosed:
+		return EXIT_CODE_BROKEN_PIPE
+
+	for root, reason in scanner.degradedRoots.items():
+		print(f'Search path was not scanned completely ({reason}): {root}', file=sys.stderr)
+	return 2 if scanner.degradedRoots else 0
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))
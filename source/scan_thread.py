@@ -0,0 +1,40 @@
+from PyQt5.QtCore import QObject, QThread, pyqtSignal
+
+from utils import *
+from scanner import *
+
+# Runs C4DScanner off the UI thread. Found packages are streamed in batches while the scan is running,
+# signals are queued to the thread the object lives in (UI thread), so slots can safely touch widgets.
+class C4DScanThread(QThread):
+	packagesFound = pyqtSignal(list) 		# list[C4DInfo], batch found since the previous emission
+	progressChanged = pyqtSignal(object) 	# C4DScanProgress
+	scanFinished = pyqtSignal(dict) 		# dict[str, C4DInfo], all found packages ordered as C4DScanner returns them
+
+	# Either roots (full scan of search paths) or subtrees (<directory, depth> parts of search paths) should be given
+	def __init__(self, scanner: C4DScanner, roots: list[str] | None = None, subtrees: list[tuple[str, int]] | None = None, parent: QObject | None = None) -> None:
+		super().__init__(parent)
+
+		self.scanner: C4DScanner = scanner
+		self.roots: list[str] | None = roots
+		self.subtrees: list[tuple[str, int]] | None = subtrees
+
+		self.scanner.onPackagesFound = self.packagesFound.emit
+		self.scanner.onProgress = self.progressChanged.emit
+
+	# Scan stops shortly after, scanFinished is emitted with what was found so far
+	def Cancel(self):
+		self.scanner.Cancel()
+
+	def IsSubtreesScan(self) -> bool:
+		return self.subtrees is not None
+
+	def run(self):
+		found: dict[str, C4DInfo] = dict()
+		try:
+			if self.subtrees is not None:
+				found = self.scanner.ScanSubtrees(self.subtrees)
+			else:
+				found = self.scanner.Scan(self.roots if self.roots else list())
+		except Exception as e:
+			print(f'Scan failed: {e}')
+		self.scanFinished.emit(found)
@@ -0,0 +1,1031 @@
+import os, re, json, time, heapq, fnmatch, hashlib, logging, zipfile, threading
+import datetime as dt
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable
+
+from version import *
+from core import *
+
+SCANNER_MAX_DEPTH = 2
+SCANNER_MAX_WORKERS = 16 			# threads shared by all search paths
+SCANNER_MAX_WORKERS_PER_ROOT = 4 	# threads a single search path can occupy at once
+SCANNER_ROOT_TIMEOUT_SEC = 120 		# search path that isn't scanned within that time is given up on, 0 - no timeout
+SCANNER_MAX_DIR_ENTRIES = 10000 	# directories with more entries than that are not descended into, 0 - no limit
+SCANNER_DEFAULT_EXCLUDE_PATTERNS = ['.git', '.svn', 'node_modules', '__pycache__', '$RECYCLE.BIN', 'System Volume Information']
+
+logger = logging.getLogger(__name__) # scan reports are logged at INFO level, the app writes them to its log file
+
+# Thread-safe counters of the filesystem work done during a scan
+class C4DScanStats:
+	COUNTERS = ['dirsListed', 'listingErrors', 'candidatesProbed', 'statCallsSaved', 'indexHits', 'metadataErrors', 'scanErrors', 'prunedByRules', 'prunedByEntries',
+				'nestedRootsSkipped', 'linksResolved', 'linksSkipped', 'archivesProbed']
+	ERRORS_SAMPLE_SIZE = 20 # error messages kept for the report, the rest is only counted
+
+	def __init__(self) -> None:
+		self._lock: threading.Lock = threading.Lock()
+		self.dirsListed: int = 0 		# os.scandir calls
+		self.listingErrors: int = 0 	# directories (or archives) that couldn't be listed
+		self.candidatesProbed: int = 0 	# directories checked for containing c4d
+		self.statCallsSaved: int = 0 	# isfile/isdir checks answered by DirEntry instead of a separate stat call
+		self.indexHits: int = 0 		# directories taken from the scan index without listing
+		self.metadataErrors: int = 0 	# c4d-like directories with unreadable or incomplete version.h/build.txt
+		self.scanErrors: int = 0 		# unexpected exceptions while scanning a directory
+		self.prunedByRules: int = 0 	# subdirectories skipped because of include/exclude patterns
+		self.prunedByEntries: int = 0 	# directories not descended into because of too many entries
+		self.nestedRootsSkipped: int = 0 # subdirectories left to the nested search path they are
+		self.linksResolved: int = 0 	# symlinks and junctions resolved to their real paths
+		self.linksSkipped: int = 0 		# symlinks and junctions to already visited folders (loops, duplicate trees) or other search paths
+		self.archivesProbed: int = 0 	# .zip files checked for containing c4d
+		self.errors: list[str] = list() # messages of the first errors
+
+	def Increment(self, counter: str, value: int = 1):
+		with self._lock:
+			setattr(self, counter, getattr(self, counter) + value)
+
+	def AddError(self, message: str):
+		with self._lock:
+			if len(self.errors) < C4DScanStats.ERRORS_SAMPLE_SIZE:
+				self.errors.append(message)
+
+	# Errors that were handled and didn't stop the scan
+	def GetErrorsCount(self) -> int:
+		return self.listingErrors + self.metadataErrors + self.scanErrors
+
+	def Add(self, other: 'C4DScanStats'):
+		with self._lock:
+			for counter in C4DScanStats.COUNTERS:
+				setattr(self, counter, getattr(self, counter) + getattr(other, counter))
+			self.errors += other.errors[:C4DScanStats.ERRORS_SAMPLE_SIZE - len(self.errors)]
+
+	def __str__(self) -> str:
+		return f'{self.dirsListed} directories listed ({self.listingErrors} errors), '\
+			 + f'{self.candidatesProbed} candidates probed ({self.metadataErrors} with broken metadata), {self.statCallsSaved} stat calls saved, '\
+			 + f'{self.indexHits} directories reused from index, {self.scanErrors} unexpected errors, '\
+			 + f'{self.prunedByRules + self.prunedByEntries} subtrees pruned ({self.prunedByRules} by patterns, {self.prunedByEntries} by entries count), '\
+			 + f'{self.nestedRootsSkipped} nested search paths skipped, {self.linksSkipped} of {self.linksResolved} links skipped, '\
+			 + f'{self.archivesProbed} archives probed'
+
+# Per search path rules for the walker, patterns are globs (fnmatch). Exclude patterns containing a path separator are
+# matched against the path relative to the search path, the rest against the folder name on any level. Include patterns
+# are matched level by level against the beginning of the relative path: "R2*" keeps only matching folders right below
+# the search path (and everything inside of them), "builds/R2*" - only matching folders inside of "builds".
+# Search path itself is never pruned
+class C4DScanRules:
+	def __init__(self, include: list[str] | None = None, exclude: list[str] | None = None, maxEntries: int = SCANNER_MAX_DIR_ENTRIES) -> None:
+		self.include: list[str] = [p for p in include if p] if include else list()
+		self.exclude: list[str] = [p for p in exclude if p] if exclude is not None else list(SCANNER_DEFAULT_EXCLUDE_PATTERNS)
+		self.maxEntries: int = maxEntries
+
+		self._include: list[list[re.Pattern]] = [[C4DScanRules._compile(c) for c in C4DScanRules._splitPath(p)] for p in self.include]
+		self._excludeName: list[re.Pattern] = [C4DScanRules._compile(p) for p in self.exclude if not C4DScanRules._isRelative(p)]
+		self._excludeRel: list[re.Pattern] = [C4DScanRules._compile(os.sep.join(C4DScanRules._splitPath(p))) for p in self.exclude if C4DScanRules._isRelative(p)]
+
+	@staticmethod
+	def _compile(pattern: str) -> re.Pattern:
+		return re.compile(fnmatch.translate(os.path.normcase(pattern)))
+
+	@staticmethod
+	def _isRelative(pattern: str) -> bool:
+		return '/' in pattern or '\\' in pattern
+
+	@staticmethod
+	def _splitPath(path: str) -> list[str]:
+		return [c for c in re.split(r'[\\/]', path) if c]
+
+	def IsPruned(self, searchPath: str, path: str) -> bool:
+		if not self._include and not self.exclude:
+			return False
+		relParts: list[str] = C4DScanRules._splitPath(os.path.normcase(path[len(searchPath):])) if IsPathUnder(path, searchPath) else [os.path.normcase(os.path.basename(path))]
+		if not relParts:
+			return False
+		if any(p.match(relParts[-1]) for p in self._excludeName) or any(p.match(os.sep.join(relParts)) for p in self._excludeRel):
+			return True
+		if not self._include:
+			return False
+		return not any(all(pc.match(rc) for pc, rc in zip(patternParts, relParts)) for patternParts in self._include)
+
+	def IsTooLarge(self, entriesCount: int) -> bool:
+		return self.maxEntries > 0 and entriesCount > self.maxEntries
+
+	def ToJSON(self) -> dict:
+		return {'include': self.include, 'exclude': self.exclude, 'max-entries': self.maxEntries}
+
+	@staticmethod
+	def FromJSON(data: dict) -> 'C4DScanRules':
+		return C4DScanRules(data.get('include'), data.get('exclude'), SafeCast(data.get('max-entries'), int, SCANNER_MAX_DIR_ENTRIES))
+
+# Returns the deepest search path containing given path and its rules, <None, default rules> if there's no such search path
+def FindSearchPathRules(path: str, rules: dict[str, C4DScanRules]) -> tuple[str | None, C4DScanRules]:
+	searchPaths: list[str] = [sp for sp in rules.keys() if IsPathUnder(path, sp)]
+	if not searchPaths:
+		return None, C4DScanRules()
+	searchPath: str = max(searchPaths, key=len)
+	return searchPath, rules[searchPath]
+
+# Lists directory once, returns mapping: normcase(name) -> DirEntry, or None if directory can't be listed.
+# DirEntry caches file type from the listing itself, so following is_dir()/is_file() calls don't hit the filesystem
+def ScanDirectory(path: str, stats: C4DScanStats | None = None) -> dict[str, os.DirEntry] | None:
+	try:
+		with os.scandir(path) as it:
+			entries: dict[str, os.DirEntry] = {os.path.normcase(e.name): e for e in it}
+	except OSError as e:
+		if stats:
+			stats.Increment('listingErrors')
+			stats.AddError(f'Listing failed: {e}')
+		return None
+	if stats: stats.Increment('dirsListed')
+	return entries
+
+def _isEntryOfType(entry: os.DirEntry | None, isDir: bool, stats: C4DScanStats | None = None) -> bool:
+	if entry is None:
+		return False
+	if stats: stats.Increment('statCallsSaved')
+	try:
+		return entry.is_dir() if isDir else entry.is_file()
+	except OSError:
+		return False
+
+FILE_ATTRIBUTE_REPARSE_POINT = 0x400
+
+# Symlinks and junctions are the only ways to reach the same folder twice (folders can't be hardlinked), so only they
+# need to be resolved for detecting loops. Answered from the listing, except for symlinks on Python < 3.12 on Windows
+def IsLinkEntry(entry: os.DirEntry) -> bool:
+	try:
+		if entry.is_symlink():
+			return True
+		if hasattr(entry, 'is_junction'): # Python 3.12+
+			return entry.is_junction()
+		if os.name == 'nt': # stat of a DirEntry is cached from the listing on Windows
+			return bool(getattr(entry.stat(follow_symlinks=False), 'st_file_attributes', 0) & FILE_ATTRIBUTE_REPARSE_POINT)
+	except OSError:
+		pass
+	return False
+
+def GetPathMtime(path: str) -> int | None:
+	try:
+		return os.stat(path).st_mtime_ns
+	except OSError:
+		return None
+
+# Returns full paths of all subdirectories from the listing
+def GetSubdirectories(pathDir: str, entries: dict[str, os.DirEntry] | None = None, stats: C4DScanStats | None = None) -> list[str]:
+	if entries is None:
+		entries = ScanDirectory(pathDir, stats)
+		if entries is None:
+			return list()
+	subdirs: list[str] = list()
+	for entry in entries.values():
+		if _isEntryOfType(entry, True, stats):
+			subdirs.append(OsPathJoin(pathDir, entry.name))
+	return subdirs
+
+# Lookup of c4d preferences folders in %APPDATA%\Maxon, which are named as c4d folder + '_XXXXXXXX' suffix.
+# Maxon folder is listed once and indexed by folder name without the suffix, so each lookup is O(1).
+# The index is rebuilt on Refresh() only if Maxon folder mtime has changed
+class C4DPrefsFolderIndex:
+	SUFFIX_PATTERN = re.compile('(?=_[A-Z0-9]{8})') # all positions where the suffix can start
+
+	def __init__(self, maxonFolderPath: str | None = None) -> None:
+		self.maxonFolderPath: str = maxonFolderPath if maxonFolderPath else OsPathJoin(GetAppDataPath(), 'Maxon')
+		self.mtime: int | None = None
+		self.prefixes: dict[str, str] = dict() # c4d folder name -> prefs folder path
+
+	def Refresh(self) -> bool:
+		mtime: int | None = GetPathMtime(self.maxonFolderPath)
+		if mtime is not None and mtime == self.mtime:
+			return False
+		prefixes: dict[str, str] = dict()
+		try:
+			with os.scandir(self.maxonFolderPath) as it:
+				for entry in it:
+					if not entry.is_dir():
+						continue
+					for match in C4DPrefsFolderIndex.SUFFIX_PATTERN.finditer(entry.name):
+						prefix: str = entry.name[:match.start()]
+						# prefer the plain '_XXXXXXXX' folder over the extra ones, e.g. '_XXXXXXXX_p'
+						if prefix not in prefixes or len(entry.name) < len(os.path.basename(prefixes[prefix])):
+							prefixes[prefix] = OsPathJoin(self.maxonFolderPath, entry.name)
+		except OSError:
+			pass
+		self.prefixes = prefixes
+		self.mtime = mtime
+		return True
+
+	def Find(self, folderPath: str) -> str | None:
+		return self.prefixes.get(os.path.basename(folderPath))
+
+_prefsFolderIndex: C4DPrefsFolderIndex | None = None
+
+# Tries to find corresponding preferences folder in the APPDATA directory
+def FindC4DPrefsFolder(folderPath: str, prefsIndex: C4DPrefsFolderIndex | None = None) -> str | None:
+	if prefsIndex is None: # no index shared by the caller, fall back to the module one and make sure it's up to date
+		global _prefsFolderIndex
+		if _prefsFolderIndex is None:
+			_prefsFolderIndex = C4DPrefsFolderIndex()
+		_prefsFolderIndex.Refresh()
+		prefsIndex = _prefsFolderIndex
+	return prefsIndex.Find(folderPath)
+
+# Result of reading c4d version and build from package resource files. Never raises, reports problems through error instead
+class C4DMetadataProbeResult:
+	ERROR_NONE = ''
+	ERROR_READ = 'read-failed' 						# file couldn't be opened or read
+	ERROR_VERSION_INCOMPLETE = 'version-incomplete' # not all C4D_V1..C4D_V4 defines were found within the byte budget
+	ERROR_BUILD_EMPTY = 'build-empty' 				# build.txt has no build string on its first line
+
+	def __init__(self, version: list[str] | None = None, build: str = '', error: str = ERROR_NONE, details: str = '') -> None:
+		self.version: list[str] = version if version is not None else list()
+		self.build: str = build
+		self.error: str = error
+		self.details: str = details
+
+	def IsValid(self) -> bool:
+		return self.error == C4DMetadataProbeResult.ERROR_NONE
+
+	def __str__(self) -> str:
+		return f'{self.error}: {self.details}' if self.error else f'{".".join(self.version)} ({self.build})'
+
+C4D_VERSION_H_BYTE_BUDGET = 16 * 1024 	# real version.h is well below 1KB, anything bigger is not what we're looking for
+C4D_BUILD_TXT_BYTE_BUDGET = 1024
+C4D_VERSION_DEFINE_PATTERN = re.compile(rb'^[ \t]*#[ \t]*define[ \t]+C4D_V([1-4])[ \t]+(\d+)', re.MULTILINE)
+
+def _readFileHead(path: str, byteBudget: int) -> bytes:
+	with open(path, 'rb') as fp:
+		return fp.read(byteBudget)
+
+# Reads version.h and build.txt with a single capped read each, so truncated or unexpected files can't stall the scan.
+# readHead(path, byteBudget) reads the beginning of a file, it's replaced for reading members of archives
+def ProbeC4DMetadata(versionPath: str, buildPath: str, readHead: Callable[[str, int], bytes] = _readFileHead) -> C4DMetadataProbeResult:
+	try:
+		versionData: bytes = readHead(versionPath, C4D_VERSION_H_BYTE_BUDGET)
+	except OSError as e:
+		return C4DMetadataProbeResult(error=C4DMetadataProbeResult.ERROR_READ, details=f'{versionPath}: {e}')
+
+	c4dVersion: dict[int, str] = dict()
+	for match in C4D_VERSION_DEFINE_PATTERN.finditer(versionData):
+		c4dVersion.setdefault(int(match.group(1)), str(int(match.group(2))))
+	if len(c4dVersion) < 4:
+		missing: list[str] = [f'C4D_V{i}' for i in range(1, 5) if i not in c4dVersion]
+		truncated: str = f' (read limit of {C4D_VERSION_H_BYTE_BUDGET} bytes reached)' if len(versionData) >= C4D_VERSION_H_BYTE_BUDGET else ''
+		return C4DMetadataProbeResult(error=C4DMetadataProbeResult.ERROR_VERSION_INCOMPLETE, details=f'{versionPath}: missing {", ".join(missing)}{truncated}')
+	versionStringsList: list[str] = [c4dVersion[i] for i in range(1, 5)]
+
+	try:
+		buildData: bytes = readHead(buildPath, C4D_BUILD_TXT_BYTE_BUDGET)
+	except OSError as e:
+		return C4DMetadataProbeResult(versionStringsList, error=C4DMetadataProbeResult.ERROR_READ, details=f'{buildPath}: {e}')
+	buildLines: list[str] = buildData.decode('utf-8', errors='replace').splitlines()
+	buildStr: str = buildLines[0].strip() if buildLines else ''
+	if not buildStr:
+		return C4DMetadataProbeResult(versionStringsList, error=C4DMetadataProbeResult.ERROR_BUILD_EMPTY, details=buildPath)
+
+	return C4DMetadataProbeResult(versionStringsList, buildStr)
+
+C4D_FINGERPRINT_VERSION = 1
+C4D_FINGERPRINT_CORELIBS_COUNT = 3 				# largest corelibs hashed for the corelibs fingerprint
+C4D_FINGERPRINT_CORELIBS_BYTE_BUDGET = 64 * 1024 	# bytes read from the beginning of each of them
+
+def _getC4DFingerprintPrefix(hashCorelibs: bool) -> str:
+	return f'{C4D_FINGERPRINT_VERSION}{"c" if hashCorelibs else ""}:'
+
+# Fingerprints computed with other settings (or by an older version) have to be recomputed
+def IsC4DFingerprintOfKind(fingerprint: str, hashCorelibs: bool) -> bool:
+	return fingerprint.startswith(_getC4DFingerprintPrefix(hashCorelibs))
+
+# Cheap identity of package content to detect copies of the same build in different places: build, version, size and
+# mtime of the executable (copying keeps mtime) and, if hashCorelibs, heads of the largest corelibs. Empty string if the
+# executable can't be stat'ed. exeEntry is the DirEntry of the executable from the listing, its stat is free on Windows
+def GetC4DFingerprint(folderPath: str, version: list[str], build: str, exeEntry: os.DirEntry | None = None, hashCorelibs: bool = False) -> str:
+	try:
+		exeStat: os.stat_result = exeEntry.stat() if exeEntry is not None else os.stat(OsPathJoin(folderPath, C4D_NECESSARY_FILES[0]))
+	except OSError:
+		return ''
+	hasher = hashlib.sha1(f'{build}|{".".join(version)}|{exeStat.st_size}|{exeStat.st_mtime_ns}'.encode('utf-8'))
+	if hashCorelibs:
+		try:
+			with os.scandir(OsPathJoin(folderPath, 'corelibs')) as it:
+				corelibs: list[tuple[int, str]] = [(e.stat().st_size, e.path) for e in it if e.is_file()]
+			for size, path in sorted(corelibs, reverse=True)[:C4D_FINGERPRINT_CORELIBS_COUNT]:
+				hasher.update(f'|{os.path.basename(path)}|{size}|'.encode('utf-8'))
+				hasher.update(_readFileHead(path, C4D_FINGERPRINT_CORELIBS_BYTE_BUDGET))
+		except OSError:
+			pass
+	return _getC4DFingerprintPrefix(hashCorelibs) + hasher.hexdigest()
+
+# Checks given folder path for containing Cinema 4D version.
+# Costs one listing of the folder (can be reused from the traversal by passing entries) and one listing of its resource folder
+C4D_NECESSARY_FILES = ['Cinema 4D.exe']
+C4D_NECESSARY_FOLDERS = ['corelibs', 'resource']
+
+# Folder has the executable and the necessary folders of a package, it's a c4d package unless its metadata is broken or missing
+def LooksLikeC4DPackage(entries: dict[str, os.DirEntry], stats: C4DScanStats | None = None) -> bool:
+	for file in C4D_NECESSARY_FILES:
+		if not _isEntryOfType(entries.get(os.path.normcase(file)), False, stats):
+			return False
+	for file in C4D_NECESSARY_FOLDERS:
+		if not _isEntryOfType(entries.get(os.path.normcase(file)), True, stats):
+			return False
+	return True
+
+def GetC4DInfoFromFolder(folderPath: str, entries: dict[str, os.DirEntry] | None = None, stats: C4DScanStats | None = None, prefsIndex: C4DPrefsFolderIndex | None = None,
+						 hashCorelibs: bool = False) -> C4DInfo | None:
+	if entries is None:
+		entries = ScanDirectory(folderPath, stats)
+		if entries is None:
+			return None
+	if stats: stats.Increment('candidatesProbed')
+
+	### Validate this folder contains C4D
+	if not LooksLikeC4DPackage(entries, stats):
+		return None
+
+	resourcePath: str = OsPathJoin(folderPath, 'resource')
+	resourceEntries: dict[str, os.DirEntry] | None = ScanDirectory(resourcePath, stats)
+	if resourceEntries is None:
+		return None
+
+	### Get Cinema version and build
+	if not _isEntryOfType(resourceEntries.get('version.h'), False, stats):
+		return None
+	if not _isEntryOfType(resourceEntries.get('build.txt'), False, stats):
+		return None
+
+	metadata: C4DMetadataProbeResult = ProbeC4DMetadata(OsPathJoin(resourcePath, 'version.h'), OsPathJoin(resourcePath, 'build.txt'))
+	if not metadata.IsValid():
+		if stats:
+			stats.Increment('metadataErrors')
+			stats.AddError(f'Broken metadata: {metadata}')
+		logger.debug(f'Skipping {folderPath}: {metadata}')
+		return None
+
+	prefsFolder: str | None = FindC4DPrefsFolder(folderPath, prefsIndex)
+	fingerprint: str = GetC4DFingerprint(folderPath, metadata.version, metadata.build, entries.get(os.path.normcase(C4D_NECESSARY_FILES[0])), hashCorelibs)
+	c4dInfo: C4DInfo = C4DInfo(folderPath, metadata.version, metadata.build, prefsFolder, fingerprint)
+	try: # timestamps are shown on tiles, they're taken here once instead of every time tiles are updated
+		c4dInfo.SetTimestamps(os.stat(folderPath))
+		c4dInfo.timestampBuilt = entries[os.path.normcase(C4D_NECESSARY_FILES[0])].stat().st_mtime # stat is answered by the listing on Windows
+	except (OSError, KeyError):
+		pass
+	return c4dInfo
+
+C4D_ARCHIVE_EXTENSIONS = ['.zip']
+
+def IsC4DArchiveCandidate(entry: os.DirEntry, stats: C4DScanStats | None = None) -> bool:
+	return os.path.splitext(entry.name)[1].lower() in C4D_ARCHIVE_EXTENSIONS and _isEntryOfType(entry, False, stats)
+
+# Returns folder of the package inside of the archive ('' for archive root, 'name/' for a folder), None if there's no package.
+# The shallowest folder having the executable, corelibs and resource/version.h is taken
+def FindC4DArchiveRoot(names: list[str]) -> str | None:
+	namesSet: set[str] = set(names)
+	roots: list[str] = list()
+	for name in names:
+		if not name.endswith('resource/version.h'):
+			continue
+		root: str = name[:-len('resource/version.h')]
+		if root and not root.endswith('/'):
+			continue
+		if root + C4D_NECESSARY_FILES[0] in namesSet and root + 'resource/build.txt' in namesSet:
+			roots.append(root)
+	roots = [r for r in roots if any(n.startswith(r + 'corelibs/') for n in names)]
+	return min(roots, key=lambda r: r.count('/')) if roots else None
+
+# Same as GetC4DInfoFromFolder(), but for .zip archives. Only the central directory and the (small) resource/version.h and
+# build.txt members are read, so probing a huge archive costs a few KB plus the central directory, not a full read
+def GetC4DInfoFromArchive(archivePath: str, stats: C4DScanStats | None = None, fileStat: os.stat_result | None = None) -> C4DInfo | None:
+	if stats: stats.Increment('archivesProbed')
+	try:
+		with zipfile.ZipFile(archivePath) as zf:
+			infos: dict[str, zipfile.ZipInfo] = {zi.filename: zi for zi in zf.infolist()}
+			root: str | None = FindC4DArchiveRoot(list(infos.keys()))
+			if root is None:
+				return None
+
+			def readMemberHead(name: str, byteBudget: int) -> bytes:
+				try:
+					with zf.open(name) as fp: # decompresses on the fly, only what's read
+						return fp.read(byteBudget)
+				except (zipfile.BadZipFile, KeyError, RuntimeError, NotImplementedError) as e: # e.g. encrypted or unsupported compression
+					raise OSError(str(e))
+			metadata: C4DMetadataProbeResult = ProbeC4DMetadata(root + 'resource/version.h', root + 'resource/build.txt', readMemberHead)
+	except (OSError, zipfile.BadZipFile) as e:
+		if stats:
+			stats.Increment('listingErrors')
+			stats.AddError(f'Archive can\'t be read: {archivePath}: {e}')
+		return None
+	if not metadata.IsValid():
+		if stats:
+			stats.Increment('metadataErrors')
+			stats.AddError(f'Broken metadata: {archivePath}: {metadata}')
+		logger.debug(f'Skipping {archivePath}: {metadata}')
+		return None
+
+	exeInfo: zipfile.ZipInfo = infos[root + C4D_NECESSARY_FILES[0]]
+	hasher = hashlib.sha1(f'{metadata.build}|{".".join(metadata.version)}|{exeInfo.file_size}|{exeInfo.date_time}|{exeInfo.CRC}'.encode('utf-8'))
+	c4dInfo: C4DInfo = C4DInfo(archivePath, metadata.version, metadata.build, fingerprint=f'{C4D_FINGERPRINT_VERSION}z:{hasher.hexdigest()}', archived=True)
+	if fileStat is not None:
+		c4dInfo.SetTimestamps(fileStat)
+	try:
+		c4dInfo.timestampBuilt = dt.datetime(*exeInfo.date_time).timestamp()
+	except (ValueError, OverflowError):
+		pass
+	return c4dInfo
+
+# Extracts the package folder of the archive into targetPath, members outside of it are extracted as they are.
+# onProgress(extracted, total) is called after each member, extraction stops if cancelToken gets cancelled.
+# Returns error message, empty on success
+def ExtractC4DArchive(archivePath: str, targetPath: str, onProgress: Callable[[int, int], None] | None = None, cancelToken: 'C4DScanCancelToken | None' = None) -> str:
+	try:
+		with zipfile.ZipFile(archivePath) as zf:
+			members: list[zipfile.ZipInfo] = zf.infolist()
+			root: str = FindC4DArchiveRoot([zi.filename for zi in members]) or ''
+			for idx, zi in enumerate(members):
+				if cancelToken is not None and cancelToken.IsCancelled():
+					return 'cancelled'
+				name: str = zi.filename[len(root):] if zi.filename.startswith(root) else zi.filename
+				destPath: str = os.path.normpath(os.path.join(targetPath, name))
+				if not name or not IsPathUnder(destPath, targetPath): # absolute or '..' member names
+					continue
+				if zi.is_dir():
+					os.makedirs(destPath, exist_ok=True)
+				else:
+					os.makedirs(os.path.dirname(destPath), exist_ok=True)
+					with zf.open(zi) as src, open(destPath, 'wb') as dst:
+						while chunk := src.read(1024 * 1024):
+							dst.write(chunk)
+				if onProgress is not None:
+					onProgress(idx + 1, len(members))
+	except (OSError, zipfile.BadZipFile, RuntimeError, NotImplementedError) as e:
+		return str(e)
+	return ''
+
+# Persistent index of scanned directories, lets rescan skip directories that haven't changed since the last scan.
+# Maps directory -> record:
+#  - c4d package: {'mtime': dir mtime, 'files': {resource file -> mtime}, 'exe': executable mtime, 'info': C4DInfo.ToJSON()}
+#  - other directory: {'mtime': dir mtime, 'subdirs': [names of subdirectories], 'entries': entries count, 'links': [names of linked subdirectories],
+#    'archives': [names of archives]}
+#  - archive: {'archive': True, 'mtime': file mtime, 'size': file size, 'info': C4DInfo.ToJSON() if it contains c4d}
+# Directory mtime only changes when its entries are added/removed/renamed, so resource files and executable of packages
+# are checked separately. Package info keeps its fingerprint and parsed folder name, so they aren't recomputed for unchanged packages
+class C4DScanIndex:
+	INDEX_FILENAME = 'scan_index.json'
+	INDEX_PACKAGE_FILES = ['version.h', 'build.txt'] # files in resource folder the package info is read from
+
+	def __init__(self) -> None:
+		self._lock: threading.Lock = threading.Lock()
+		self.records: dict[str, dict] = dict()
+		self.visited: set[str] = set() # directories recorded during the current scan
+
+	def Get(self, path: str) -> dict | None:
+		with self._lock:
+			return self.records.get(path)
+
+	def Set(self, path: str, record: dict):
+		with self._lock:
+			self.records[path] = record
+			self.visited.add(path)
+
+	def Touch(self, path: str):
+		with self._lock:
+			self.visited.add(path)
+
+	# Returns C4DInfo, subdirectories, entries count, linked subdirectories and archives of the directory if it hasn't changed
+	# since it was recorded, None otherwise. Costs a single stat for regular directories and four stats for c4d packages
+	def Lookup(self, path: str) -> tuple[C4DInfo | None, list[str], int, list[str], list[str]] | None:
+		record: dict | None = self.Get(path)
+		if record is None:
+			return None
+		try:
+			st: os.stat_result = os.stat(path)
+			if st.st_mtime_ns != record['mtime']:
+				return None
+			if 'info' in record:
+				for fileName, mtime in record['files'].items():
+					if os.stat(OsPathJoin(path, 'resource', fileName)).st_mtime_ns != mtime:
+						return None
+				exeStat: os.stat_result = os.stat(OsPathJoin(path, C4D_NECESSARY_FILES[0]))
+				if 'exe' in record and exeStat.st_mtime_ns != record['exe']:
+					return None
+				self.Touch(path)
+				c4dInfo: C4DInfo = C4DInfo.FromJSON(record['info'])
+				c4dInfo.SetTimestamps(st) # refreshed from stats that are taken anyway
+				c4dInfo.timestampBuilt = exeStat.st_mtime
+				return c4dInfo, list(), 0, list(), list()
+			if 'subdirs' in record:
+				self.Touch(path)
+				return None, [OsPathJoin(path, d) for d in record['subdirs']], record.get('entries', len(record['subdirs'])), \
+					[OsPathJoin(path, d) for d in record.get('links', list())], [OsPathJoin(path, a) for a in record.get('archives', list())]
+		except (OSError, KeyError, TypeError):
+			pass
+		return None
+
+	# dirMtime should be taken before directory was listed, so changes made during the listing are caught on the next scan
+	def Record(self, path: str, dirMtime: int, c4dInfo: C4DInfo | None, subdirs: list[str], entriesCount: int = 0, links: list[str] | None = None, archives: list[str] | None = None):
+		if c4dInfo:
+			try:
+				files: dict[str, int] = {f: os.stat(OsPathJoin(path, 'resource', f)).st_mtime_ns for f in C4DScanIndex.INDEX_PACKAGE_FILES}
+				exeMtime: int = os.stat(OsPathJoin(path, C4D_NECESSARY_FILES[0])).st_mtime_ns
+			except OSError:
+				return
+			return self.Set(path, {'mtime': dirMtime, 'files': files, 'exe': exeMtime, 'info': c4dInfo.ToJSON()})
+		record: dict = {'mtime': dirMtime, 'subdirs': [os.path.basename(d) for d in subdirs], 'entries': entriesCount}
+		if links:
+			record['links'] = [os.path.basename(d) for d in links]
+		if archives:
+			record['archives'] = [os.path.basename(a) for a in archives]
+		self.Set(path, record)
+
+	# Returns c4d packages in the archive (none or one) if it hasn't changed since it was recorded, None otherwise. Costs a single stat
+	def LookupArchive(self, path: str) -> list[C4DInfo] | None:
+		record: dict | None = self.Get(path)
+		if record is None or not record.get('archive'):
+			return None
+		try:
+			st: os.stat_result = os.stat(path)
+			if st.st_mtime_ns != record['mtime'] or st.st_size != record['size']:
+				return None
+			self.Touch(path)
+			if 'info' not in record:
+				return list()
+			c4dInfo: C4DInfo = C4DInfo.FromJSON(record['info'])
+			c4dInfo.SetTimestamps(st)
+			return [c4dInfo]
+		except (OSError, KeyError, TypeError):
+			return None
+
+	# fileStat should be taken before the archive was probed
+	def RecordArchive(self, path: str, fileStat: os.stat_result, c4dInfo: C4DInfo | None):
+		record: dict = {'archive': True, 'mtime': fileStat.st_mtime_ns, 'size': fileStat.st_size}
+		if c4dInfo:
+			record['info'] = c4dInfo.ToJSON()
+		self.Set(path, record)
+
+	# Last known c4d packages under root, e.g. for showing a search path that couldn't be scanned
+	def GetC4DEntriesUnder(self, root: str) -> dict[str, C4DInfo]:
+		with self._lock:
+			return {p: C4DInfo.FromJSON(r['info']) for p, r in self.records.items() if 'info' in r and IsPathUnder(p, root)}
+
+	def BeginScan(self):
+		with self._lock:
+			self.visited.clear()
+
+	# Forgets records under scanned roots that weren't visited during the scan (removed or out of search depth).
+	# Records under keptRoots are kept anyway, e.g. for nested roots that weren't scanned completely
+	def EndScan(self, roots: list[str], keptRoots: list[str] | None = None):
+		keptRoots = keptRoots if keptRoots else list()
+		with self._lock:
+			self.records = {p: r for p, r in self.records.items() if p in self.visited or not any(IsPathUnder(p, root) for root in roots) \
+				   or any(IsPathUnder(p, root) for root in keptRoots)}
+
+	def Load(self) -> bool:
+		loadFilePath: str = C4DScanIndex.GetIndexSavePath()
+		if not os.path.isfile(loadFilePath):
+			return False
+		try:
+			with open(loadFilePath, 'r') as fp:
+				data: dict = json.load(fp)
+			if 'index' in data and isinstance(data['index'], dict):
+				with self._lock:
+					self.records = data['index']
+			return True
+		except Exception as e:
+			logger.warning(f'Failed to load scan index from {loadFilePath}: {e}')
+		return False
+
+	def Save(self):
+		storeDict: dict = dict()
+		storeDict['version'] = C4DL_VERSION
+		with self._lock:
+			storeDict['index'] = dict(self.records)
+		with open(C4DScanIndex.GetIndexSavePath(), 'w') as fp:
+			json.dump(storeDict, fp)
+
+	@staticmethod
+	def GetIndexSavePath():
+		prefsFolderPath: str = GetPrefsFolderPath()
+		return OsPathJoin(prefsFolderPath, C4DScanIndex.INDEX_FILENAME)
+
+# State of a single search path while it's being scanned
+class C4DScanRootState:
+	def __init__(self, root: str, depth: int = 0, searchPath: str | None = None, rules: C4DScanRules | None = None, realPath: str | None = None) -> None:
+		self.root: str = root
+		self.realPath: str = realPath if realPath else GetPathKey(root) # key of the real location, symlinks and junctions resolved
+		self.searchPath: str = searchPath if searchPath else root # root is a subtree of it when only a part of search path is scanned
+		self.rules: C4DScanRules = rules if rules is not None else C4DScanRules()
+		self.pending: deque[tuple[str, int, str]] = deque([(root, depth, self.realPath)]) # <directory, depth, real path key> waiting to be scheduled
+		self.inFlight: int = 0
+		self.results: dict[str, C4DInfo] = dict()
+		self.pruned: list[str] = list() # directories that weren't descended into because of rules
+		self.deadline: float | None = None
+		self.abandonReason: str = '' # set once root is given up on, its tasks that are still running are ignored
+		self.stats: C4DScanStats = C4DScanStats()
+		self.startTime: float = time.perf_counter()
+		self.finishTime: float | None = None 			# set once root is done or abandoned
+		self.slowestDirs: list[tuple[float, str]] = list() # min-heap of <seconds, directory> of the slowest directories
+
+	# Should be called with the scanner lock acquired
+	def AddDirectoryTime(self, path: str, seconds: float):
+		if len(self.slowestDirs) < C4DScanRootReport.SLOWEST_DIRS_COUNT:
+			heapq.heappush(self.slowestDirs, (seconds, path))
+		elif seconds > self.slowestDirs[0][0]:
+			heapq.heapreplace(self.slowestDirs, (seconds, path))
+
+	# Should be called with the scanner lock acquired
+	def UpdateFinishTime(self):
+		if self.finishTime is None and self.IsDone():
+			self.finishTime = time.perf_counter()
+
+	def IsAbandoned(self) -> bool:
+		return bool(self.abandonReason)
+
+	def IsDone(self) -> bool:
+		return self.IsAbandoned() or (not self.pending and not self.inFlight)
+
+# What a single root of a scan has cost, for finding out which search path makes scans slow
+class C4DScanRootReport:
+	SLOWEST_DIRS_COUNT = 5
+
+	def __init__(self, root: str, wallTime: float, packagesFound: int, stats: C4DScanStats, prunedCount: int = 0,
+			  slowestDirs: list[tuple[float, str]] | None = None, abandonReason: str = '') -> None:
+		self.root: str = root
+		self.wallTime: float = wallTime
+		self.packagesFound: int = packagesFound
+		self.stats: C4DScanStats = stats
+		self.prunedCount: int = prunedCount
+		self.slowestDirs: list[tuple[float, str]] = slowestDirs if slowestDirs is not None else list() # <seconds, directory>, slowest first
+		self.abandonReason: str = abandonReason
+
+	@staticmethod
+	def FromRootState(state: C4DScanRootState) -> 'C4DScanRootReport':
+		finishTime: float = state.finishTime if state.finishTime is not None else time.perf_counter()
+		return C4DScanRootReport(state.root, finishTime - state.startTime, len(state.results), state.stats, len(state.pruned),
+								 sorted(state.slowestDirs, reverse=True), state.abandonReason)
+
+	def __str__(self) -> str:
+		ret: str = f'{self.root}: {self.wallTime:.2f}s{f" ({self.abandonReason})" if self.abandonReason else ""}, '\
+				 + f'{self.stats.dirsListed} directories listed, {self.stats.candidatesProbed} candidates probed, '\
+				 + f'{self.packagesFound} packages found, {self.stats.GetErrorsCount()} errors, {self.prunedCount} pruned'
+		for seconds, path in self.slowestDirs:
+			ret += f'\n    slow: {seconds:.3f}s {path}'
+		for error in self.stats.errors:
+			ret += f'\n    error: {error}'
+		return ret
+
+# Per root instrumentation of the whole scan
+class C4DScanReport:
+	def __init__(self, startTime: float, wallTime: float, roots: list[C4DScanRootReport]) -> None:
+		self.startTime: float = startTime # time.time() the scan was started at
+		self.wallTime: float = wallTime
+		self.roots: list[C4DScanRootReport] = roots
+
+	def __str__(self) -> str:
+		started: str = time.strftime('%Y-%m-%d %H:%M:%S', time.localtime(self.startTime))
+		return f'Scan started at {started} took {self.wallTime:.2f}s, {len(self.roots)} search path(s):\n' + '\n'.join(str(r) for r in self.roots)
+
+# Cancellation token shared between the scan and whoever wants to stop it
+class C4DScanCancelToken:
+	def __init__(self) -> None:
+		self._event: threading.Event = threading.Event()
+
+	def Cancel(self):
+		self._event.set()
+
+	def IsCancelled(self) -> bool:
+		return self._event.is_set()
+
+# Snapshot of a running scan, reported to C4DScanner.onProgress
+class C4DScanProgress:
+	def __init__(self, rootsDone: int = 0, rootsTotal: int = 0, dirsVisited: int = 0, packagesFound: int = 0) -> None:
+		self.rootsDone: int = rootsDone
+		self.rootsTotal: int = rootsTotal
+		self.dirsVisited: int = dirsVisited
+		self.packagesFound: int = packagesFound
+
+	def IsDone(self) -> bool:
+		return self.rootsDone == self.rootsTotal
+
+	def __str__(self) -> str:
+		return f'search paths {self.rootsDone}/{self.rootsTotal}, folders visited {self.dirsVisited}, packages found {self.packagesFound}'
+
+# Scans search paths for c4d packages on a bounded thread pool.
+# Every directory (probe for c4d + listing of subdirectories) is a separate task. Tasks are handed out to the pool
+# round-robin between roots and each root is limited to maxWorkersPerRoot tasks at once, so a slow network share
+# can't occupy the whole pool and hold up fast local disks.
+# Found packages and progress are reported from the thread that called Scan() while the scan is running, so they
+# can be streamed to the UI: onPackagesFound gets batches of C4DInfo, onProgress gets C4DScanProgress (throttled).
+# Each root has a deadline and the whole scan can be cancelled. Listing of an offline share can't be interrupted, so such
+# root is given up on: its running tasks are left to finish on their own and their results are ignored. Last known
+# packages of a given up root are taken from the index, the root is reported in degradedRoots.
+class C4DScanner:
+	PROGRESS_INTERVAL_SEC = 0.1
+	ABANDON_REASON_TIMEOUT = 'timeout'
+	ABANDON_REASON_CANCELLED = 'cancelled'
+
+	def __init__(self, maxDepth: int = SCANNER_MAX_DEPTH, maxWorkers: int = SCANNER_MAX_WORKERS, maxWorkersPerRoot: int = SCANNER_MAX_WORKERS_PER_ROOT,
+			  index: C4DScanIndex | None = None, prefsIndex: C4DPrefsFolderIndex | None = None, rules: dict[str, C4DScanRules] | None = None,
+			  rootTimeout: float = SCANNER_ROOT_TIMEOUT_SEC, cancelToken: C4DScanCancelToken | None = None, hashCorelibs: bool = False) -> None:
+		self.maxDepth: int = maxDepth
+		self.maxWorkers: int = max(1, maxWorkers)
+		self.maxWorkersPerRoot: int = max(1, maxWorkersPerRoot)
+		self.index: C4DScanIndex | None = index # if given, unchanged directories are taken from it and all scanned directories are recorded there
+		self.prefsIndex: C4DPrefsFolderIndex = prefsIndex if prefsIndex is not None else C4DPrefsFolderIndex() # shared by all probes of the scan
+		self.rules: dict[str, C4DScanRules] = rules if rules is not None else dict() # search path -> its rules, default rules for the rest
+		self.rootTimeout: float = rootTimeout
+		self.cancelToken: C4DScanCancelToken = cancelToken if cancelToken is not None else C4DScanCancelToken()
+		self.hashCorelibs: bool = hashCorelibs # package fingerprints include heads of the largest corelibs
+		self.stats: C4DScanStats = C4DScanStats()
+		self.pruned: dict[str, list[str]] = dict() # root -> directories pruned during the last scan
+		self.degradedRoots: dict[str, str] = dict() # root -> abandon reason, for roots given up on during the last scan
+		self.report: C4DScanReport | None = None # per root instrumentation of the last scan
+
+		self.onPackagesFound: Callable[[list[C4DInfo]], None] | None = None
+		self.onProgress: Callable[[C4DScanProgress], None] | None = None
+
+		self._condition: threading.Condition = threading.Condition()
+		self._inFlight: int = 0
+		self._dirsVisited: int = 0
+		self._packagesFound: list[C4DInfo] = list() # found since the last onPackagesFound call
+		self._rootsTrie: PathTrie = PathTrie() # roots of the scan -> their states, other search paths -> themselves
+		self._visited: set[str] = set() # real path keys of directories scheduled during the scan, guards against link loops
+
+	# Returns dict: path -> C4DInfo for all given roots, entries are ordered by roots first and by path within a root.
+	# Roots resolving to the same folder are scanned once. Nested roots aren't scanned twice: every directory belongs
+	# to the deepest root containing it, enclosing roots skip it
+	def Scan(self, roots: list[str]) -> dict[str, C4DInfo]:
+		return self._run(C4DScanner._getUniqueRootStates([self._createRootState(root) for root in dict.fromkeys(roots)]))
+
+	# Same as Scan(), but for parts of search paths: list of <directory, its depth relative to the search path>
+	def ScanSubtrees(self, subtrees: list[tuple[str, int]]) -> dict[str, C4DInfo]:
+		return self._run(C4DScanner._getUniqueRootStates([self._createRootState(path, depth) for path, depth in dict.fromkeys(subtrees)]))
+
+	def _createRootState(self, root: str, depth: int = 0) -> C4DScanRootState:
+		searchPath, rules = FindSearchPathRules(root, self.rules)
+		return C4DScanRootState(root, depth, searchPath, rules, CanonicalizePath(root))
+
+	# Drops roots that are the same folder as one of the previous roots (different spelling, symlink or junction)
+	@staticmethod
+	def _getUniqueRootStates(states: list[C4DScanRootState]) -> list[C4DScanRootState]:
+		unique: dict[str, C4DScanRootState] = dict() # real path -> state
+		for st in states:
+			if st.realPath in unique:
+				logger.debug(f'Skipping {st.root}: same folder as {unique[st.realPath].root}')
+				continue
+			unique[st.realPath] = st
+		return list(unique.values())
+
+	# Roots are found both by their own and their real paths, search paths that aren't scanned now only by their own
+	def _buildRootsTrie(self, states: list[C4DScanRootState]):
+		self._rootsTrie = PathTrie()
+		for st in states:
+			self._rootsTrie.Add(st.root, st)
+			self._rootsTrie.Add(st.realPath, st)
+		for searchPath in self.rules.keys():
+			self._rootsTrie.Add(searchPath)
+
+	# Can be called from any thread, Scan() returns shortly after with what was found so far
+	def Cancel(self):
+		self.cancelToken.Cancel()
+		with self._condition:
+			self._condition.notify_all()
+
+	def _run(self, states: list[C4DScanRootState]) -> dict[str, C4DInfo]:
+		startTime, startPerfTime = time.time(), time.perf_counter()
+		self._buildRootsTrie(states)
+		self._visited = set(st.realPath for st in states)
+		if self.index is not None:
+			self.index.BeginScan()
+		self.prefsIndex.Refresh()
+
+		if self.rootTimeout > 0:
+			deadline: float = time.monotonic() + self.rootTimeout
+			for st in states:
+				st.deadline = deadline
+
+		lastProgressTime: float = 0.0
+		executor: ThreadPoolExecutor = ThreadPoolExecutor(max_workers=self.maxWorkers, thread_name_prefix='C4DScanner')
+		try:
+			isDone: bool = False
+			while not isDone:
+				with self._condition:
+					self._abandonRoots(states)
+					self._scheduleTasks(executor, states)
+					isDone = all(st.IsDone() for st in states)
+					if not isDone and not self._packagesFound:
+						self._condition.wait(self._getWaitTimeout(states))
+					found, self._packagesFound = self._packagesFound, list()
+					progress: C4DScanProgress = C4DScanProgress(sum(st.IsDone() for st in states), len(states), self._dirsVisited, sum(len(st.results) for st in states))
+
+				# Callbacks are called without the lock, so that workers don't wait for the UI
+				if found and self.onPackagesFound is not None:
+					self.onPackagesFound(found)
+				if self.onProgress is not None and (isDone or time.monotonic() - lastProgressTime >= C4DScanner.PROGRESS_INTERVAL_SEC):
+					lastProgressTime = time.monotonic()
+					self.onProgress(progress)
+		finally:
+			# don't wait for tasks of abandoned roots, they may hang on an offline share for a long time
+			executor.shutdown(wait=False, cancel_futures=True)
+
+		if self.index is not None: # records of abandoned roots are kept as they were
+			self.index.EndScan([st.root for st in states if not st.IsAbandoned()], [st.root for st in states if st.IsAbandoned()])
+		self.pruned = {st.root: st.pruned for st in states if st.pruned}
+		self.degradedRoots = {st.root: st.abandonReason for st in states if st.IsAbandoned()}
+
+		with self._condition: # tasks of abandoned roots may still be running
+			rootReports: list[C4DScanRootReport] = [C4DScanRootReport.FromRootState(st) for st in states]
+		for st in states:
+			self.stats.Add(st.stats)
+			if st.IsAbandoned():
+				self._fillLastKnownResults(st)
+		self.report = C4DScanReport(startTime, time.perf_counter() - startPerfTime, rootReports)
+		logger.info(self.report)
+
+		ret: dict[str, C4DInfo] = dict()
+		for st in states:
+			for path in sorted(st.results.keys(), key=os.path.normcase):
+				ret[path] = st.results[path]
+		return ret
+
+	# Should be called with self._condition acquired
+	def _abandonRoots(self, states: list[C4DScanRootState]):
+		isCancelled: bool = self.cancelToken.IsCancelled()
+		now: float = time.monotonic()
+		for st in states:
+			if st.IsDone():
+				continue
+			if isCancelled:
+				st.abandonReason = C4DScanner.ABANDON_REASON_CANCELLED
+			elif st.deadline is not None and now >= st.deadline:
+				st.abandonReason = C4DScanner.ABANDON_REASON_TIMEOUT
+				logger.warning(f'Scan of {st.root} timed out after {self.rootTimeout}s, {st.inFlight} folder(s) still being listed')
+			else:
+				continue
+			st.pending.clear()
+			st.UpdateFinishTime()
+
+	# Should be called with self._condition acquired. Returns time till the nearest deadline of roots in progress, None if there's none
+	def _getWaitTimeout(self, states: list[C4DScanRootState]) -> float | None:
+		deadlines: list[float] = [st.deadline for st in states if st.deadline is not None and not st.IsDone()]
+		return max(0.0, min(deadlines) - time.monotonic()) if deadlines else None
+
+	# Completes partial results of an abandoned root with its last known packages from the index
+	def _fillLastKnownResults(self, state: C4DScanRootState):
+		if self.index is None:
+			return
+		for path, c4dInfo in self.index.GetC4DEntriesUnder(state.root).items():
+			if path in state.results or self._rootsTrie.FindDeepest(path) is not state: # nested roots fill their own results
+				continue
+			c4dInfo.directoryPrefs = FindC4DPrefsFolder(path, self.prefsIndex) or ''
+			state.results[path] = c4dInfo
+
+	# Should be called with self._condition acquired
+	def _scheduleTasks(self, executor: ThreadPoolExecutor, states: list[C4DScanRootState]):
+		scheduled: bool = True
+		while scheduled and self._inFlight < self.maxWorkers:
+			scheduled = False
+			for st in states: # one task per root per pass
+				if self._inFlight >= self.maxWorkers:
+					break
+				if not st.pending or st.inFlight >= self.maxWorkersPerRoot:
+					continue
+				path, depth, realPath = st.pending.popleft()
+				st.inFlight += 1
+				self._inFlight += 1
+				executor.submit(self._scanDirectory, st, path, depth, realPath)
+				scheduled = True
+
+	# Runs on the pool: lists directory once, probes it for being c4d package and if it's not -> collects subdirectories for the next level
+	def _scanDirectory(self, state: C4DScanRootState, path: str, depth: int, realPath: str):
+		startTime: float = time.perf_counter()
+		c4dInfo: C4DInfo | None = None
+		subdirs: list[str] = list()
+		links: list[str] = list()
+		archives: list[str] = list()
+		archiveInfos: list[C4DInfo] = list()
+		subdirsRealPaths: list[tuple[str, str]] = list()
+		entriesCount: int = 0
+		try:
+			if state.IsAbandoned() or self.cancelToken.IsCancelled():
+				pass
+			elif (indexed := self._lookupIndex(path)) is not None:
+				state.stats.Increment('indexHits')
+				c4dInfo, subdirs, entriesCount, links, archives = indexed
+				if c4dInfo: # preferences folder isn't bound to the package itself, hence is looked up every time
+					c4dInfo.directoryPrefs = FindC4DPrefsFolder(path, self.prefsIndex) or ''
+			else:
+				dirMtime: int | None = GetPathMtime(path) if self.index is not None else None
+				if (entries := ScanDirectory(path, state.stats)) is not None:
+					entriesCount = len(entries)
+					c4dInfo = GetC4DInfoFromFolder(path, entries, state.stats, self.prefsIndex, self.hashCorelibs)
+					if c4dInfo is None and (depth < self.maxDepth or dirMtime is not None): # index keeps subdirs even beyond max depth
+						subdirs = GetSubdirectories(path, entries, state.stats)
+						links = [d for d in subdirs if IsLinkEntry(entries[os.path.normcase(os.path.basename(d))])]
+						archives = [OsPathJoin(path, e.name) for e in entries.values() if IsC4DArchiveCandidate(e, state.stats)]
+					# package that failed probing (e.g. still being copied) isn't recorded, its metadata files can appear
+					# without changing mtime of the folder itself, so it has to be probed again on every scan
+					if dirMtime is not None and (c4dInfo is not None or not LooksLikeC4DPackage(entries)):
+						self.index.Record(path, dirMtime, c4dInfo, subdirs, entriesCount, links, archives)
+			# index keeps everything, rules are applied on top of it, so changing them doesn't invalidate the index
+			if archives and depth < self.maxDepth: # archives are packages one level below, same as subdirectories
+				archiveInfos = self._probeArchives(state, [a for a in archives if not state.rules.IsPruned(state.searchPath, a)])
+			if depth >= self.maxDepth:
+				subdirs = list()
+			elif subdirs:
+				subdirs = self._pruneSubdirectories(state, path, subdirs, entriesCount)
+				subdirs = self._skipNestedRoots(state, subdirs)
+				subdirsRealPaths = self._getRealPaths(state, realPath, subdirs, links)
+		except Exception as e:
+			state.stats.Increment('scanErrors')
+			state.stats.AddError(f'Failed scanning {path}: {e}')
+			logger.warning(f'Failed scanning {path}: {e}')
+		finally:
+			with self._condition:
+				if not state.IsAbandoned():
+					if c4dInfo:
+						state.results[path] = c4dInfo
+						self._packagesFound.append(c4dInfo)
+					for archiveInfo in archiveInfos:
+						state.results[archiveInfo.directory] = archiveInfo
+						self._packagesFound.append(archiveInfo)
+					self._dirsVisited += 1
+					for d, dRealPath in subdirsRealPaths:
+						if dRealPath in self._visited:
+							state.stats.Increment('linksSkipped')
+							continue
+						self._visited.add(dRealPath)
+						state.pending.append((d, depth + 1, dRealPath))
+					state.AddDirectoryTime(path, time.perf_counter() - startTime)
+				state.inFlight -= 1
+				self._inFlight -= 1
+				state.UpdateFinishTime()
+				self._condition.notify()
+
+	# Runs on the pool: returns c4d packages found in the archives, unchanged archives are taken from the index
+	def _probeArchives(self, state: C4DScanRootState, archives: list[str]) -> list[C4DInfo]:
+		ret: list[C4DInfo] = list()
+		for archivePath in archives:
+			if self.index is not None and (indexed := self.index.LookupArchive(archivePath)) is not None:
+				state.stats.Increment('indexHits')
+				ret += indexed
+				continue
+			try:
+				fileStat: os.stat_result = os.stat(archivePath)
+			except OSError:
+				continue
+			if c4dInfo := GetC4DInfoFromArchive(archivePath, state.stats, fileStat):
+				ret.append(c4dInfo)
+			if self.index is not None:
+				self.index.RecordArchive(archivePath, fileStat, c4dInfo)
+		return ret
+
+	# Runs on the pool: packages recorded by an older version or with other fingerprint settings are probed again
+	def _lookupIndex(self, path: str) -> tuple[C4DInfo | None, list[str], int, list[str], list[str]] | None:
+		if self.index is None or (indexed := self.index.Lookup(path)) is None:
+			return None
+		if indexed[0] is not None and not IsC4DFingerprintOfKind(indexed[0].fingerprint, self.hashCorelibs):
+			return None
+		return indexed
+
+	# Runs on the pool: applies rules of the root to subdirectories, pruned ones are counted in stats and remembered in the state
+	def _pruneSubdirectories(self, state: C4DScanRootState, path: str, subdirs: list[str], entriesCount: int) -> list[str]:
+		if state.rules.IsTooLarge(entriesCount):
+			state.stats.Increment('prunedByEntries')
+			with self._condition:
+				state.pruned.append(path)
+			return list()
+		kept: list[str] = [d for d in subdirs if not state.rules.IsPruned(state.searchPath, d)]
+		if len(kept) != len(subdirs):
+			state.stats.Increment('prunedByRules', len(subdirs) - len(kept))
+			keptSet: set[str] = set(kept)
+			with self._condition:
+				state.pruned += [d for d in subdirs if d not in keptSet]
+		return kept
+
+	# Runs on the pool: subdirectories that are roots (or search paths) of their own are left to them
+	def _skipNestedRoots(self, state: C4DScanRootState, subdirs: list[str]) -> list[str]:
+		kept: list[str] = [d for d in subdirs if self._rootsTrie.Get(d) in (None, state)]
+		if len(kept) != len(subdirs):
+			state.stats.Increment('nestedRootsSkipped', len(subdirs) - len(kept))
+		return kept
+
+	# Runs on the pool: returns <subdirectory, its real path key>. Plain subdirectories get it from the real path of their
+	# parent for free, links are resolved. Links into other roots (or search paths) are left to them
+	def _getRealPaths(self, state: C4DScanRootState, realPath: str, subdirs: list[str], links: list[str]) -> list[tuple[str, str]]:
+		ret: list[tuple[str, str]] = list()
+		linksSet: set[str] = set(links)
+		for d in subdirs:
+			if d not in linksSet:
+				ret.append((d, GetPathKey(os.path.join(realPath, os.path.basename(d)))))
+				continue
+			state.stats.Increment('linksResolved')
+			dRealPath: str = CanonicalizePath(d)
+			if self._rootsTrie.FindDeepest(dRealPath) not in (None, state):
+				state.stats.Increment('linksSkipped')
+				continue
+			ret.append((d, dRealPath))
+		return ret
+
+# Traverses directory until maxDepth, returns dict: path -> c4d_version.
+# Legacy helper: walks everything like it did before scan rules were introduced, so neither default exclude patterns
+# nor the entries count limit are applied here
+def FindCinemaPackagesInFolder(path, maxDepth = SCANNER_MAX_DEPTH) -> dict[str, C4DInfo]:
+	return C4DScanner(maxDepth, rules={path: C4DScanRules(exclude=[], maxEntries=0)}).Scan([path])
@@ -8,12 +8,7 @@ from PyQt5.QtCore import QUrl, QMimeData, QProcess
 from PyQt5.QtGui import QDesktopServices
 from PyQt5.QtWidgets import QApplication
 
-def NormalizePath(path: str) -> str:
-	return path.replace('/', '\\')
-
-def OsPathJoin(path, *paths) -> str:
-	res: str = os.path.join(path, *paths)
-	return NormalizePath(res)
+from core import *
 
 RES_FOLDER = OsPathJoin(os.getcwd(), 'res')
 IMAGES_FOLDER = OsPathJoin(RES_FOLDER, 'images')
@@ -26,14 +21,6 @@ APPLICATION_FONT_FAMILY = 'SblHebrew'
 def GenerateUUID() -> str:
 	return str(uuid.uuid4())
 
-def GetPrefsFolderPath() -> str:
-	path: str = OsPathJoin(GetAppDataPath(), 'c4d-version-manager')
-	os.makedirs(path, exist_ok=True)
-	return path
-
-def GetAppDataPath() -> str:
-	return os.getenv('APPDATA')
-
 def GetStartupPath() -> str | None:
 	# https://stackoverflow.com/questions/23500274/what-exactly-does-win32com-client-dispatchwscript-shell
 	# https://stackoverflow.com/questions/27127710/find-startup-folder-in-windows-8-using-python/27130194#27130194
@@ -94,11 +81,21 @@ class WinUtils:
 	GetWindowText = ctypes.windll.user32.GetWindowTextW
 	GetWindowTextLength = ctypes.windll.user32.GetWindowTextLengthW
 	IsWindowVisible = ctypes.windll.user32.IsWindowVisible
+	GetDriveType = ctypes.windll.kernel32.GetDriveTypeW
+	DRIVE_REMOTE = 4
 
 	@staticmethod
 	def IsPIDExisting(pid: int) -> bool:
 		return psutil.pid_exists(pid)
 
+	@staticmethod
+	def IsNetworkPath(path: str) -> bool:
+		path = NormalizePath(path)
+		if path.startswith('\\\\'): # UNC path
+			return True
+		drive: str = os.path.splitdrive(path)[0]
+		return bool(drive) and WinUtils.GetDriveType(drive + '\\') == WinUtils.DRIVE_REMOTE
+
 	@staticmethod
 	def KillProcessByPID(pid: int):
 		if WinUtils.IsPIDExisting(pid):
@@ -164,13 +161,6 @@ class KeyboardManager:
 	def UnregisterHotkey(hotkeyOrCb: str) -> bool:
 		keyboard.remove_hotkey(hotkeyOrCb)
 
-# Tries to cast given value to type, falls back to default if error
-def SafeCast(val, to_type, default=None):
-	try:
-		return to_type(val)
-	except (ValueError, TypeError):
-		return default
-
 # Extra information binded to the existing c4d package
 class C4DCacheInfo:
 	def __init__(self, tagUuids: list[str] = [], note: str = '') -> None:
@@ -179,6 +169,7 @@ class C4DCacheInfo:
 		
 		# Session related, is not stored
 		self.processStatus: int = 0 # 0 - not started yet; -1 started and closed; -2 - started and killed, > 0 - running
+		self.processArgs: list[str] = list() # arguments c4d was run with last time, used to restart it
 	
 	def ToJSON(self) -> dict:
 		return {
@@ -192,162 +183,20 @@ class C4DCacheInfo:
 		note: str = jsonStr['note'] if 'note' in jsonStr else ''
 		return C4DCacheInfo(tagUuids, note)
 
-# Information about cinema that can be extracted from filesystem
-class C4DInfo:
-	def __init__(self, dir: str, ver: list[str], build: str = '', dirPrefs: str | None = None) -> None:
-		self.directory: str = dir
-		self.version: list[str] = ver
-		self.build: str = build
-		self.directoryPrefs: str = dirPrefs if dirPrefs else ''
-
-	def GetPathExecutable(self) -> str:
-		return OsPathJoin(self.directory, 'Cinema 4D.exe')
-
-	def GetPathConfigCinema(self) -> str:
-		return OsPathJoin(self.GetPathFolderResource(), 'config.cinema4d.txt')
-	
-	def GetPathFolderRoot(self) -> str:
-		return self.directory
-	
-	def GetNameFolderRoot(self) -> str:
-		return os.path.basename(self.GetPathFolderRoot())
-
-	def GetPathFolderResource(self) -> str:
-		return OsPathJoin(self.directory, 'resource')
-	
-	def GetPathFolderPrefs(self) -> str:
-		return self.directoryPrefs
-
-	def GetPathFolderPlugins(self) -> str:
-		return OsPathJoin(self.directoryPrefs, 'plugins')
-	
-	def GetVersionString(self, formatted: bool = True, full: bool = False) -> str:
-		major: str = self.version[0]
-		if len(major) == 4: # new convention
-			return '.'.join(self.version if full else self.version[:-1])
-		return self.GetVersionMajor(formatted) + '.' + ''.join(self.version[1:])
-
-	def GetVersionMajor(self, formatted: bool = True) -> str:
-		major: str = self.version[0]
-		return ('R' if len(major) != 4 and formatted else '') + major
-	
-	def GetBuildString(self) -> str:
-		return self.build
-
 class C4DTileGroup:
-	def __init__(self, indices: list[int] = list(), name: str = '', key: Any = None) -> None:
+	def __init__(self, indices: list[int] = list(), name: str = '', key: Any = None, kind: str = '') -> None:
 		self.indices = indices
 		self.name = name
 		self.key: Any = key
+		self.kind: str = kind # grouping the group comes from, keys are only unique within the same grouping
 	
 	def __eq__(self, other) -> bool:
 		if isinstance(other, C4DTileGroup):
-			return self.key == other.key
+			return self.kind == other.kind and self.key == other.key
 		raise NotImplemented('C4DTileGroup: cannot compare')
 	
 	def __hash__(self) -> int:
-		return hash(self.key)
-
-# Tries to find corresponding preferences folder in the APPDATA directory
-def FindC4DPrefsFolder(folderPath: str) -> str | None:
-	appDataMaxonPath: str = OsPathJoin(GetAppDataPath(), 'Maxon')
-	if not os.path.isdir(appDataMaxonPath):
-		return None
-	
-	c4dDirName: str = os.path.basename(folderPath)
-	c4dDirNameLen: int = len(c4dDirName)
-	suffixPattern: str = '^_[A-Z0-9]{8}'
-
-	dirNames: list[str] = [f.name for f in os.scandir(appDataMaxonPath) if f.is_dir()]
-	for dir in dirNames:
-		if not dir.startswith(c4dDirName):
-			continue
-		suffix: str = dir[c4dDirNameLen:]
-		if not re.match(suffixPattern, suffix):
-			continue
-		return OsPathJoin(appDataMaxonPath, dir)
-	return None
-
-# Checks given folder path for containing Cinema 4D version
-C4D_NECESSARY_FILES = ['Cinema 4D.exe']
-C4D_NECESSARY_FOLDERS = ['corelibs', 'resource']
-def GetC4DInfoFromFolder(folderPath: str) -> C4DInfo | None:
-	### Validate this folder contains C4D
-	for file in C4D_NECESSARY_FILES:
-		curPath: str = OsPathJoin(folderPath, file)
-		if not os.path.isfile(curPath):
-			return None
-	for file in C4D_NECESSARY_FOLDERS:
-		curPath: str = OsPathJoin(folderPath, file)
-		if not os.path.isdir(curPath):
-			return None
-
-	### Get Cinema version
-	versionPath: str = OsPathJoin(folderPath, 'resource', 'version.h')
-	if not os.path.isfile(versionPath):
-		return None
-
-	C4V_VERSION_PART_PREFIX: str = '#define C4D_V'
-	c4dVersion: dict = {1: -1, 2: -1, 3: -1, 4: -1}
-	versionPartCnt: int = 0
-	with open(versionPath) as fp:
-		while versionPartCnt < 4:
-			line: str = fp.readline().strip()
-			if line is None:
-				break
-			for i in range(1, 5):
-				curDefinePart: str = C4V_VERSION_PART_PREFIX + str(i)
-				if line.startswith(curDefinePart):
-					c4dVersion[i] = SafeCast(line[len(curDefinePart):].strip(), int, -1)
-					versionPartCnt += 1
-					break
-	# validate cinema version
-	for v in c4dVersion.values():
-		if v == -1:
-			return None
-	
-	### Read build.txt
-	buildPath: str = OsPathJoin(folderPath, 'resource', 'build.txt')
-	if not os.path.isfile(buildPath):
-		return None
-	buildStr: str = ''
-	with open(buildPath) as fp:
-		buildStr: str = fp.readline().strip()
-	if not buildStr:
-		return None
-
-	versionStringsList: list[str] = [str(v) for v in c4dVersion.values()]
-	prefsFolder: str | None = FindC4DPrefsFolder(folderPath)
-	return C4DInfo(folderPath, versionStringsList, buildStr, prefsFolder)
-
-# Traverses directory until maxDepth, returns dict: path -> c4d_version
-def FindCinemaPackagesInFolder(path, maxDepth = 2) -> dict[str, C4DInfo]:
-	c4dRootInfo: C4DInfo | None = GetC4DInfoFromFolder(path)
-	if c4dRootInfo:
-		return {path: c4dRootInfo}
-
-	def getDirList(pathDir: str) -> list[str]:
-		try:
-			dirList: list[str] = [OsPathJoin(pathDir, d) for d in os.listdir(pathDir)]
-			return list(filter(lambda d: os.path.isdir(d), dirList))
-		except:
-			pass
-		return list()
-	
-	ret: dict[str, C4DInfo] = dict()
-	dirs: set[str] = set(getDirList(path))
-	currentDepth: int = 0
-	while len(dirs) and currentDepth < maxDepth:
-		newDirs: list[str] = []
-		for p in dirs:
-			c4dInfo: C4DInfo | None = GetC4DInfoFromFolder(p)
-			if c4dInfo:
-				ret[p] = c4dInfo
-				continue
-			newDirs += getDirList(p)
-		dirs = newDirs
-		currentDepth += 1
-	return ret
+		return hash((self.kind, self.key))
 
 qEventLookup = {"0": "QEvent::None",
 				"114": "QEvent::ActionAdded",
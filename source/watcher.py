@@ -0,0 +1,174 @@
+import os, threading
+
+from PyQt5.QtCore import QObject, QTimer, QFileSystemWatcher, pyqtSignal
+
+from utils import *
+from scanner import *
+
+# Watches search paths and the first levels of directories below them for changes.
+# Local directories are watched with QFileSystemWatcher, network ones are polled for mtime changes from a background
+# thread, since change notifications over SMB are unreliable. Changes are debounced and reported as the list of
+# changed subtrees <directory, depth relative to its search path>, nested ones are collapsed into their ancestors.
+class SearchPathsWatcher(QObject):
+	WATCH_DEPTH = 2 					# search path itself + two levels below
+	POLL_INTERVAL_SEC = 15 				# how often polled (network) directories are checked
+	DEBOUNCE_INTERVAL_MSEC = 1500 		# build drops come as bursts of changes, wait for them to settle
+
+	subtreesChanged = pyqtSignal(list) 	# list[tuple[str, int]]
+	_polledDirectoryChanged = pyqtSignal(str)
+
+	def __init__(self, index: C4DScanIndex | None = None, parent: QObject | None = None) -> None:
+		super().__init__(parent)
+
+		self.index: C4DScanIndex | None = index
+		self.watchDepth: int = SearchPathsWatcher.WATCH_DEPTH
+		self.rules: dict[str, C4DScanRules] = dict() # same rules as scanner uses, pruned directories aren't watched
+		self.searchPathsTrie: PathTrie = PathTrie() # nested search paths are watched as their own, not as a part of enclosing ones
+
+		self.watchedDepths: dict[str, int] = dict() 	# watched directory -> depth relative to its search path
+		self.changedDirs: set[str] = set()
+
+		self.fsWatcher: QFileSystemWatcher = QFileSystemWatcher(self)
+		self.fsWatcher.directoryChanged.connect(self._onDirectoryChanged)
+
+		self.debounceTimer: QTimer = QTimer(self)
+		self.debounceTimer.setInterval(SearchPathsWatcher.DEBOUNCE_INTERVAL_MSEC)
+		self.debounceTimer.setSingleShot(True)
+		self.debounceTimer.timeout.connect(self._emitChangedSubtrees)
+
+		self._polledLock: threading.Lock = threading.Lock()
+		self._polledMtimes: dict[str, int | None] = dict() 	# polled directory -> last seen mtime
+		self._pollStopEvent: threading.Event = threading.Event()
+		self._pollThread: threading.Thread | None = None
+		self._polledDirectoryChanged.connect(self._onDirectoryChanged)
+
+	# Replaces everything being watched with given search paths
+	def SetSearchPaths(self, searchPaths: list[str], watchDepth: int = WATCH_DEPTH, rules: dict[str, C4DScanRules] | None = None):
+		self.Stop()
+		self.watchDepth = watchDepth
+		self.rules = rules if rules is not None else dict()
+		self.searchPathsTrie = PathTrie(searchPaths)
+		for searchPath in dict.fromkeys(searchPaths):
+			self._watchSubtree(searchPath, 0)
+		self._startPolling()
+
+	def Stop(self):
+		self._pollStopEvent.set()
+		if self._pollThread is not None:
+			self._pollThread.join(0.1) # it's a daemon, no need to wait for a slow share to answer
+			self._pollThread = None
+		if watched := self.fsWatcher.directories():
+			self.fsWatcher.removePaths(watched)
+		with self._polledLock:
+			self._polledMtimes.clear()
+		self.watchedDepths.clear()
+		self.changedDirs.clear()
+		self.debounceTimer.stop()
+
+	def GetWatchedDirectoriesCount(self) -> int:
+		return len(self.watchedDepths)
+
+	# Re-registers watches below given subtrees, should be called once they were rescanned
+	def WatchSubtrees(self, subtrees: list[tuple[str, int]]):
+		for path, depth in subtrees:
+			self._unwatchSubtree(path)
+			self._watchSubtree(path, depth)
+		self._startPolling()
+
+	# Returns <is c4d package, subdirectories, mtime>. Scan index already knows all of it for scanned directories,
+	# so the filesystem is only touched for directories the scanner hasn't seen
+	def _inspectDirectory(self, path: str) -> tuple[bool, list[str], int | None] | None:
+		if self.index is not None and (record := self.index.Get(path)) is not None:
+			if 'info' in record:
+				return True, list(), record['mtime']
+			if 'subdirs' in record:
+				return False, [OsPathJoin(path, d) for d in record['subdirs']], record['mtime']
+		mtime: int | None = GetPathMtime(path)
+		entries: dict[str, os.DirEntry] | None = ScanDirectory(path)
+		if entries is None:
+			return None
+		if os.path.normcase(C4D_NECESSARY_FILES[0]) in entries:
+			return True, list(), mtime
+		return False, GetSubdirectories(path, entries), mtime
+
+	# Registers directory and its subdirectories up to watchDepth. C4D packages are leaves, nothing interesting happens inside of them
+	def _watchSubtree(self, path: str, depth: int):
+		isNetwork: bool = WinUtils.IsNetworkPath(path)
+		searchPath, rules = FindSearchPathRules(path, self.rules)
+		if searchPath is None: searchPath = path
+		pending: list[tuple[str, int]] = [(path, depth)]
+		while pending:
+			curPath, curDepth = pending.pop()
+			inspected: tuple[bool, list[str], int | None] | None = self._inspectDirectory(curPath)
+			if inspected is None:
+				continue
+			isPackage, subdirs, mtime = inspected
+			if isPackage:
+				continue
+			self.watchedDepths[curPath] = curDepth
+			if isNetwork:
+				with self._polledLock:
+					self._polledMtimes[curPath] = mtime
+			else:
+				self.fsWatcher.addPath(curPath)
+			if curDepth < self.watchDepth:
+				pending += [(d, curDepth + 1) for d in subdirs if not rules.IsPruned(searchPath, d) and d not in self.searchPathsTrie]
+
+	def _unwatchSubtree(self, path: str):
+		removed: list[str] = [p for p in self.watchedDepths.keys() if IsPathUnder(p, path)]
+		for p in removed:
+			del self.watchedDepths[p]
+		with self._polledLock:
+			for p in removed:
+				self._polledMtimes.pop(p, None)
+		fsWatched: set[str] = set(NormalizePath(p) for p in self.fsWatcher.directories())
+		if watched := [p for p in removed if p in fsWatched]:
+			self.fsWatcher.removePaths(watched)
+
+	def _onDirectoryChanged(self, path: str):
+		path = NormalizePath(path)
+		if path not in self.watchedDepths:
+			return
+		self.changedDirs.add(path)
+		self.debounceTimer.start()
+
+	def _emitChangedSubtrees(self):
+		changed: list[str] = sorted(self.changedDirs, key=lambda p: self.watchedDepths.get(p, 0))
+		self.changedDirs.clear()
+
+		subtrees: list[tuple[str, int]] = list()
+		for path in changed: # ancestors go first, nested subtrees of the same search path are covered by them
+			if path not in self.watchedDepths:
+				continue
+			searchPath: str | None = self.searchPathsTrie.FindDeepest(path)
+			if any(IsPathUnder(path, p) and self.searchPathsTrie.FindDeepest(p) == searchPath for p, _ in subtrees):
+				continue
+			subtrees.append((path, self.watchedDepths[path]))
+
+		# Watches below changed subtrees are rebuilt by WatchSubtrees() once they're rescanned
+		if subtrees:
+			self.subtreesChanged.emit(subtrees)
+
+	def _startPolling(self):
+		if self._pollThread is not None and self._pollThread.is_alive():
+			return
+		with self._polledLock:
+			if not self._polledMtimes:
+				return
+		self._pollStopEvent = threading.Event()
+		self._pollThread = threading.Thread(target=self._pollLoop, args=(self._pollStopEvent,), name='SearchPathsPoller', daemon=True)
+		self._pollThread.start()
+
+	def _pollLoop(self, stopEvent: threading.Event):
+		while not stopEvent.wait(SearchPathsWatcher.POLL_INTERVAL_SEC):
+			with self._polledLock:
+				polled: list[str] = list(self._polledMtimes.keys())
+			for path in polled:
+				if stopEvent.is_set():
+					return
+				mtime: int | None = GetPathMtime(path)
+				with self._polledLock:
+					if path not in self._polledMtimes or self._polledMtimes[path] == mtime:
+						continue
+					self._polledMtimes[path] = mtime
+				self._polledDirectoryChanged.emit(path) # queued to the thread watcher lives in
@@ -0,0 +1,221 @@
+# Scanner benchmark on a synthetic search tree, runs anywhere the scanner does (Windows, Linux, CI).
+# Generates a tree of fake c4d packages (Cinema 4D.exe, corelibs, resource/version.h, resource/build.txt), noise
+# folders and broken packages in a temp folder, times FindCinemaPackagesInFolder, indexed scans and GetC4DInfoFromFolder
+# cold (first run, OS caches dropped if possible) and warm (repeated runs) and stores results as JSON.
+#
+# Usage: python scan_benchmark.py [--packages N] [--depth N] [--noise N] [--broken N] [--repeat N] [--output FILE] [--compare FILE]
+import os, sys, io, json, time, random, shutil, platform, argparse, tempfile, statistics, contextlib, datetime as dt
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', 'source'))
+from core import *
+from scanner import *
+
+BENCHMARK_VERSION = 1
+BROKEN_PACKAGE_KINDS = ['no-build-txt', 'incomplete-version-h', 'no-corelibs', 'empty-build-txt']
+
+class SyntheticTree:
+	def __init__(self, root: str) -> None:
+		self.root: str = root
+		self.packages: list[str] = list() 	# valid packages
+		self.broken: list[str] = list() 	# c4d-like folders that mustn't be found
+		self.dirsCount: int = 0
+
+	# Packages and noise are spread over random folders up to depth levels below the root
+	@staticmethod
+	def Generate(root: str, packages: int, depth: int, noise: int, broken: int, seed: int = 0) -> 'SyntheticTree':
+		rnd: random.Random = random.Random(seed)
+		tree: SyntheticTree = SyntheticTree(root)
+		containers: list[list[str]] = [[root]] + [list() for _ in range(depth)] # folders per level that can get children
+
+		def makeContainer(level: int) -> str: # returns existing or new folder on given level (0 - root)
+			if containers[level] and (level == 0 or rnd.random() < 0.7):
+				return rnd.choice(containers[level])
+			parent: str = makeContainer(level - 1)
+			path: str = os.path.join(parent, f'folder_{len(containers[level]):04d}')
+			os.makedirs(path, exist_ok=True)
+			containers[level].append(path)
+			return path
+
+		for i in range(packages):
+			path: str = os.path.join(makeContainer(rnd.randint(0, depth - 1)), f'Cinema 4D R{20 + i % 6} CL{100000 + i}')
+			SyntheticTree._writePackage(path, [str(2020 + i % 6), str(i % 3), str(i % 10), '0'], f'CL{100000 + i}.{i % 7}')
+			tree.packages.append(path)
+
+		for i in range(broken):
+			kind: str = BROKEN_PACKAGE_KINDS[i % len(BROKEN_PACKAGE_KINDS)]
+			path: str = os.path.join(makeContainer(rnd.randint(0, depth - 1)), f'broken_{kind}_{i:04d}')
+			SyntheticTree._writePackage(path, ['2024', '0', '0', '0'], f'CL{i}', kind)
+			tree.broken.append(path)
+
+		for i in range(noise):
+			path: str = os.path.join(makeContainer(rnd.randint(0, depth - 1)), f'noise_{i:05d}')
+			os.makedirs(path, exist_ok=True)
+			for j in range(rnd.randint(0, 5)):
+				with open(os.path.join(path, f'file_{j}.txt'), 'w') as fp:
+					fp.write('noise')
+
+		for dirPath, dirNames, fileNames in os.walk(root):
+			tree.dirsCount += len(dirNames)
+		return tree
+
+	@staticmethod
+	def _writePackage(path: str, version: list[str], build: str, brokenKind: str = ''):
+		os.makedirs(os.path.join(path, 'resource'), exist_ok=True)
+		if brokenKind != 'no-corelibs':
+			os.makedirs(os.path.join(path, 'corelibs'), exist_ok=True)
+		with open(os.path.join(path, C4D_NECESSARY_FILES[0]), 'wb') as fp:
+			fp.write(b'MZ' + b'\0' * 1024)
+		with open(os.path.join(path, 'resource', 'version.h'), 'w') as fp:
+			fp.write('// Cinema 4D version\n#pragma once\n\n')
+			defines: list[str] = version[:2] if brokenKind == 'incomplete-version-h' else version
+			for i, v in enumerate(defines, 1):
+				fp.write(f'#define C4D_V{i} {v}\n')
+		if brokenKind != 'no-build-txt':
+			with open(os.path.join(path, 'resource', 'build.txt'), 'w') as fp:
+				fp.write('' if brokenKind == 'empty-build-txt' else f'{build}\n')
+
+# Tries to drop OS file caches so that the first run is really cold, returns whether it worked (needs root on Linux)
+def DropFileCaches() -> bool:
+	try:
+		os.sync()
+		with open('/proc/sys/vm/drop_caches', 'w') as fp:
+			fp.write('3\n')
+		return True
+	except (OSError, AttributeError):
+		return False
+
+class BenchmarkResult:
+	def __init__(self, name: str) -> None:
+		self.name: str = name
+		self.cold: float | None = None
+		self.warm: list[float] = list()
+		self.found: int = 0
+
+	def ToJSON(self) -> dict:
+		return {
+			'cold': self.cold,
+			'warm': self.warm,
+			'warmMin': min(self.warm) if self.warm else None,
+			'warmMedian': statistics.median(self.warm) if self.warm else None,
+			'found': self.found,
+		}
+
+# Runs func once cold and repeat times warm, func returns number of found packages
+def RunBenchmark(name: str, func, repeat: int, dropCaches: bool) -> BenchmarkResult:
+	result: BenchmarkResult = BenchmarkResult(name)
+	for i in range(repeat + 1):
+		if i == 0 and dropCaches:
+			DropFileCaches()
+		with contextlib.redirect_stdout(io.StringIO()): # scanner reports broken packages, keep output readable
+			start: float = time.perf_counter()
+			result.found = func()
+			elapsed: float = time.perf_counter() - start
+		if i == 0:
+			result.cold = elapsed
+		else:
+			result.warm.append(elapsed)
+	print(f'{name:32} cold {result.cold * 1000:9.2f} ms, warm min {min(result.warm) * 1000:9.2f} ms, found {result.found}' if result.warm else \
+		  f'{name:32} cold {result.cold * 1000:9.2f} ms, found {result.found}', file=sys.stderr)
+	return result
+
+def RunBenchmarks(tree: SyntheticTree, depth: int, repeat: int, dropCaches: bool) -> dict[str, BenchmarkResult]:
+	results: dict[str, BenchmarkResult] = dict()
+
+	def findPackages() -> int:
+		return len(FindCinemaPackagesInFolder(tree.root, depth))
+	results['FindCinemaPackagesInFolder'] = RunBenchmark('FindCinemaPackagesInFolder', findPackages, repeat, dropCaches)
+
+	index: C4DScanIndex = C4DScanIndex() # filled by the cold run, so warm runs measure incremental rescans
+	def scanIndexed() -> int:
+		return len(C4DScanner(depth, index=index).Scan([tree.root]))
+	results['C4DScanner (indexed)'] = RunBenchmark('C4DScanner (indexed)', scanIndexed, repeat, dropCaches)
+
+	candidates: list[str] = tree.packages + tree.broken
+	prefsIndex: C4DPrefsFolderIndex = C4DPrefsFolderIndex()
+	def probePackages() -> int:
+		return sum(GetC4DInfoFromFolder(path, prefsIndex=prefsIndex) is not None for path in candidates)
+	results['GetC4DInfoFromFolder'] = RunBenchmark('GetC4DInfoFromFolder', probePackages, repeat, dropCaches)
+
+	return results
+
+# Prints relative change of warm medians against previous results, returns False if any benchmark got slower than threshold
+def CompareResults(current: dict, previous: dict, threshold: float) -> bool:
+	ok: bool = True
+	configKeys: list[str] = ['packages', 'depth', 'noise', 'broken', 'seed']
+	if [current['config'].get(k) for k in configKeys] != [previous.get('config', dict()).get(k) for k in configKeys]:
+		print('Previous results were measured on a different tree configuration, comparison is not meaningful', file=sys.stderr)
+	for name, res in current['results'].items():
+		prev: dict | None = previous.get('results', dict()).get(name)
+		if not prev or not prev.get('warmMedian') or not res.get('warmMedian'):
+			continue
+		ratio: float = res['warmMedian'] / prev['warmMedian']
+		isRegression: bool = ratio > 1.0 + threshold
+		ok = ok and not isRegression
+		print(f'{name:32} warm median x{ratio:.2f} vs previous{"  <-- REGRESSION" if isRegression else ""}', file=sys.stderr)
+	return ok
+
+def _parseArgs(argv: list[str]) -> argparse.Namespace:
+	parser: argparse.ArgumentParser = argparse.ArgumentParser(description='Benchmarks c4d package scanner on a synthetic search tree.')
+	parser.add_argument('--packages', type=int, default=200, help='valid c4d packages in the tree (default: %(default)s)')
+	parser.add_argument('--depth', type=int, default=SCANNER_MAX_DEPTH, help='depth of the tree, also used as scan depth (default: %(default)s)')
+	parser.add_argument('--noise', type=int, default=2000, help='non-c4d folders in the tree (default: %(default)s)')
+	parser.add_argument('--broken', type=int, default=20, help='c4d-like folders with missing or broken files (default: %(default)s)')
+	parser.add_argument('--repeat', type=int, default=5, help='warm runs per benchmark (default: %(default)s)')
+	parser.add_argument('--seed', type=int, default=0, help='seed of the tree layout (default: %(default)s)')
+	parser.add_argument('--root', default=None, help='folder to generate the tree in, temp folder if not given (it is removed afterwards)')
+	parser.add_argument('--output', default=None, help='JSON file to write results to, stdout if not given')
+	parser.add_argument('--compare', default=None, help='JSON results of a previous run to compare warm medians with')
+	parser.add_argument('--threshold', type=float, default=0.2, help='relative slowdown reported as regression by --compare (default: %(default)s)')
+	parser.add_argument('--no-drop-caches', action='store_true', help='don\'t try to drop OS file caches before cold runs')
+	return parser.parse_args(argv)
+
+def main(argv: list[str]) -> int:
+	args: argparse.Namespace = _parseArgs(argv)
+	depth: int = max(1, args.depth)
+
+	root: str = args.root if args.root else tempfile.mkdtemp(prefix='c4dvm_bench_')
+	try:
+		start: float = time.perf_counter()
+		tree: SyntheticTree = SyntheticTree.Generate(os.path.join(root, 'search_path'), args.packages, depth, args.noise, args.broken, args.seed)
+		print(f'Generated {len(tree.packages)} packages, {len(tree.broken)} broken ones and {tree.dirsCount} folders in {time.perf_counter() - start:.2f}s: {tree.root}', file=sys.stderr)
+
+		cachesDropped: bool = not args.no_drop_caches and DropFileCaches()
+		if not args.no_drop_caches and not cachesDropped:
+			print('Could not drop OS file caches (needs root on Linux), cold runs are only cold for the process', file=sys.stderr)
+
+		results: dict[str, BenchmarkResult] = RunBenchmarks(tree, depth, max(1, args.repeat), cachesDropped)
+	finally:
+		if not args.root:
+			shutil.rmtree(root, ignore_errors=True)
+
+	output: dict = {
+		'version': BENCHMARK_VERSION,
+		'timestamp': dt.datetime.now().isoformat(timespec='seconds'),
+		'platform': platform.platform(),
+		'python': platform.python_version(),
+		'config': {
+			'packages': args.packages, 'depth': depth, 'noise': args.noise, 'broken': args.broken,
+			'repeat': args.repeat, 'seed': args.seed, 'dirs': tree.dirsCount, 'cachesDropped': cachesDropped,
+		},
+		'results': {name: res.ToJSON() for name, res in results.items()},
+	}
+
+	exitCode: int = 0
+	if any(res.found != len(tree.packages) for res in results.values()):
+		print(f'Unexpected number of found packages, expected {len(tree.packages)}', file=sys.stderr)
+		exitCode = 1
+
+	if args.compare:
+		with open(args.compare, 'r') as fp:
+			if not CompareResults(output, json.load(fp), args.threshold):
+				exitCode = exitCode or 2
+
+	if args.output:
+		with open(args.output, 'w') as fp:
+			json.dump(output, fp, indent='\t')
+	else:
+		print(json.dumps(output, indent='\t'))
+	return exitCode
+
+if __name__ == '__main__':
+	sys.exit(main(sys.argv[1:]))